@@ -0,0 +1,61 @@
+"""Compress file extracted_text with lz4
+
+Revision ID: 0a6d3e8b7c41
+Revises: f7c2d9a4e5b1
+Create Date: 2026-10-17 17:55:39.204716
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6d3e8b7c41'
+down_revision = 'f7c2d9a4e5b1'
+branch_labels = None
+depends_on = None
+
+# 기존 행을 다시 쓸 때 한 번에 처리할 행 수 (배치마다 커밋 -> 긴 잠금 / 거대한 트랜잭션 방지)
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade():
+    # Postgres 컬럼 압축(TOAST)을 lz4로 -> DB 안에서 압축/해제되므로
+    # 모델/검색(pg_trgm)/미리보기(substr) 쿼리는 그대로 동작
+    # (행이 약 2KB를 넘을 때만 압축되는 건 그대로, toast_tuple_target으로는 이 기준이 안 바뀜)
+    op.execute('ALTER TABLE file ALTER COLUMN extracted_text SET COMPRESSION lz4')
+
+    # 기존에 pglz로 압축된 행은 값을 새로 만들어야 lz4로 다시 압축됨
+    # (같은 값으로 UPDATE하면 기존 압축 데이터를 그대로 씀)
+    # id 순서로 배치마다 커밋해서 운영 중에도 잠금/WAL이 한 번에 몰리지 않도록
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        last_id = uuid.UUID(int=0)
+        while True:
+            ids = connection.execute(
+                sa.text(
+                    """
+                    UPDATE file SET extracted_text = extracted_text || ''
+                    WHERE id IN (
+                        SELECT id FROM file
+                        WHERE id > :last_id
+                          AND pg_column_compression(extracted_text) = 'pglz'
+                        ORDER BY id
+                        LIMIT :batch_size
+                    )
+                    RETURNING id
+                    """
+                ),
+                {'last_id': last_id, 'batch_size': BACKFILL_BATCH_SIZE},
+            ).scalars().all()
+            if not ids:
+                break
+            last_id = max(ids)
+
+
+def downgrade():
+    # 이미 lz4로 저장된 값은 그대로 읽을 수 있으므로 다시 쓰지 않음 (새 값부터 pglz)
+    op.execute('ALTER TABLE file ALTER COLUMN extracted_text SET COMPRESSION pglz')
@@ -0,0 +1,29 @@
+"""Add file processing status
+
+Revision ID: 8d4f2a6b1e93
+Revises: 5b9e1c7d3a2f
+Create Date: 2026-10-17 11:03:27.540911
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4f2a6b1e93'
+down_revision = '5b9e1c7d3a2f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 기존 파일은 모두 처리 완료 상태로 채움
+    op.add_column('file', sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False, server_default='done'))
+    op.add_column('file', sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    op.alter_column('file', 'status', server_default=None)
+
+
+def downgrade():
+    op.drop_column('file', 'error')
+    op.drop_column('file', 'status')
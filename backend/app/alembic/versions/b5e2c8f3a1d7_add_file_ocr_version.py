@@ -0,0 +1,25 @@
+"""Add file ocr version
+
+Revision ID: b5e2c8f3a1d7
+Revises: 0a6d3e8b7c41
+Create Date: 2026-10-17 21:14:52.640318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e2c8f3a1d7'
+down_revision = '0a6d3e8b7c41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('file', sa.Column('ocr_version', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=True))
+
+
+def downgrade():
+    op.drop_column('file', 'ocr_version')
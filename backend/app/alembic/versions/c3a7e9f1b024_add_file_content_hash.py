@@ -0,0 +1,27 @@
+"""Add file content hash
+
+Revision ID: c3a7e9f1b024
+Revises: 8d4f2a6b1e93
+Create Date: 2026-10-17 13:42:08.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3a7e9f1b024'
+down_revision = '8d4f2a6b1e93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('file', sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=True))
+    op.create_index(op.f('ix_file_content_hash'), 'file', ['content_hash'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_file_content_hash'), table_name='file')
+    op.drop_column('file', 'content_hash')
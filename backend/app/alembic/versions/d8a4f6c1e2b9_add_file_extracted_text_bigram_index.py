@@ -0,0 +1,50 @@
+"""Add file extracted_text bigram index
+
+Revision ID: d8a4f6c1e2b9
+Revises: b5e2c8f3a1d7
+Create Date: 2026-10-17 21:42:05.318462
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8a4f6c1e2b9'
+down_revision = 'b5e2c8f3a1d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # pg_trgm(3글자) 인덱스는 "홍대" 같은 2글자 검색어에 쓸 수 없으므로
+    # 공백 없는 2글자 조각(bigram) 배열의 GIN 식 인덱스를 따로 둠 (컬럼 추가 없음)
+    # 글자 배열로 한 번만 나눠서 이웃 글자를 붙임
+    # (UTF-8에서 substr(t, i, 2)는 매번 앞에서부터 글자를 세므로 긴 대화에서 O(n^2))
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION file_text_bigrams(t text) RETURNS text[]
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_agg(DISTINCT bigram), '{}')
+            FROM (
+                SELECT c || lead(c) OVER (ORDER BY i) AS bigram
+                FROM unnest(string_to_array(lower(t), NULL)) WITH ORDINALITY AS chars(c, i)
+            ) AS bigrams
+            WHERE bigram !~ '\\s'
+        $$
+        """
+    )
+    with op.get_context().autocommit_block():
+        # 이전에 CONCURRENTLY 생성이 중간에 실패했으면 INVALID 인덱스가 남으므로 지우고 다시 만듦
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_file_extracted_text_bigram')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY ix_file_extracted_text_bigram '
+            'ON file USING gin (file_text_bigrams(extracted_text))'
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_file_extracted_text_bigram')
+    op.execute('DROP FUNCTION IF EXISTS file_text_bigrams(text)')
@@ -0,0 +1,28 @@
+"""Add file owner_id, created_at index
+
+Revision ID: e1f4b8c2d6a9
+Revises: c3a7e9f1b024
+Create Date: 2026-10-17 15:26:51.304417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1f4b8c2d6a9'
+down_revision = 'c3a7e9f1b024'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY는 트랜잭션 안에서 못 돌리므로 autocommit으로 (운영 중 테이블 잠금 방지)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_file_owner_id_created_at', 'file', ['owner_id', sa.text('created_at DESC')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_file_owner_id_created_at', table_name='file', postgresql_concurrently=True)
@@ -0,0 +1,29 @@
+"""Add file extracted_text trigram index
+
+Revision ID: f7c2d9a4e5b1
+Revises: e1f4b8c2d6a9
+Create Date: 2026-10-17 16:48:13.672930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7c2d9a4e5b1'
+down_revision = 'e1f4b8c2d6a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY는 트랜잭션 안에서 못 돌리므로 autocommit으로 (운영 중 테이블 잠금 방지)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_file_extracted_text_trgm', 'file', ['extracted_text'], unique=False, postgresql_using='gin', postgresql_ops={'extracted_text': 'gin_trgm_ops'}, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_file_extracted_text_trgm', table_name='file', postgresql_using='gin', postgresql_concurrently=True)
@@ -6,11 +6,13 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import Session
 
 from app.core import security
 from app.core.config import settings
 from app.core.db import engine
+from app.core.user_cache import cache_user, get_cached_user
 from app.models import TokenPayload, User
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -38,9 +40,23 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = session.get(User, token_data.sub)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    if token_data.sub is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
+    cached, version = get_cached_user(token_data.sub)
+    if cached:
+        # DB 조회 없이 세션에 붙임 (hashed_password 등 없는 필드는 접근할 때 로딩)
+        user = User(**cached.model_dump())
+        make_transient_to_detached(user)
+        session.add(user)
+    else:
+        db_user = session.get(User, token_data.sub)
+        if not db_user:
+            raise HTTPException(status_code=404, detail="User not found")
+        cache_user(db_user, version)
+        user = db_user
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return user
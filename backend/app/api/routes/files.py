@@ -1,25 +1,77 @@
+import base64
+import os
 import uuid
-import modal
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from sqlmodel import select
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from sqlalchemy import select as sa_select
+from sqlmodel import and_, col, func, or_, select
 
 from app import crud
 from app.api.deps import CurrentUser, SessionDep
-from app.models import File as FileModel, FileCreate, FilePublic, FilesPublic, Message
-from app.core.storage import upload_file_to_r2
+from app.core.config import settings
+from app.core.jobs import (
+    batch_content_hash,
+    enqueue_file_job,
+    get_ocr_text,
+    get_processed_media,
+    process_image_batch,
+    process_media,
+    process_uploaded_object,
+    spool_upload,
+)
+from app.core.ocr import IMAGE_EXTENSIONS, MEDIA_EXTENSIONS, OCR_VERSION
+from app.core.storage import (
+    claim_pending_upload,
+    create_presigned_upload,
+    delete_file_from_r2,
+    direct_upload_prefix,
+    get_pending_upload,
+    get_r2_object_head,
+    r2_public_url,
+)
+from app.models import File as FileModel
+from app.models import (
+    FileCreate,
+    FilePublic,
+    FileSearchResult,
+    FileSearchResults,
+    FilesPublic,
+    FileStatus,
+    FileStatusPublic,
+    FileSummary,
+    FileUploadComplete,
+    FileUploadPublic,
+    FileUploadRequest,
+    Message,
+)
 
 router = APIRouter(prefix="/files", tags=["files"])
 
-# ---------------------------------------------------------
-# [Modal 연결] 
-# ---------------------------------------------------------
-try:
-    OCRService = modal.Cls.from_name("kakao-ocr-unified", "OCRService")
-except Exception as e:
-    print(f"⚠️ Warning: Modal 앱을 찾을 수 없습니다. ({e})")
-    OCRService = None
+# 목록에서 보여줄 텍스트 미리보기 길이
+TEXT_PREVIEW_CHARS = 200
+# 검색 결과 snippet: 검색어 앞 글자 수 / 전체 길이
+SNIPPET_CONTEXT_CHARS = 40
+SNIPPET_CHARS = 160
+# 검색어 최소 길이 / pg_trgm 인덱스를 쓸 수 있는 길이 (더 짧으면 bigram 인덱스)
+SEARCH_MIN_CHARS = 2
+TRIGRAM_MIN_CHARS = 3
+
+
+# 목록 커서: 마지막 항목의 (created_at, id)
+def _encode_cursor(created_at: datetime, file_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{file_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, file_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(file_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 # 1. 파일 업로드 (POST /api/v1/files/)
@@ -31,101 +83,441 @@ def create_file(
     file: UploadFile = File(...)
 ) -> Any:
     
-    # 1. 파일 읽기
-    content = file.file.read()
-    filename = file.filename.lower()
-    extracted_text = ""
-    uploaded_url = None
+    filename = (file.filename or "").lower()
 
     print(f"📂 파일 업로드 감지: {filename}")
 
     # 2. 확장자별 분기 처리
-    # A. 텍스트 파일 (.txt)
+    # A. 텍스트 파일 (.txt) -> 바로 저장
     if filename.endswith(".txt"):
         try:
-            extracted_text = content.decode("utf-8")
+            extracted_text = file.file.read().decode("utf-8")
         except Exception:
             extracted_text = "텍스트 디코딩 실패"
 
-    # B. 이미지/동영상 (Modal 필수 -> R2 선택)
-    elif filename.endswith(('.png', '.jpg', '.jpeg', '.heic', '.mp4', '.mov', '.avi')):
-        
-        # -------------------------------------------------
-        # [Step 1] Modal 분석 (Critical Path)
-        # 실패하면 여기서 즉시 에러 리턴하고 종료 (R2 업로드 안 함)
-        # -------------------------------------------------
-        try:
-            if not OCRService:
-                raise Exception("OCR 서비스 연결 실패")
-            
-            service = OCRService()
-            print(f"🚀 [Modal Start] {filename} 분석 시작...")
-
-            if filename.endswith(('.mp4', '.mov', '.avi')):
-                # 동영상
-                result = service.process_video.remote(content)
-                extracted_text = result.get("text", "") if isinstance(result, dict) else str(result)
-            else:
-                # 이미지
-                result = service.process_image.remote(content)
-                extracted_text = str(result)
-            
-            print("✅ [Modal Success] 분석 완료")
-
-        except Exception as e:
-            print(f"❌ [Modal Error] 치명적 오류 발생: {e}")
-            # 여기서 에러를 던지면 함수가 종료되므로 R2 업로드도 실행되지 않음 (의도한 대로)
-            raise HTTPException(status_code=500, detail=f"AI 분석 실패: {str(e)}")
-
-        # -------------------------------------------------
-        # [Step 2] R2 업로드 (Optional Path)
-        # 실패해도 로그만 찍고 넘어감 (지도 추천은 되어야 하니까)
-        # -------------------------------------------------
-        try:
-            print("☁️ [R2 Start] 업로드 시작...")
-            uploaded_url = upload_file_to_r2(content, filename, file.content_type)
-            
-            if uploaded_url:
-                print(f"✅ [R2 Success] 업로드 완료: {uploaded_url}")
-            else:
-                print("⚠️ [R2 Warning] URL 생성 실패 (설정 확인 필요)")
-
-        except Exception as e:
-            # R2가 죽어도 프로세스는 계속된다
-            print(f"❌ [R2 Error] 업로드 실패 (무시하고 진행): {e}")
-            uploaded_url = None
+        file_in = FileCreate(filename=filename, extracted_text=extracted_text)
+        return crud.create_file(session=session, file_in=file_in, owner_id=current_user.id)
 
-    else:
+    # B. 이미지/동영상 (Modal 필수 -> R2 선택)
+    if not filename.endswith(MEDIA_EXTENSIONS):
         raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
 
+    # -------------------------------------------------
+    # [비동기 처리] 파일을 임시 저장하고 작업 큐에 넣은 뒤 바로 응답
+    # 진행 상황은 GET /files/{id}/status 로 확인 (pending -> processing -> done/failed)
+    # -------------------------------------------------
+    spool_path, content_hash = spool_upload(file.file)
+
+    # 같은 사용자가 같은 내용의 파일을 이미 올렸으면 OCR/R2 업로드 없이 결과 재사용
+    # (다른 사용자의 결과는 OCR 텍스트만 재사용하고 업로드는 작업에서 따로 함)
+    processed = get_processed_media(session, content_hash, current_user.id)
+    if processed and processed[1]:
+        os.remove(spool_path)
+        extracted_text, file_url = processed
+        print(f"♻️ [Dedup] {filename} 이전 처리 결과 재사용")
+        return crud.create_file(
+            session=session,
+            file_in=FileCreate(
+                filename=filename, file_url=file_url, extracted_text=extracted_text
+            ),
+            owner_id=current_user.id,
+            content_hash=content_hash,
+            ocr_version=OCR_VERSION,
+        )
+
+    db_file = crud.create_file(
+        session=session,
+        file_in=FileCreate(filename=filename),
+        owner_id=current_user.id,
+        status=FileStatus.PENDING,
+        content_hash=content_hash,
+    )
+
+    if enqueue_file_job(
+        file_id=db_file.id,
+        filename=filename,
+        content_type=file.content_type,
+        spool_path=spool_path,
+        content_hash=content_hash,
+    ):
+        print(f"📮 [Job Queued] {filename} 처리 대기열 등록 (File ID: {db_file.id})")
+        return db_file
+
+    # -------------------------------------------------
+    # [동기 처리] 작업 큐를 쓸 수 없으면 (Redis 없음 등) 기존처럼 요청 안에서 처리
+    # OCR이 실패하면 에러 리턴 (R2 업로드 안 함)
+    # -------------------------------------------------
+    try:
+        extracted_text, uploaded_url = process_media(
+            spool_path,
+            filename,
+            file.content_type,
+            content_hash,
+            owner_id=current_user.id,
+            extracted_text=processed[0] if processed else None,
+        )
+    except Exception as e:
+        print(f"❌ [Modal Error] 치명적 오류 발생: {e}")
+        session.delete(db_file)
+        session.commit()
+        raise HTTPException(status_code=500, detail=f"AI 분석 실패: {str(e)}")
+    finally:
+        os.remove(spool_path)
+
     # 3. DB 저장
     # (Modal이 성공했으므로 extracted_text는 무조건 있음)
     # (R2가 실패했으면 uploaded_url은 None이지만 저장은 됨)
-    file_in = FileCreate(
+    return crud.update_file(
+        session=session,
+        db_file=db_file,
+        file_data={
+            "extracted_text": extracted_text,
+            "file_url": uploaded_url,
+            "ocr_version": OCR_VERSION,
+            "status": FileStatus.DONE,
+        },
+    )
+
+
+# 1-1. 스크린샷 여러 장 업로드 (POST /api/v1/files/batch)
+# 한 대화의 스크린샷들을 순서대로 받아서 동시에 OCR -> 이어 붙여 File 하나로 저장
+@router.post("/batch", response_model=FilePublic)
+def create_file_batch(
+    *,
+    session: SessionDep,
+    current_user: CurrentUser,
+    files: list[UploadFile] = File(...)
+) -> Any:
+    if len(files) > settings.OCR_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.OCR_BATCH_MAX_FILES}장까지 올릴 수 있습니다.",
+        )
+    filenames = [(file.filename or "").lower() for file in files]
+    if not all(filename.endswith(IMAGE_EXTENSIONS) for filename in filenames):
+        raise HTTPException(status_code=400, detail="이미지 파일만 올릴 수 있습니다.")
+
+    print(f"📂 스크린샷 {len(files)}장 업로드 감지: {filenames[0]} ...")
+    images = []
+    for file, filename in zip(files, filenames, strict=True):
+        spool_path, content_hash = spool_upload(file.file)
+        images.append(
+            {"spool_path": spool_path, "filename": filename, "content_hash": content_hash}
+        )
+    content_hash = batch_content_hash([image["content_hash"] for image in images])
+    filename = filenames[0] if len(files) == 1 else f"{filenames[0]} 외 {len(files) - 1}장"
+
+    def remove_spools() -> None:
+        for image in images:
+            os.remove(image["spool_path"])
+
+    # 같은 스크린샷 묶음이 이미 처리됐으면 재사용 (묶음은 R2에 올리지 않으므로 텍스트만)
+    extracted_text = get_ocr_text(session, content_hash)
+    if extracted_text is not None:
+        remove_spools()
+        print(f"♻️ [Dedup] {filename} 이전 처리 결과 재사용")
+        return crud.create_file(
+            session=session,
+            file_in=FileCreate(filename=filename, extracted_text=extracted_text),
+            owner_id=current_user.id,
+            content_hash=content_hash,
+            ocr_version=OCR_VERSION,
+        )
+
+    db_file = crud.create_file(
+        session=session,
+        file_in=FileCreate(filename=filename),
+        owner_id=current_user.id,
+        status=FileStatus.PENDING,
+        content_hash=content_hash,
+    )
+
+    if enqueue_file_job(
+        file_id=db_file.id,
         filename=filename,
-        extracted_text=extracted_text,
-        file_url=uploaded_url 
+        content_type=None,
+        content_hash=content_hash,
+        batch=images,
+    ):
+        print(f"📮 [Job Queued] {filename} 처리 대기열 등록 (File ID: {db_file.id})")
+        return db_file
+
+    # 작업 큐를 쓸 수 없으면 요청 안에서 처리
+    try:
+        extracted_text = process_image_batch(session, images, content_hash)
+    except Exception as e:
+        print(f"❌ [Modal Error] 치명적 오류 발생: {e}")
+        session.delete(db_file)
+        session.commit()
+        raise HTTPException(status_code=500, detail=f"AI 분석 실패: {str(e)}")
+    finally:
+        remove_spools()
+
+    return crud.update_file(
+        session=session,
+        db_file=db_file,
+        file_data={
+            "extracted_text": extracted_text,
+            "ocr_version": OCR_VERSION,
+            "status": FileStatus.DONE,
+        },
+    )
+
+
+# 1-2. R2 직접 업로드 URL 발급 (대용량 동영상은 API 서버를 거치지 않음)
+# 브라우저: presigned PUT으로 R2에 업로드 -> POST /files/uploads/complete 호출
+@router.post("/uploads", response_model=FileUploadPublic)
+def create_file_upload(
+    *,
+    current_user: CurrentUser,
+    upload_in: FileUploadRequest,
+) -> Any:
+    filename = upload_in.filename.lower()
+    if not filename.endswith(MEDIA_EXTENSIONS) or not upload_in.content_type.startswith(
+        ("image/", "video/")
+    ):
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
+
+    max_bytes = settings.R2_DIRECT_UPLOAD_MAX_MB * 1024 * 1024
+    if upload_in.size > max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"파일이 너무 큽니다. (최대 {settings.R2_DIRECT_UPLOAD_MAX_MB}MB)",
+        )
+
+    presigned = create_presigned_upload(
+        current_user.id, filename, upload_in.content_type, upload_in.size
+    )
+    if not presigned:
+        raise HTTPException(status_code=503, detail="직접 업로드를 사용할 수 없습니다.")
+
+    return FileUploadPublic(
+        **presigned, expires_in=settings.R2_PRESIGNED_EXPIRES_SECONDS
     )
 
-    db_file = crud.create_file(session=session, file_in=file_in, owner_id=current_user.id)
-    return db_file
+
+# 1-3. R2 직접 업로드 완료 -> File 등록 + OCR 작업 큐
+@router.post("/uploads/complete", response_model=FilePublic)
+def complete_file_upload(
+    *,
+    session: SessionDep,
+    current_user: CurrentUser,
+    upload_in: FileUploadComplete,
+) -> Any:
+    object_key = upload_in.object_key
+    # 이 사용자에게 발급했고 아직 완료되지 않은 업로드인지 확인
+    pending = get_pending_upload(object_key)
+    if not pending:
+        raise HTTPException(
+            status_code=404, detail="업로드 요청을 찾을 수 없습니다. (만료 또는 이미 완료)"
+        )
+    if pending["owner_id"] != str(current_user.id) or not object_key.startswith(
+        direct_upload_prefix(current_user.id)
+    ):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    # 실제로 올라간 객체가 발급 때 받은 크기/타입과 같은지 R2에 HEAD로 확인
+    head = get_r2_object_head(object_key)
+    if not head:
+        raise HTTPException(status_code=404, detail="업로드된 파일을 찾을 수 없습니다.")
+    max_bytes = settings.R2_DIRECT_UPLOAD_MAX_MB * 1024 * 1024
+    if (
+        head["size"] != pending["size"]
+        or head["size"] > max_bytes
+        or head["content_type"] != pending["content_type"]
+    ):
+        claim_pending_upload(object_key)
+        delete_file_from_r2(r2_public_url(object_key))
+        raise HTTPException(status_code=400, detail="업로드된 파일이 요청과 다릅니다.")
+
+    # 동시에 온 완료 요청 중 하나만 통과
+    if not claim_pending_upload(object_key):
+        raise HTTPException(status_code=409, detail="이미 완료된 업로드입니다.")
+
+    filename = pending["filename"]
+    print(f"📂 직접 업로드 완료: {filename} ({object_key})")
+    db_file = crud.create_file(
+        session=session,
+        file_in=FileCreate(filename=filename, file_url=r2_public_url(object_key)),
+        owner_id=current_user.id,
+        status=FileStatus.PENDING,
+    )
+
+    if enqueue_file_job(
+        file_id=db_file.id,
+        filename=filename,
+        content_type=pending["content_type"],
+        object_key=object_key,
+    ):
+        print(f"📮 [Job Queued] {filename} 처리 대기열 등록 (File ID: {db_file.id})")
+        return db_file
+
+    # 작업 큐를 쓸 수 없으면 요청 안에서 처리
+    try:
+        extracted_text, content_hash = process_uploaded_object(
+            session, object_key, filename
+        )
+    except Exception as e:
+        print(f"❌ [Modal Error] 치명적 오류 발생: {e}")
+        session.delete(db_file)
+        session.commit()
+        raise HTTPException(status_code=500, detail=f"AI 분석 실패: {str(e)}")
+
+    return crud.update_file(
+        session=session,
+        db_file=db_file,
+        file_data={
+            "extracted_text": extracted_text,
+            "content_hash": content_hash,
+            "ocr_version": OCR_VERSION,
+            "status": FileStatus.DONE,
+        },
+    )
+
+
+# 1-4. 업로드 처리 상태 조회 (폴링용)
+@router.get("/{id}/status", response_model=FileStatusPublic)
+def read_file_status(
+    session: SessionDep,
+    current_user: CurrentUser,
+    id: uuid.UUID,
+) -> Any:
+    file = session.get(FileModel, id)
+    if not file:
+        raise HTTPException(status_code=404, detail="File not found")
+    if file.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return file
 
 
 # 2. 내 파일 목록 조회
+# cursor를 주면 (created_at, id) 기준 keyset 페이지네이션 (skip 무시)
 @router.get("/", response_model=FilesPublic)
 def read_files(
     session: SessionDep,
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
 ) -> Any:
-    count_statement = select(FileModel).where(FileModel.owner_id == current_user.id)
-    statement = select(FileModel).where(FileModel.owner_id == current_user.id).offset(skip).limit(limit).order_by(FileModel.created_at.desc())
-    
-    count = session.exec(count_statement).all()
-    files = session.exec(statement).all()
+    count_statement = (
+        select(func.count())
+        .select_from(FileModel)
+        .where(FileModel.owner_id == current_user.id)
+    )
+    count = session.exec(count_statement).one()
 
-    return FilesPublic(data=files, count=len(count))
+    # extracted_text 전체는 가져오지 않고 미리보기만 DB에서 잘라옴
+    # (sqlmodel select는 컬럼 4개까지만 타입이 잡혀서 SQLAlchemy select 사용)
+    statement = (
+        sa_select(
+            col(FileModel.id),
+            col(FileModel.filename),
+            col(FileModel.file_url),
+            col(FileModel.owner_id),
+            col(FileModel.created_at),
+            col(FileModel.status),
+            col(FileModel.error),
+            func.substr(col(FileModel.extracted_text), 1, TEXT_PREVIEW_CHARS).label(
+                "text_preview"
+            ),
+            func.coalesce(func.length(col(FileModel.extracted_text)), 0).label(
+                "text_length"
+            ),
+        )
+        .where(col(FileModel.owner_id) == current_user.id)
+        .order_by(col(FileModel.created_at).desc(), col(FileModel.id).desc())
+        .limit(limit)
+    )
+    if cursor:
+        created_at, file_id = _decode_cursor(cursor)
+        statement = statement.where(
+            or_(
+                col(FileModel.created_at) < created_at,
+                and_(
+                    col(FileModel.created_at) == created_at,
+                    col(FileModel.id) < file_id,
+                ),
+            )
+        )
+    else:
+        statement = statement.offset(skip)
+
+    files = [FileSummary(**row._mapping) for row in session.execute(statement).all()]
+    next_cursor = (
+        _encode_cursor(files[-1].created_at, files[-1].id)
+        if len(files) == limit
+        else None
+    )
+
+    return FilesPublic(data=files, count=count, next_cursor=next_cursor)
+
+
+# 2-1. 내 파일 내용 검색 (3글자 이상: pg_trgm GIN 인덱스 / 2글자: bigram GIN 인덱스)
+# 부분 일치(ILIKE)로 찾고 word_similarity로 정렬, 본문 대신 검색어 주변 snippet만 반환
+@router.get("/search", response_model=FileSearchResults)
+def search_files(
+    session: SessionDep,
+    current_user: CurrentUser,
+    q: str = Query(min_length=SEARCH_MIN_CHARS, max_length=100),
+    limit: int = Query(default=20, le=100),
+) -> Any:
+    query = q.strip()
+    if len(query) < SEARCH_MIN_CHARS:
+        raise HTTPException(
+            status_code=400, detail=f"검색어를 {SEARCH_MIN_CHARS}글자 이상 입력해주세요."
+        )
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    extracted_text = col(FileModel.extracted_text)
+    position = func.strpos(func.lower(extracted_text), query.lower())
+    snippet = func.substr(
+        extracted_text,
+        func.greatest(position - SNIPPET_CONTEXT_CHARS, 1),
+        SNIPPET_CHARS,
+    )
+    score = func.word_similarity(query, extracted_text)
+    conditions = [
+        col(FileModel.owner_id) == current_user.id,
+        extracted_text.ilike(f"%{escaped}%", escape="\\"),
+    ]
+    if len(query) < TRIGRAM_MIN_CHARS:
+        # 트라이그램이 안 나오는 짧은 검색어는 bigram 인덱스로 후보를 좁힘 (ILIKE로 재확인)
+        conditions.append(
+            func.file_text_bigrams(extracted_text).op("@>", is_comparison=True)(
+                func.file_text_bigrams(query)
+            )
+        )
+    statement = (
+        sa_select(
+            col(FileModel.id),
+            col(FileModel.filename),
+            col(FileModel.created_at),
+            snippet.label("snippet"),
+            score.label("score"),
+        )
+        .where(*conditions)
+        .order_by(score.desc(), col(FileModel.created_at).desc())
+        .limit(limit)
+    )
+
+    rows = session.execute(statement).all()
+    return FileSearchResults(data=[FileSearchResult(**row._mapping) for row in rows])
+
+
+# 2-2. 파일 하나 조회 (추출 텍스트 전체 포함, 목록에는 미리보기만 있음)
+@router.get("/{id}", response_model=FilePublic)
+def read_file(
+    session: SessionDep,
+    current_user: CurrentUser,
+    id: uuid.UUID,
+) -> Any:
+    file = session.get(FileModel, id)
+    if not file:
+        raise HTTPException(status_code=404, detail="File not found")
+    if file.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return file
 
 
 # 3. 파일 삭제
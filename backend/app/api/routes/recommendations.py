@@ -1,15 +1,50 @@
+import asyncio
+import time
 import uuid
-from typing import Any, List, Optional
+from typing import Any, List, Optional, cast
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from app.api.deps import SessionDep, CurrentUser
+from sqlalchemy.orm import QueryableAttribute, undefer
+from sqlmodel import Session
+
+from app import crud
+from app.api.deps import CurrentUser, SessionDep
+from app.core.config import settings
+from app.core.db import engine
+from app.core.llm import (
+    MODEL_VERSION,
+    PROMPT_VERSION,
+    AnalysisResult,
+    CourseStep,
+    Metadata,
+    Persona,
+    analyze_text_with_llm_async,
+)
+from app.core.naver_client import search_naver_local_many
 from app.models import File as FileModel
-from app.core.llm import analyze_text_with_llm, CourseStep, AnalysisResult, Metadata, Persona
-from app.core.naver_client import search_naver_local
+from app.models import FileStatus
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
+
+async def _wait_for_file_processing(session: Session, file: FileModel) -> None:
+    """
+    업로드 직후라 OCR 작업이 아직 끝나지 않았으면 끝날 때까지 기다립니다.
+    (async 대기라서 기다리는 동안 워커 스레드를 점유하지 않음)
+    """
+    deadline = time.monotonic() + settings.FILE_PROCESSING_WAIT_SECONDS
+    while file.status in (FileStatus.PENDING, FileStatus.PROCESSING):
+        if time.monotonic() >= deadline:
+            raise HTTPException(status_code=409, detail="파일 분석이 아직 진행 중입니다.")
+        await asyncio.sleep(settings.FILE_PROCESSING_POLL_SECONDS)
+        await run_in_threadpool(session.refresh, file)
+
+    if file.status == FileStatus.FAILED:
+        raise HTTPException(status_code=400, detail=file.error or "파일 분석에 실패했습니다.")
+
+
 # 요청 Body 모델 정의
 class RecommendationRequest(BaseModel):
     file_id: Optional[uuid.UUID] = None        # 처음 요청할 때 사용
@@ -20,7 +55,7 @@ class RecommendationRequest(BaseModel):
     personas: Optional[List[Persona]] = None
 
 @router.post("/")
-def create_recommendation(
+async def create_recommendation(
     session: SessionDep,
     current_user: CurrentUser,
     request: RecommendationRequest,
@@ -47,18 +82,61 @@ def create_recommendation(
     # Case 2: 초기 진입 모드 (AI 분석)
     # 수정 데이터가 없고 파일 ID만 있을 때는 텍스트를 읽어서 처음부터 분석
     elif request.file_id:
-        file = session.get(FileModel, request.file_id)
+        # extracted_text는 deferred 컬럼이라 여기서 같이 읽어둠
+        # (이벤트 루프에서 속성 접근 시 동기 SELECT가 나가지 않도록)
+        # sqlmodel 필드는 타입상 str로 보여서 ORM 속성으로 cast
+        extracted_text = cast(QueryableAttribute[Any], FileModel.extracted_text)
+        file = await run_in_threadpool(
+            session.get,
+            FileModel,
+            request.file_id,
+            options=[undefer(extracted_text)],
+        )
         if not file:
             raise HTTPException(status_code=404, detail="File not found")
         if file.owner_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not enough permissions")
-        
+
+        await _wait_for_file_processing(session, file)
+
         # 텍스트가 없는 경우 (이미지/영상 분석 실패 등)
         if not file.extracted_text:
             raise HTTPException(status_code=400, detail="분석할 텍스트가 없습니다.")
         
         print(f"🤖 AI 분석 시작... (File ID: {request.file_id})")
-        ai_result = analyze_text_with_llm(file.extracted_text)
+
+        # Redis(hot) -> Postgres(영구 저장) -> OpenAI 순서로 조회
+        async def load_stored() -> AnalysisResult | None:
+            stored = await run_in_threadpool(
+                crud.get_file_analysis,
+                session=session,
+                file_id=file.id,
+                prompt_version=PROMPT_VERSION,
+                model_version=MODEL_VERSION,
+            )
+            return AnalysisResult.model_validate(stored.result) if stored else None
+
+        # OpenAI로 새로 분석한 경우에만 파일별로 영구 저장
+        # (Redis가 만료/초기화되어도 다시 LLM을 부르지 않도록, 캐시/DB hit이면 저장 생략)
+        # single-flight 리더가 요청보다 오래 살 수 있으므로 별도 세션 사용
+        file_id = file.id
+
+        def save_analysis(result: AnalysisResult) -> None:
+            with Session(engine) as store_session:
+                crud.save_file_analysis(
+                    session=store_session,
+                    file_id=file_id,
+                    prompt_version=PROMPT_VERSION,
+                    model_version=MODEL_VERSION,
+                    result=result.model_dump(),
+                )
+
+        async def store(result: AnalysisResult) -> None:
+            await run_in_threadpool(save_analysis, result)
+
+        ai_result = await analyze_text_with_llm_async(
+            file.extracted_text, load_stored=load_stored, store=store
+        )
     
     # Case 3: 둘 다 없음 (에러)
     else:
@@ -67,14 +145,16 @@ def create_recommendation(
     # -------------------------------------------------------
     # [공통 로직] 네이버 검색 및 3가지 경로 생성
     # -------------------------------------------------------
-    search_pool = {}
-    
-    # 1. 각 단계별(식당, 카페, 활동)로 네이버 검색 수행
-    for step in ai_result.courses:
-        print(f"🔎 검색 진행 중: {step.final_query}")
-        # 다양성을 위해 5개 검색
-        places = search_naver_local(step.final_query, display=5)
-        search_pool[step.step] = places
+    # 1. 각 단계별(식당, 카페, 활동)로 네이버 검색을 동시에 수행
+    # (직렬로 하면 단계 수만큼 지연이 쌓이므로 병렬 + 전체 마감시간 적용)
+    queries = [step.final_query for step in ai_result.courses]
+    print(f"🔎 검색 진행 중: {queries}")
+    # 다양성을 위해 5개 검색
+    search_results = await search_naver_local_many(queries, display=5)
+    search_pool = {
+        step.step: places
+        for step, places in zip(ai_result.courses, search_results, strict=True)
+    }
 
     recommended_courses = []
     
@@ -12,6 +12,7 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.security import get_password_hash, verify_password
+from app.core.user_cache import invalidate_user
 from app.models import (
     Message,
     UpdatePassword,
@@ -92,6 +93,7 @@ def update_user_me(
     current_user.sqlmodel_update(user_data)
     session.add(current_user)
     session.commit()
+    invalidate_user(current_user.id)
     session.refresh(current_user)
     return current_user
 
@@ -113,6 +115,7 @@ def update_password_me(
     current_user.hashed_password = hashed_password
     session.add(current_user)
     session.commit()
+    invalidate_user(current_user.id)
     return Message(message="Password updated successfully")
 
 
@@ -133,8 +136,10 @@ def delete_user_me(session: SessionDep, current_user: CurrentUser) -> Any:
         raise HTTPException(
             status_code=403, detail="Super users are not allowed to delete themselves"
         )
+    user_id = current_user.id
     session.delete(current_user)
     session.commit()
+    invalidate_user(user_id)
     return Message(message="User deleted successfully")
 
 
@@ -220,4 +225,5 @@ def delete_user(
         )
     session.delete(user)
     session.commit()
+    invalidate_user(user_id)
     return Message(message="User deleted successfully")
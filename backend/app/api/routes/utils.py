@@ -1,7 +1,13 @@
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from pydantic.networks import EmailStr
 
 from app.api.deps import get_current_active_superuser
+from app.core.cache import get_cache_stats, get_redis_health
+from app.core.ocr import get_modal_health
+from app.core.security import get_password_hash_stats
+from app.core.storage import get_r2_health
 from app.models import Message
 from app.utils import generate_test_email, send_email
 
@@ -26,6 +32,48 @@ def test_email(email_to: EmailStr) -> Message:
     return Message(message="Test email sent")
 
 
+@router.get(
+    "/cache-stats/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def cache_stats() -> dict[str, dict[str, Any]]:
+    """
+    Cache hit/miss counters.
+    """
+    return {
+        "llm_analysis": get_cache_stats("llm_analysis"),
+        "naver_local": get_cache_stats("naver_local"),
+        "ocr_result": get_cache_stats("ocr_result"),
+        "current_user": get_cache_stats("current_user"),
+    }
+
+
 @router.get("/health-check/")
 async def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/backend-health/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def backend_health() -> dict[str, dict[str, Any]]:
+    """
+    Redis / R2 / Modal connection status (ok, unavailable, not_configured).
+    """
+    return {
+        "redis": get_redis_health(),
+        "r2": get_r2_health(),
+        "modal": get_modal_health(),
+    }
+
+
+@router.get(
+    "/password-hash-stats/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def password_hash_stats() -> dict[str, Any]:
+    """
+    Password hashing latency and load-shedding counters (per worker process).
+    """
+    return get_password_hash_stats()
@@ -0,0 +1,266 @@
+import asyncio
+import os
+import threading
+import time
+import uuid
+from typing import Any
+
+import redis
+import redis.asyncio
+
+from app.core.config import settings
+
+# ---------------------------------------------------------
+# [Redis 클라이언트 설정]
+# ---------------------------------------------------------
+# Docker 환경에서는 'redis', 로컬/기타 환경 대비 환경변수 지원
+redis_host = os.getenv("REDIS_HOST", "redis")
+
+# import 시점에는 연결하지 않음 (워커 부팅/테스트가 Redis 응답을 기다리지 않도록)
+# 처음 사용할 때 연결하고, 실패하면 BACKEND_RETRY_SECONDS 동안은 Redis 없이 동작
+_redis_client: redis.Redis | None = None
+_async_redis_client: redis.asyncio.Redis | None = None
+_redis_lock = threading.Lock()
+_redis_retry_at = 0.0
+_redis_error: str | None = None
+
+
+def _redis_backing_off() -> bool:
+    return _redis_client is None and time.monotonic() < _redis_retry_at
+
+
+def get_redis_client() -> redis.Redis | None:
+    """동기 Redis 클라이언트 (첫 호출 시 연결 + ping, 연결 실패 시 None)"""
+    global _redis_client, _redis_retry_at, _redis_error
+    if _redis_client is not None:
+        return _redis_client
+    if _redis_backing_off():
+        return None
+
+    with _redis_lock:
+        if _redis_client is not None:
+            return _redis_client
+        if _redis_backing_off():
+            return None
+
+        # decode_responses=True: 데이터를 bytes가 아닌 str로 자동 변환
+        client = redis.Redis(
+            host=redis_host,
+            port=6379,
+            db=0,
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        )
+        try:
+            # 연결 테스트 (핑) - 실패 시 잠시 뒤 다시 시도
+            client.ping()
+        except Exception as e:
+            print(f"⚠️ Redis connection failed: {e}")
+            client.close()
+            _redis_error = str(e)
+            _redis_retry_at = time.monotonic() + settings.BACKEND_RETRY_SECONDS
+            return None
+
+        print(f"✅ Redis connected at {redis_host}")
+        _redis_error = None
+        _redis_client = client
+        return client
+
+
+async def get_async_redis_client() -> redis.asyncio.Redis | None:
+    """
+    비동기 라우트용 클라이언트 (동기 클라이언트가 연결된 경우에만 사용).
+    첫 연결(ping)은 스레드에서 해서 이벤트 루프를 막지 않음.
+    """
+    global _async_redis_client
+    if _async_redis_client is not None:
+        return _async_redis_client
+    if _redis_backing_off():
+        return None
+    if _redis_client is None and await asyncio.to_thread(get_redis_client) is None:
+        return None
+
+    if _async_redis_client is None:
+        _async_redis_client = redis.asyncio.Redis(
+            host=redis_host,
+            port=6379,
+            db=0,
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        )
+    return _async_redis_client
+
+
+def get_redis_health() -> dict[str, Any]:
+    """Redis 상태 (ok / unavailable). 연결돼 있으면 ping으로 실제 응답 확인"""
+    client = get_redis_client()
+    if client is None:
+        return {"status": "unavailable", "error": _redis_error}
+    try:
+        client.ping()
+    except Exception as e:
+        return {"status": "unavailable", "error": str(e)}
+    return {"status": "ok"}
+
+
+async def close_redis_clients() -> None:
+    global _redis_client, _async_redis_client
+    if _async_redis_client:
+        await _async_redis_client.aclose()
+        _async_redis_client = None
+    if _redis_client:
+        _redis_client.close()
+        _redis_client = None
+
+
+# ---------------------------------------------------------
+# [캐시 적중률 카운터]
+# ---------------------------------------------------------
+# cache_stats:{name} 해시에 hits / misses 누적 (워커 프로세스 간 공유)
+
+def _stats_key(name: str) -> str:
+    return f"cache_stats:{name}"
+
+
+def record_cache_stat(name: str, hit: bool) -> None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        redis_client.hincrby(_stats_key(name), "hits" if hit else "misses", 1)
+    except Exception as e:
+        print(f"⚠️ Redis Stat Error: {e}")
+
+
+def add_cache_stats(name: str, hits: int, misses: int) -> None:
+    """프로세스 안에서 모아둔 hits / misses를 한 번에 더함 (요청마다 HINCRBY 하지 않도록)"""
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hincrby(_stats_key(name), "hits", hits)
+        pipe.hincrby(_stats_key(name), "misses", misses)
+        pipe.execute()
+    except Exception as e:
+        print(f"⚠️ Redis Stat Error: {e}")
+
+
+async def record_cache_stat_async(name: str, hit: bool) -> None:
+    async_redis_client = await get_async_redis_client()
+    if not async_redis_client:
+        return
+    try:
+        await async_redis_client.hincrby(
+            _stats_key(name), "hits" if hit else "misses", 1
+        )
+    except Exception as e:
+        print(f"⚠️ Redis Stat Error: {e}")
+
+
+def get_cache_stats(name: str) -> dict[str, Any]:
+    """캐시 이름별 hits / misses / hit_rate 반환 (Redis 미연결 시 0)"""
+    stats: dict[bytes | str, bytes | str] = {}
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            stats = redis_client.hgetall(_stats_key(name))
+        except Exception as e:
+            print(f"⚠️ Redis Stat Error: {e}")
+
+    hits = int(stats.get("hits", 0))
+    misses = int(stats.get("misses", 0))
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
+
+
+# ---------------------------------------------------------
+# [분산 lease] 워커 간 중복 작업 방지용 짧은 락
+# ---------------------------------------------------------
+# 소유자 토큰이 일치할 때만 삭제 (만료 후 다른 워커가 잡은 lease를 지우지 않도록)
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 소유자 토큰이 일치할 때만 만료 시간 연장 (리더가 오래 걸리는 작업 중에 lease 유지)
+_RENEW_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def acquire_lease(key: str, ttl_seconds: float) -> str | None:
+    """
+    lease 획득 시 소유자 토큰, 이미 다른 곳에서 잡고 있으면 None 반환.
+    Redis 오류는 호출한 쪽에서 처리하도록 그대로 올림.
+    """
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+    token = uuid.uuid4().hex
+    if redis_client.set(key, token, nx=True, px=int(ttl_seconds * 1000)):
+        return token
+    return None
+
+
+def release_lease(key: str, token: str) -> None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        redis_client.eval(_RELEASE_LEASE_SCRIPT, 1, key, token)
+    except Exception as e:
+        print(f"⚠️ Redis Lease Release Error: {e}")
+
+
+def renew_lease(key: str, token: str, ttl_seconds: float) -> bool:
+    """
+    아직 lease를 갖고 있으면 ttl_seconds로 다시 연장하고 True, 이미 잃었으면 False.
+    Redis 오류는 호출한 쪽에서 처리하도록 그대로 올림.
+    """
+    redis_client = get_redis_client()
+    if not redis_client:
+        return False
+    return bool(
+        redis_client.eval(_RENEW_LEASE_SCRIPT, 1, key, token, int(ttl_seconds * 1000))
+    )
+
+
+async def acquire_lease_async(key: str, ttl_seconds: float) -> str | None:
+    async_redis_client = await get_async_redis_client()
+    if not async_redis_client:
+        return None
+    token = uuid.uuid4().hex
+    if await async_redis_client.set(key, token, nx=True, px=int(ttl_seconds * 1000)):
+        return token
+    return None
+
+
+async def renew_lease_async(key: str, token: str, ttl_seconds: float) -> bool:
+    async_redis_client = await get_async_redis_client()
+    if not async_redis_client:
+        return False
+    return bool(
+        await async_redis_client.eval(
+            _RENEW_LEASE_SCRIPT, 1, key, token, int(ttl_seconds * 1000)
+        )
+    )
+
+
+async def release_lease_async(key: str, token: str) -> None:
+    async_redis_client = await get_async_redis_client()
+    if not async_redis_client:
+        return
+    try:
+        await async_redis_client.eval(_RELEASE_LEASE_SCRIPT, 1, key, token)
+    except Exception as e:
+        print(f"⚠️ Redis Lease Release Error: {e}")
@@ -0,0 +1,46 @@
+import re
+
+# ---------------------------------------------------------
+# [긴 대화 분할] map-reduce 분석용
+# ---------------------------------------------------------
+# 카톡 내보내기의 날짜 구분선 (예: "--------------- 2025년 12월 1일 월요일 ---------------",
+# "2025년 12월 1일 월요일") -> 가능하면 이 지점에서 청크를 나눔
+DATE_SEPARATOR_PATTERN = re.compile(r"^-*\s*\d{4}년 \d{1,2}월 \d{1,2}일.*요일\s*-*$")
+
+
+def split_chat_log(text: str, max_chars: int) -> list[str]:
+    """
+    대화 로그를 메시지(줄) 경계에서 max_chars 이하 청크로 나눕니다.
+    날짜 구분선이 나오면 현재 청크가 절반 이상 찼을 때 미리 끊어서
+    같은 날 대화가 최대한 한 청크에 들어가도록 합니다.
+    """
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks: list[str] = []
+    current: list[str] = []
+    current_len = 0
+
+    def flush() -> None:
+        nonlocal current, current_len
+        if current:
+            chunks.append("\n".join(current))
+        current, current_len = [], 0
+
+    for line in text.splitlines():
+        if DATE_SEPARATOR_PATTERN.match(line.strip()) and current_len >= max_chars // 2:
+            flush()
+
+        # 한 줄이 너무 길면 강제로 자름
+        while len(line) > max_chars:
+            flush()
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+
+        if current_len + len(line) + 1 > max_chars:
+            flush()
+        current.append(line)
+        current_len += len(line) + 1
+
+    flush()
+    return [chunk for chunk in chunks if chunk.strip()]
@@ -0,0 +1,152 @@
+import re
+import unicodedata
+from typing import NamedTuple
+
+# ---------------------------------------------------------
+# [카톡 대화 전처리] LLM에 보내기 전에 토큰 줄이기
+# ---------------------------------------------------------
+# 지원 포맷
+#   모바일:   "오후 2:00, 박민수 : 내용"
+#   안드로이드: "2025. 12. 1. 오후 2:00, 박민수 : 내용" / "2025년 12월 1일 오후 2:00, 박민수 : 내용"
+#   PC:      "[박민수] [오후 2:00] 내용"
+_DATE_PREFIX = r"(?:\d{4}(?:\.\s*\d{1,2}\.\s*\d{1,2}\.|년\s*\d{1,2}월\s*\d{1,2}일)\s*)?"
+_TIME = r"(?:오전|오후)\s*\d{1,2}:\d{2}"
+
+MOBILE_LINE_PATTERN = re.compile(rf"^{_DATE_PREFIX}{_TIME},\s*(?P<speaker>[^:]+?)\s*:\s?(?P<text>.*)$")
+PC_LINE_PATTERN = re.compile(rf"^\[(?P<speaker>[^\]]+)\]\s*\[{_TIME}\]\s?(?P<text>.*)$")
+# 타임스탬프는 있지만 발화자가 없는 줄 (예: "오후 2:00, 라이언님이 들어왔습니다.")
+SYSTEM_LINE_PATTERN = re.compile(rf"^{_DATE_PREFIX}{_TIME},")
+
+# 날짜 구분선 (예: "--------------- 2025년 12월 1일 월요일 ---------------")
+DATE_LINE_PATTERN = re.compile(r"^-*\s*(?P<date>\d{4}년 \d{1,2}월 \d{1,2}일 \S+요일)\s*-*$")
+
+# 입장/퇴장, 미디어 placeholder 등 분석에 의미 없는 시스템 메시지
+SYSTEM_MESSAGE_PATTERN = re.compile(
+    r"(님이 들어왔습니다|님이 나갔습니다|님을 초대했습니다|님을 내보냈습니다|"
+    r"^사진$|^사진 \d+장$|^동영상$|^이모티콘$|^음성메시지$|^파일: |"
+    r"^삭제된 메시지입니다\.?$|^메시지가 삭제되었습니다\.?$|"
+    r"님과 카카오톡 대화$|^저장한 날짜 : )"
+)
+
+# 자음/모음 반복, 문장부호, 이모지만 있는 줄 (예: "ㅋㅋㅋㅋ", "ㅠㅠ", "!!", "😂😂")
+NOISE_ONLY_PATTERN = re.compile(r"^[ㄱ-ㅎㅏ-ㅣ\s.,!?~^…ㅡ\-_;:()\[\]☀-➿\U0001F000-\U0001FAFF️‍]*$")
+# "ㅋㅋㅋㅋㅋ" -> "ㅋㅋ" (문장 안의 반복은 의미만 남기고 줄임)
+REPEATED_JAMO_PATTERN = re.compile(r"([ㄱ-ㅎㅏ-ㅣ])\1{2,}")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 캐시 키 정규화용: 카톡 헤더/타임스탬프 자리에 남은 시간만 (메시지 안의 "7:30에 만나"는 유지)
+#   줄 맨 앞 "오후 2:00," / PC "[오후 2:00]" / 시간만 있는 줄 (스크린샷 OCR의 말풍선 옆 시간)
+TIMESTAMP_PATTERN = re.compile(
+    rf"^[ \t]*{_DATE_PREFIX}{_TIME},|\[{_TIME}\]|"
+    rf"^[ \t]*(?:{_DATE_PREFIX}{_TIME}|\d{{1,2}}:\d{{2}})[ \t]*$",
+    re.MULTILINE,
+)
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+class ChatMessage(NamedTuple):
+    speaker: str
+    text: str
+
+
+class PreprocessedChat(NamedTuple):
+    transcript: str
+    participants: list[str]
+
+
+def parse_chat_log(text: str) -> list[ChatMessage]:
+    """
+    대화 로그를 (발화자, 내용) 리스트로 파싱합니다.
+    헤더가 없는 줄은 직전 메시지의 이어지는 줄로 붙이고,
+    날짜 구분선은 speaker가 빈 문자열인 레코드로 남깁니다.
+    """
+    messages: list[ChatMessage] = []
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        date_match = DATE_LINE_PATTERN.match(line)
+        if date_match:
+            messages.append(ChatMessage("", date_match.group("date")))
+            continue
+
+        match = MOBILE_LINE_PATTERN.match(line) or PC_LINE_PATTERN.match(line)
+        if match:
+            messages.append(
+                ChatMessage(match.group("speaker").strip(), match.group("text").strip())
+            )
+        elif SYSTEM_LINE_PATTERN.match(line):
+            continue
+        elif messages and messages[-1].speaker:
+            last = messages[-1]
+            messages[-1] = ChatMessage(last.speaker, f"{last.text} {line}")
+        else:
+            # 헤더 없는 줄 (OCR 결과 등) -> 발화자 미상으로 유지
+            messages.append(ChatMessage("?", line))
+    return messages
+
+
+def _clean_text(text: str) -> str:
+    text = REPEATED_JAMO_PATTERN.sub(r"\1\1", text)
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def preprocess_chat_log(text: str) -> PreprocessedChat:
+    """
+    카톡 대화 로그를 LLM 입력용 압축 transcript로 변환합니다.
+    - 타임스탬프 제거, "발화자: 내용" 형태로 통일
+    - 시스템 메시지 / "ㅋㅋㅋ", 이모지만 있는 메시지 제거
+    - 완전히 같은 (발화자, 내용) 반복 제거 (동영상 OCR 중복 등)
+    카톡 포맷으로 파싱되는 메시지가 하나도 없으면 원문을 그대로 돌려줍니다.
+    """
+    # macOS 등에서 올라온 자모 분리(NFD) 텍스트도 같은 패턴으로 파싱되도록 NFC 통일
+    text = unicodedata.normalize("NFC", text)
+    messages = parse_chat_log(text)
+    if not any(message.speaker not in ("", "?") for message in messages):
+        return PreprocessedChat(text.strip(), [])
+
+    lines: list[str] = []
+    participants: list[str] = []
+    seen: set[ChatMessage] = set()
+
+    for message in messages:
+        if not message.speaker:
+            lines.append(f"--- {message.text} ---")
+            continue
+
+        # 참여자 수는 노이즈 메시지만 보낸 사람도 포함해서 셈
+        if message.speaker != "?" and message.speaker not in participants:
+            participants.append(message.speaker)
+
+        cleaned = _clean_text(message.text)
+        if SYSTEM_MESSAGE_PATTERN.search(cleaned) or NOISE_ONLY_PATTERN.match(cleaned):
+            continue
+
+        record = ChatMessage(message.speaker, cleaned)
+        if record in seen:
+            continue
+        seen.add(record)
+
+        lines.append(cleaned if message.speaker == "?" else f"{message.speaker}: {cleaned}")
+
+    # 대화 없이 연속된 날짜 구분선은 마지막 것만 유지
+    compact: list[str] = []
+    for line in lines:
+        if compact and line.startswith("--- ") and compact[-1].startswith("--- "):
+            compact[-1] = line
+        else:
+            compact.append(line)
+
+    return PreprocessedChat("\n".join(compact), participants)
+
+
+def normalize_for_cache_key(transcript: str) -> str:
+    """
+    캐시 키 계산용 정규화. 공백/줄바꿈/문장부호/타임스탬프 차이를 모두 없애서
+    같은 대화를 다시 올리거나 다시 OCR한 경우에도 같은 키가 나오도록 합니다.
+    (LLM에는 보내지 않음)
+    """
+    text = unicodedata.normalize("NFC", transcript)
+    text = TIMESTAMP_PATTERN.sub("", text)
+    return NON_WORD_PATTERN.sub("", text).lower()
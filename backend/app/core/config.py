@@ -41,7 +41,33 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str | None = None
     NAVER_CLIENT_ID: str | None = None
     NAVER_CLIENT_SECRET: str | None = None
-    
+
+    # 네이버 검색 1건당 타임아웃 / 코스 전체 검색(병렬) 마감시간 (초)
+    NAVER_SEARCH_TIMEOUT_SECONDS: float = 5.0
+    NAVER_SEARCH_DEADLINE_SECONDS: float = 6.0
+    # 네이버 API 커넥션 풀 (워커 프로세스당)
+    NAVER_HTTP_POOL_SIZE: int = 20
+    NAVER_HTTP_KEEPALIVE_SECONDS: float = 60.0
+    NAVER_HTTP_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    # 네이버 검색 결과 Redis 캐시 TTL (결과 없음은 짧게)
+    NAVER_CACHE_TTL_SECONDS: int = 60 * 60 * 6
+    NAVER_NEGATIVE_CACHE_TTL_SECONDS: int = 60 * 10
+
+    # OpenAI 클라이언트 (워커 프로세스당 커넥션 풀)
+    OPENAI_TIMEOUT_SECONDS: float = 120.0
+    OPENAI_MAX_CONNECTIONS: int = 50
+
+    # 긴 대화 분할 분석 (청크 최대 글자 수 / 동시에 분석할 청크 수)
+    LLM_CHUNK_MAX_CHARS: int = 12000
+    LLM_CHUNK_CONCURRENCY: int = 4
+
+    # LLM 분석 single-flight (같은 대화 동시 요청 시 OpenAI 호출 1회로 합침)
+    # 리더는 분석하는 동안 lease를 1/3 주기마다 연장 (리더가 죽으면 이 시간 뒤에 다른 워커가 이어받음)
+    LLM_SINGLEFLIGHT_LEASE_SECONDS: float = 30.0
+    # 대기자가 기다리는 최대 시간 = 이 값 x 리더의 LLM 호출 라운드 수 (청크 수에 비례)
+    LLM_SINGLEFLIGHT_WAIT_SECONDS: float = 150.0
+    LLM_SINGLEFLIGHT_POLL_SECONDS: float = 0.5
+
     # ========================================================
     # [추가] Cloudflare R2 (S3) 설정
     # ========================================================
@@ -50,7 +76,81 @@ class Settings(BaseSettings):
     R2_SECRET_ACCESS_KEY: str | None = None
     R2_BUCKET_NAME: str | None = None
     R2_PUBLIC_DOMAIN: str | None = None
+    # multipart 업로드 파트 크기(MB) / 동시 업로드 파트 수
+    R2_MULTIPART_CHUNK_MB: int = 8
+    R2_MULTIPART_CONCURRENCY: int = 4
+    # 브라우저 -> R2 직접 업로드 (presigned PUT) 유효 시간 / 최대 크기(MB)
+    R2_PRESIGNED_EXPIRES_SECONDS: int = 600
+    R2_DIRECT_UPLOAD_MAX_MB: int = 500
+    # ========================================================
+
+    # ========================================================
+    # [추가] 업로드 백그라운드 처리 (OCR 작업 큐)
+    # ========================================================
+    # 업로드 파일 임시 저장 위치 (같은 컨테이너의 워커끼리 공유, 작업은 이 컨테이너 전용 큐로)
+    UPLOAD_SPOOL_DIR: str = "/tmp/chatpick-uploads"
+    # API 워커 프로세스당 작업 스레드 수 (0이면 큐 없이 요청 안에서 처리)
+    JOB_WORKER_CONCURRENCY: int = 2
+    # 워커 heartbeat 주기 (3배 동안 끊기면 처리 중이던 작업을 다른 워커가 다시 처리)
+    JOB_HEARTBEAT_SECONDS: float = 10.0
+    # 처리 도중 서버가 죽은 작업을 다시 시도하는 최대 횟수
+    JOB_MAX_ATTEMPTS: int = 3
+    # 종료 시 처리 중인 작업을 기다리는 시간 (초)
+    JOB_SHUTDOWN_GRACE_SECONDS: float = 25.0
+    # 이 시간(초)이 지나도 pending/processing인 파일은 실패 처리
+    JOB_STALE_SECONDS: int = 60 * 60
+    # 스크린샷 여러 장 한 번에 업로드할 때 최대 장수
+    OCR_BATCH_MAX_FILES: int = 50
+    # OCR 전 이미지 전처리 (디코딩/HEIC 변환 -> 축소 -> 흑백 -> JPEG 재압축)
+    OCR_IMAGE_PREPROCESS: bool = True
+    # OCR용으로 이미지 전체를 메모리에 읽으므로 이 크기(MB)까지만
+    OCR_IMAGE_MAX_MB: int = 30
+    OCR_IMAGE_MAX_WIDTH: int = 1280
+    OCR_IMAGE_GRAYSCALE: bool = True
+    OCR_IMAGE_JPEG_QUALITY: int = 90
+    # 동영상: 이 간격(초)마다 프레임을 뽑고 dHash 차이가 작은(거의 같은) 프레임은 버림
+    # (추출 실패 -> 기존처럼 동영상 전체를 Modal로 전송)
+    # 서로 다른 화면이 VIDEO_MAX_FRAMES장을 넘으면 일부만 분석하지 않고 파일을 실패 처리
+    VIDEO_FRAME_SAMPLE_SECONDS: float = 0.5
+    VIDEO_FRAME_DHASH_THRESHOLD: int = 6
+    VIDEO_MAX_FRAMES: int = 120
+    # 동영상 전체 전송은 파일을 통째로 메모리에 읽으므로 이 크기(MB)까지만 (넘으면 실패 처리)
+    VIDEO_FALLBACK_MAX_MB: int = 100
+    # 같은 파일(내용 해시) OCR 결과 Redis 캐시 유지 시간 (초)
+    OCR_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 30
+    # OCR 후 LLM 분석까지 미리 해둘지 여부
+    JOB_PREANALYZE_WITH_LLM: bool = False
+    # 추천 요청 시 처리 중인 파일을 기다리는 최대 시간 (초)
+    FILE_PROCESSING_WAIT_SECONDS: float = 120.0
+    FILE_PROCESSING_POLL_SECONDS: float = 1.0
+
+    # ========================================================
+    # [추가] 로그인 사용자 캐시 (get_current_user DB 조회 생략)
+    # ========================================================
+    # 프로세스 내부 LRU (Redis가 있으면 다른 워커의 무효화도 요청마다 버전으로 확인,
+    # 없으면 다른 워커의 수정/삭제는 이 시간 동안 반영되지 않으므로 짧게)
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    USER_CACHE_LOCAL_MAX_SIZE: int = 1024
+    # Redis 캐시 (수정/삭제 시 바로 지움)
+    USER_CACHE_TTL_SECONDS: int = 60
+    # 캐시 hit/miss 통계를 프로세스 안에서 모았다가 Redis에 반영하는 주기 (초)
+    USER_CACHE_STAT_FLUSH_SECONDS: float = 10.0
+
+    # ========================================================
+    # [추가] 비밀번호 해시(bcrypt) 전용 프로세스 풀
+    # ========================================================
+    # API 워커 프로세스당 bcrypt 프로세스 수 (0이면 요청 스레드에서 바로 계산)
+    PASSWORD_HASH_WORKERS: int = 2
+    # 처리 중 + 대기 중인 해시 작업이 이보다 많으면 바로 503 (로그인 폭주 차단)
+    PASSWORD_HASH_MAX_PENDING: int = 16
+
+    # ========================================================
+    # [추가] 외부 백엔드(Redis / R2 / Modal) 연결
     # ========================================================
+    # 워커 부팅 시에는 연결하지 않고 처음 사용할 때 연결
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 1.0
+    # 연결 실패 후 이 시간(초) 동안은 다시 시도하지 않고 바로 Redis 없이 동작
+    BACKEND_RETRY_SECONDS: float = 30.0
 
     FRONTEND_HOST: str = "http://localhost:5173"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
@@ -0,0 +1,55 @@
+import io
+
+import pillow_heif
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+# HEIC(아이폰 사진) 디코딩용
+pillow_heif.register_heif_opener()
+
+
+# ---------------------------------------------------------
+# [OCR 전처리] Modal로 보내는 이미지 크기 줄이기
+# ---------------------------------------------------------
+# 폰 스크린샷/사진은 해상도가 OCR에 필요한 것보다 훨씬 커서
+# 전송 시간과 Modal 연산 시간만 늘어남 -> 폭을 줄이고 흑백 JPEG로 다시 압축
+def prepare_image_for_ocr(content: bytes) -> bytes:
+    """
+    OCR용 이미지 정규화: 디코딩(HEIC 포함) -> EXIF 회전 반영 -> 최대 폭으로 축소
+    -> (설정 시) 흑백 -> JPEG 재압축.
+    전처리가 꺼져 있거나 실패하면 원본을 그대로 반환합니다.
+    """
+    if not settings.OCR_IMAGE_PREPROCESS:
+        return content
+
+    try:
+        with Image.open(io.BytesIO(content)) as source:
+            is_heif = source.format in ("HEIF", "HEIC")
+            image = ImageOps.exif_transpose(source)
+
+            max_width = settings.OCR_IMAGE_MAX_WIDTH
+            if image.width > max_width:
+                height = round(image.height * max_width / image.width)
+                image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+
+            image = image.convert("L" if settings.OCR_IMAGE_GRAYSCALE else "RGB")
+
+            out = io.BytesIO()
+            image.save(
+                out,
+                format="JPEG",
+                quality=settings.OCR_IMAGE_JPEG_QUALITY,
+                optimize=True,
+            )
+    except Exception as e:
+        print(f"⚠️ 이미지 전처리 실패 (원본 사용): {e}")
+        return content
+
+    prepared = out.getvalue()
+    # 이미 작은 이미지는 오히려 커질 수 있음 (HEIC는 호환성을 위해 항상 변환본 사용)
+    if len(prepared) >= len(content) and not is_heif:
+        return content
+
+    print(f"🖼️ [OCR Prep] {len(content) // 1024}KB -> {len(prepared) // 1024}KB")
+    return prepared
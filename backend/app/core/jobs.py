@@ -0,0 +1,722 @@
+import hashlib
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, cast
+
+import redis
+from sqlmodel import Session
+
+from app import crud
+from app.core.cache import (
+    acquire_lease,
+    get_redis_client,
+    record_cache_stat,
+    release_lease,
+)
+from app.core.config import settings
+from app.core.db import engine
+from app.core.llm import (
+    MODEL_VERSION,
+    PROMPT_VERSION,
+    AnalysisResult,
+    analyze_text_with_llm,
+)
+from app.core.ocr import (
+    OCR_VERSION,
+    VIDEO_EXTENSIONS,
+    run_ocr,
+    run_ocr_images,
+    run_video_ocr,
+    stitch_screenshot_texts,
+)
+from app.core.storage import (
+    content_addressed_key,
+    delete_file_from_r2,
+    download_fileobj_from_r2,
+    get_r2_object_size,
+    r2_public_url,
+    upload_fileobj_to_r2,
+)
+from app.models import File, FileStatus
+
+# ---------------------------------------------------------
+# [백그라운드 작업 큐] Redis list 기반
+# ---------------------------------------------------------
+# 업로드 요청은 파일을 디스크에 임시 저장(spool)하고 작업만 넣은 뒤 바로 응답.
+# 각 API 워커 프로세스 안의 작업 스레드들이 큐에서 꺼내 OCR -> R2 -> (선택) LLM 선분석 수행.
+# - spool 파일은 컨테이너 로컬 디스크라서, spool이 필요한 작업은 업로드 받은 인스턴스(호스트) 전용 큐로
+#   (같은 컨테이너의 워커끼리는 spool 디렉터리를 공유하므로 어느 워커가 꺼내도 처리 가능)
+# - R2에 직접 올라간 파일 작업은 공용 큐 (어느 인스턴스든 처리)
+# - 꺼낸 작업은 워커별 processing list로 옮겨두고 (BLMOVE) 끝나면 지움.
+#   워커 프로세스가 죽으면 heartbeat가 끊기고, 다른 프로세스가 processing list를 원래 큐로 되돌림.
+JOB_QUEUE_KEY = "jobs:file_processing"
+JOB_PROCESSING_PREFIX = "jobs:processing:"
+JOB_HEARTBEAT_PREFIX = "jobs:heartbeat:"
+# 죽은 워커의 processing list를 되돌리는 동안 잡는 lease
+# (JOB_PROCESSING_PREFIX 아래에 두면 scan_iter에 processing list로 같이 잡히므로 별도 prefix)
+JOB_REQUEUE_LOCK_PREFIX = "jobs:requeue_lock:"
+# file_id별 처리 시도 횟수 (서버가 계속 죽는 작업은 JOB_MAX_ATTEMPTS번 뒤에 실패 처리)
+JOB_ATTEMPTS_KEY = "jobs:attempts"
+# 오래된 pending/processing 파일 정리 주기 (초)
+STALE_SWEEP_INTERVAL_SECONDS = 600
+
+# 같은 내용(해시) 파일의 OCR 결과 텍스트 캐시: ocr_result:{OCR_VERSION}:{content_hash}
+# (R2 URL은 소유자별이라 캐시하지 않음 / OCR 파이프라인이 바뀌면 OCR_VERSION으로 분리)
+OCR_CACHE_PREFIX = "ocr_result:"
+CACHE_STAT_NAME = "ocr_result"
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+_HOSTNAME = socket.gethostname()
+_stop_event = threading.Event()
+_monitor_stop_event = threading.Event()
+_worker_threads: list[threading.Thread] = []
+_monitor_thread: threading.Thread | None = None
+
+
+def _instance_queue_key() -> str:
+    # 이 컨테이너에 spool된 파일을 처리하는 작업 큐
+    return f"{JOB_QUEUE_KEY}:host:{_HOSTNAME}"
+
+
+def _process_worker_id() -> str:
+    return f"{_HOSTNAME}:{os.getpid()}"
+
+
+def _heartbeat_key(worker_id: str) -> str:
+    return f"{JOB_HEARTBEAT_PREFIX}{worker_id}"
+
+
+def _new_content_digest() -> hashlib.blake2b:
+    return hashlib.blake2b(digest_size=32)
+
+
+def spool_upload(fileobj: BinaryIO) -> tuple[str, str]:
+    """
+    업로드 스트림을 spool 디렉터리에 청크 단위로 복사하면서 내용 해시(BLAKE2b)도 계산합니다.
+    반환: (spool 경로, content_hash)
+    """
+    os.makedirs(settings.UPLOAD_SPOOL_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=settings.UPLOAD_SPOOL_DIR)
+    digest = _new_content_digest()
+    with os.fdopen(fd, "wb") as out:
+        while chunk := fileobj.read(SPOOL_CHUNK_SIZE):
+            digest.update(chunk)
+            out.write(chunk)
+    return path, digest.hexdigest()
+
+
+def batch_content_hash(content_hashes: list[str]) -> str:
+    # 스크린샷 묶음의 해시 (같은 스크린샷들을 같은 순서로 다시 올리면 같은 값)
+    digest = _new_content_digest()
+    for content_hash in content_hashes:
+        digest.update(content_hash.encode())
+    return digest.hexdigest()
+
+
+def _hash_file(path: str) -> str:
+    digest = _new_content_digest()
+    with open(path, "rb") as f:
+        while chunk := f.read(SPOOL_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _spool_from_r2(object_key: str) -> str:
+    """R2에 직접 업로드된 객체를 spool 디렉터리로 스트리밍 다운로드"""
+    os.makedirs(settings.UPLOAD_SPOOL_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=settings.UPLOAD_SPOOL_DIR)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            download_fileobj_from_r2(object_key, out)
+    except Exception:
+        _remove_spool(path)
+        raise
+    return path
+
+
+def _remove_spool(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_spools(paths: list[str | None]) -> None:
+    for path in paths:
+        if path:
+            _remove_spool(path)
+
+
+def _ocr_cache_key(content_hash: str) -> str:
+    return f"{OCR_CACHE_PREFIX}{OCR_VERSION}:{content_hash}"
+
+
+def get_ocr_text(session: Session, content_hash: str) -> str | None:
+    """
+    같은 내용으로 이미 OCR한 텍스트 (누가 올렸든 재사용, 현재 OCR_VERSION 결과만).
+    Redis 캐시 -> DB 순서로 확인하고, 없으면 None.
+    """
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            # decode_responses=True 클라이언트라 str
+            cached = cast(str | None, redis_client.get(_ocr_cache_key(content_hash)))
+            record_cache_stat(CACHE_STAT_NAME, cached is not None)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            print(f"⚠️ Redis Read Error: {e}")
+
+    db_file = crud.get_processed_file_by_hash(
+        session=session, content_hash=content_hash, ocr_version=OCR_VERSION
+    )
+    if not db_file or db_file.extracted_text is None:
+        return None
+    # DB에 있으면 Redis 다시 채움
+    remember_ocr_text(content_hash, db_file.extracted_text)
+    return db_file.extracted_text
+
+
+def remember_ocr_text(content_hash: str, text: str) -> None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        redis_client.set(
+            _ocr_cache_key(content_hash), text, ex=settings.OCR_CACHE_TTL_SECONDS
+        )
+    except Exception as e:
+        print(f"⚠️ Redis Write Error: {e}")
+
+
+def get_processed_media(
+    session: Session, content_hash: str, owner_id: uuid.UUID
+) -> tuple[str, str | None] | None:
+    """
+    같은 내용으로 이미 처리된 파일의 (extracted_text, file_url).
+    텍스트는 다른 사용자의 결과도 재사용하지만, file_url은 같은 사용자가 올린 객체만 돌려줌
+    (다른 사용자의 파일 URL 노출 방지). 본인 객체가 없으면 file_url은 None, 처리된 적 없으면 None.
+    """
+    own_file = crud.get_processed_file_by_hash(
+        session=session,
+        content_hash=content_hash,
+        ocr_version=OCR_VERSION,
+        owner_id=owner_id,
+    )
+    if own_file and own_file.extracted_text is not None:
+        return own_file.extracted_text, own_file.file_url
+
+    extracted_text = get_ocr_text(session, content_hash)
+    return (extracted_text, None) if extracted_text is not None else None
+
+
+def _delete_unreferenced_object(file_url: str) -> None:
+    """
+    내용 기반 키는 같은 사용자의 다른 File이 같은 객체를 가리킬 수 있으므로
+    아무 File도 참조하지 않을 때만 R2에서 삭제.
+    """
+    with Session(engine) as session:
+        if crud.is_file_url_referenced(session=session, file_url=file_url):
+            print("♻️ [R2 Cleanup] 다른 파일이 사용 중인 객체라 삭제하지 않습니다.")
+            return
+    delete_file_from_r2(file_url)
+
+
+def enqueue_file_job(
+    *,
+    file_id: uuid.UUID,
+    filename: str,
+    content_type: str | None,
+    spool_path: str | None = None,
+    object_key: str | None = None,
+    content_hash: str | None = None,
+    batch: list[dict[str, str]] | None = None,
+) -> bool:
+    """
+    작업 큐에 넣기. Redis가 없거나 실패하면 False (호출한 쪽에서 동기 처리)
+    spool_path: API 서버로 올라온 파일 / object_key: 브라우저가 R2에 직접 올린 파일
+    batch: 스크린샷 여러 장 [{"spool_path", "filename", "content_hash"}, ...] (순서대로)
+    """
+    if settings.JOB_WORKER_CONCURRENCY <= 0:
+        return False
+    redis_client = get_redis_client()
+    if not redis_client:
+        return False
+    # spool 파일이 있는 작업은 이 인스턴스에서만 처리 가능
+    queue = _instance_queue_key() if spool_path or batch else JOB_QUEUE_KEY
+    job = {
+        "queue": queue,
+        "file_id": str(file_id),
+        "spool_path": spool_path,
+        "object_key": object_key,
+        "content_hash": content_hash,
+        "batch": batch,
+        "filename": filename,
+        "content_type": content_type,
+    }
+    try:
+        redis_client.rpush(queue, json.dumps(job))
+        return True
+    except Exception as e:
+        print(f"⚠️ Job Enqueue Error: {e}")
+        return False
+
+
+def _upload_to_r2(
+    path: str, filename: str, content_type: str | None, object_key: str | None = None
+) -> str | None:
+    """R2 업로드 (Optional Path). 실패해도 로그만 찍고 None 반환."""
+    try:
+        print("☁️ [R2 Start] 업로드 시작...")
+        # 파일을 통째로 읽지 않고 디스크에서 파트 단위로 스트리밍 업로드
+        with open(path, "rb") as f:
+            uploaded_url = upload_fileobj_to_r2(f, filename, content_type, object_key)
+
+        if uploaded_url:
+            print(f"✅ [R2 Success] 업로드 완료: {uploaded_url}")
+        else:
+            print("⚠️ [R2 Warning] URL 생성 실패 (설정 확인 필요)")
+        return uploaded_url
+
+    except Exception as e:
+        # R2가 죽어도 프로세스는 계속된다
+        print(f"❌ [R2 Error] 업로드 실패 (무시하고 진행): {e}")
+        return None
+
+
+def process_media(
+    path: str,
+    filename: str,
+    content_type: str | None,
+    content_hash: str | None = None,
+    owner_id: uuid.UUID | None = None,
+    extracted_text: str | None = None,
+) -> tuple[str, str | None]:
+    """
+    spool된 이미지/동영상 처리: Modal OCR (필수) + R2 업로드 (선택)를 동시에 실행.
+    R2 업로드는 OCR 결과와 무관하므로 병렬로 돌려서 지연시간을 max(OCR, 업로드)로 줄임.
+    OCR이 실패하면 이미 올라간 R2 객체를 지우고 예외를 올림 (기존 "OCR 실패 시 저장 안 함" 유지).
+    content_hash / owner_id가 있으면 소유자별 내용 기반 키로 올리고 (이미 있으면 업로드 생략) 결과를 캐시함.
+    extracted_text: 같은 내용의 OCR 결과가 이미 있으면 OCR 없이 업로드만.
+    반환: (extracted_text, uploaded_url)
+    """
+    object_key = (
+        content_addressed_key(owner_id, content_hash, filename)
+        if content_hash and owner_id
+        else None
+    )
+    uploaded_url = (
+        r2_public_url(object_key)
+        if object_key and get_r2_object_size(object_key) is not None
+        else None
+    )
+    if uploaded_url:
+        print("♻️ [R2 Skip] 같은 내용의 파일이 이미 업로드되어 있습니다.")
+
+    if extracted_text is not None:
+        # 다른 파일의 OCR 결과 재사용 -> 이 사용자의 객체만 올림
+        print("♻️ [Dedup] 같은 파일의 OCR 결과를 재사용합니다.")
+        if uploaded_url:
+            return extracted_text, uploaded_url
+        return extracted_text, _upload_to_r2(path, filename, content_type, object_key)
+
+    if uploaded_url:
+        # 같은 객체가 이미 R2에 있음 -> OCR만
+        extracted_text = _run_ocr_from_path(path, filename)
+        if content_hash:
+            remember_ocr_text(content_hash, extracted_text)
+        return extracted_text, uploaded_url
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # [Optional Path] R2 업로드는 별도 스레드에서
+        upload_future = executor.submit(
+            _upload_to_r2, path, filename, content_type, object_key
+        )
+
+        # [Critical Path] Modal 분석은 현재 스레드에서
+        try:
+            extracted_text = _run_ocr_from_path(path, filename)
+        except Exception:
+            uploaded_url = upload_future.result()
+            if uploaded_url:
+                print("🧹 [R2 Cleanup] OCR 실패로 업로드한 파일을 삭제합니다.")
+                _delete_unreferenced_object(uploaded_url)
+            raise
+
+        uploaded_url = upload_future.result()
+
+    if content_hash:
+        remember_ocr_text(content_hash, extracted_text)
+    return extracted_text, uploaded_url
+
+
+def _run_ocr_from_path(path: str, filename: str) -> str:
+    """
+    spool 파일로 OCR. 동영상은 파일 전체를 읽지 않고 디스크에서 프레임만 샘플링 (run_video_ocr).
+    이미지는 Modal에 bytes로 보내야 해서 한 번 전체를 읽으므로 OCR_IMAGE_MAX_MB 이하만 받음.
+    -> 업로드(multipart)와 함께 파일 크기와 무관하게 요청당 메모리 상한이 정해짐
+    """
+    if filename.endswith(VIDEO_EXTENSIONS):
+        # 동영상은 디스크에서 바로 프레임 추출
+        return run_video_ocr(path, filename)
+
+    return run_ocr(_read_image(path), filename)
+
+
+def _read_image(path: str) -> bytes:
+    if os.path.getsize(path) > settings.OCR_IMAGE_MAX_MB * 1024 * 1024:
+        raise Exception(f"이미지는 {settings.OCR_IMAGE_MAX_MB}MB까지만 분석할 수 있습니다.")
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def process_image_batch(
+    session: Session, images: list[dict[str, str]], content_hash: str
+) -> str:
+    """
+    스크린샷 여러 장 처리: 처리된 적 없는 이미지만 Modal에서 동시에 OCR 하고
+    순서대로 이어 붙임 (겹치는 줄 제거). R2 업로드는 하지 않음.
+    content_hash: 묶음 전체의 해시 (batch_content_hash)
+    반환: extracted_text
+    """
+    texts = [get_ocr_text(session, image["content_hash"]) for image in images]
+
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if missing:
+        contents = [_read_image(images[i]["spool_path"]) for i in missing]
+        for i, text in zip(missing, run_ocr_images(contents), strict=True):
+            texts[i] = text
+            remember_ocr_text(images[i]["content_hash"], text)
+
+    extracted_text = stitch_screenshot_texts([text for text in texts if text is not None])
+    remember_ocr_text(content_hash, extracted_text)
+    return extracted_text
+
+
+def process_uploaded_object(
+    session: Session, object_key: str, filename: str
+) -> tuple[str, str]:
+    """
+    R2에 직접 업로드된 파일 처리: R2에서 내려받아 OCR만 수행 (업로드는 이미 끝남).
+    같은 내용의 파일이 이미 처리됐으면 OCR도 생략.
+    OCR이 실패하면 R2 객체를 지우고 예외를 올림 (process_media와 같은 정책)
+    반환: (extracted_text, content_hash)
+    """
+    try:
+        spool_path = _spool_from_r2(object_key)
+    except Exception:
+        delete_file_from_r2(r2_public_url(object_key))
+        raise
+
+    try:
+        content_hash = _hash_file(spool_path)
+        extracted_text = get_ocr_text(session, content_hash)
+        if extracted_text is not None:
+            print("♻️ [Dedup] 같은 파일의 OCR 결과를 재사용합니다.")
+            return extracted_text, content_hash
+
+        extracted_text = _run_ocr_from_path(spool_path, filename)
+        remember_ocr_text(content_hash, extracted_text)
+        return extracted_text, content_hash
+    except Exception:
+        print("🧹 [R2 Cleanup] OCR 실패로 업로드된 파일을 삭제합니다.")
+        delete_file_from_r2(r2_public_url(object_key))
+        raise
+    finally:
+        _remove_spool(spool_path)
+
+
+def _preanalyze(session: Session, db_file: File, extracted_text: str) -> None:
+    """OCR이 끝난 파일을 미리 LLM 분석해서 저장 (추천 요청 시 바로 응답)"""
+
+    def load_stored() -> AnalysisResult | None:
+        stored = crud.get_file_analysis(
+            session=session,
+            file_id=db_file.id,
+            prompt_version=PROMPT_VERSION,
+            model_version=MODEL_VERSION,
+        )
+        return AnalysisResult.model_validate(stored.result) if stored else None
+
+    def store(result: AnalysisResult) -> None:
+        crud.save_file_analysis(
+            session=session,
+            file_id=db_file.id,
+            prompt_version=PROMPT_VERSION,
+            model_version=MODEL_VERSION,
+            result=result.model_dump(),
+        )
+
+    try:
+        analyze_text_with_llm(extracted_text, load_stored=load_stored, store=store)
+    except Exception as e:
+        # 선분석 실패는 치명적이지 않음 (추천 요청 시 다시 분석)
+        print(f"⚠️ [Job] LLM 선분석 실패: {e}")
+
+
+def run_file_job(job: dict[str, Any]) -> None:
+    spool_path = job.get("spool_path")
+    object_key = job.get("object_key")
+    content_hash = job.get("content_hash")
+    batch = job.get("batch")
+    spool_paths = [image["spool_path"] for image in batch] if batch else [spool_path]
+    with Session(engine) as session:
+        db_file = session.get(File, uuid.UUID(job["file_id"]))
+        if not db_file:
+            _remove_spools(spool_paths)
+            return
+
+        crud.update_file(
+            session=session, db_file=db_file, file_data={"status": FileStatus.PROCESSING}
+        )
+        try:
+            # 대기 중에 같은 내용의 파일 처리가 끝났을 수 있음
+            processed = (
+                get_processed_media(session, content_hash, db_file.owner_id)
+                if content_hash
+                else None
+            )
+            if processed and (processed[1] or batch):
+                extracted_text, uploaded_url = processed
+            elif batch:
+                extracted_text = process_image_batch(
+                    session, batch, job["content_hash"]
+                )
+                uploaded_url = None
+            elif object_key:
+                extracted_text, content_hash = process_uploaded_object(
+                    session, object_key, job["filename"]
+                )
+                uploaded_url = r2_public_url(object_key)
+            else:
+                # OCR 결과만 있으면 (다른 사용자의 파일) 이 사용자의 객체만 업로드
+                extracted_text, uploaded_url = process_media(
+                    job["spool_path"],
+                    job["filename"],
+                    job["content_type"],
+                    content_hash,
+                    owner_id=db_file.owner_id,
+                    extracted_text=processed[0] if processed else None,
+                )
+        except Exception as e:
+            print(f"❌ [Job Error] {job['filename']} 처리 실패: {e}")
+            crud.update_file(
+                session=session,
+                db_file=db_file,
+                file_data={"status": FileStatus.FAILED, "error": f"AI 분석 실패: {e}"},
+            )
+            return
+        finally:
+            _remove_spools(spool_paths)
+
+        crud.update_file(
+            session=session,
+            db_file=db_file,
+            file_data={
+                "extracted_text": extracted_text,
+                "file_url": uploaded_url,
+                "content_hash": content_hash,
+                "ocr_version": OCR_VERSION,
+                "status": FileStatus.DONE,
+                "error": None,
+            },
+        )
+
+        if settings.JOB_PREANALYZE_WITH_LLM and extracted_text:
+            _preanalyze(session, db_file, extracted_text)
+
+
+def _fail_job(job: dict[str, Any], error: str) -> None:
+    batch = job.get("batch")
+    if batch:
+        _remove_spools([image["spool_path"] for image in batch])
+    else:
+        _remove_spools([job.get("spool_path")])
+    with Session(engine) as session:
+        db_file = session.get(File, uuid.UUID(job["file_id"]))
+        if db_file:
+            crud.update_file(
+                session=session,
+                db_file=db_file,
+                file_data={"status": FileStatus.FAILED, "error": error},
+            )
+
+
+def _run_claimed_job(redis_client: Any, item: str) -> None:
+    job = json.loads(item)
+    attempts = redis_client.hincrby(JOB_ATTEMPTS_KEY, job["file_id"], 1)
+    if attempts > settings.JOB_MAX_ATTEMPTS:
+        print(f"❌ [Job Error] {job['filename']} 처리 중 서버가 {attempts - 1}번 중단되어 포기합니다.")
+        _fail_job(job, "처리 중 서버가 재시작되어 실패했습니다. 다시 업로드해주세요.")
+    else:
+        run_file_job(job)
+    redis_client.hdel(JOB_ATTEMPTS_KEY, job["file_id"])
+
+
+def _claim_job(redis_client: redis.Redis, processing_key: str) -> str | None:
+    """
+    이 인스턴스에 spool된 작업 먼저 (최대 1초 대기), 없으면 공용 큐에서 하나 꺼내
+    processing list로 옮김 (처리 중에 죽으면 _requeue_orphaned_jobs가 되돌림)
+    """
+    item = redis_client.blmove(
+        _instance_queue_key(), processing_key, 1, "LEFT", "RIGHT"
+    )
+    if item is None:
+        item = redis_client.lmove(JOB_QUEUE_KEY, processing_key, "LEFT", "RIGHT")
+    # decode_responses=True 클라이언트라 str
+    return cast(str | None, item)
+
+
+def _worker_loop(processing_key: str) -> None:
+    while not _stop_event.is_set():
+        # Redis가 아직/잠시 연결 안 됨 -> 큐 대신 동기 처리 중이므로 기다렸다가 다시 확인
+        redis_client = get_redis_client()
+        if not redis_client:
+            _stop_event.wait(1)
+            continue
+        try:
+            item = _claim_job(redis_client, processing_key)
+        except Exception as e:
+            print(f"⚠️ Job Queue Error: {e}")
+            _stop_event.wait(1)
+            continue
+        if not item:
+            continue
+
+        try:
+            _run_claimed_job(redis_client, item)
+        except Exception as e:
+            print(f"❌ [Job Error] 작업 처리 중 예외: {e}")
+        finally:
+            try:
+                redis_client.lrem(processing_key, 1, item)
+            except Exception as e:
+                print(f"⚠️ Job Queue Error: {e}")
+
+
+def _requeue_orphaned_jobs(redis_client: Any) -> None:
+    """heartbeat가 끊긴 (죽은) 워커 프로세스의 processing list를 원래 큐로 되돌림"""
+    for processing_key in redis_client.scan_iter(match=f"{JOB_PROCESSING_PREFIX}*"):
+        # processing list가 아닌 키 (예전 버전이 이 prefix 아래에 만든 lease 등)는 건너뜀
+        if redis_client.type(processing_key) != "list":
+            continue
+        worker_slot = processing_key[len(JOB_PROCESSING_PREFIX):]
+        worker_id = worker_slot.rsplit(":", 1)[0]
+        if redis_client.exists(_heartbeat_key(worker_id)):
+            continue
+
+        # 여러 프로세스가 동시에 같은 list를 되돌리지 않도록
+        lock_key = f"{JOB_REQUEUE_LOCK_PREFIX}{worker_slot}"
+        token = acquire_lease(lock_key, settings.JOB_HEARTBEAT_SECONDS)
+        if not token:
+            continue
+        try:
+            while (item := redis_client.lindex(processing_key, 0)) is not None:
+                job = json.loads(item)
+                redis_client.lmove(
+                    processing_key, job.get("queue") or JOB_QUEUE_KEY, "LEFT", "RIGHT"
+                )
+                print(f"♻️ [Job] 중단된 작업을 다시 대기열에 넣었습니다: {job['filename']}")
+        finally:
+            release_lease(lock_key, token)
+
+
+def _fail_stale_files() -> None:
+    """
+    큐에서 사라진 작업 정리 (Redis 데이터 유실, 업로드 받은 인스턴스가 없어짐 등)
+    JOB_STALE_SECONDS가 지나도 pending/processing인 파일은 실패 처리.
+    """
+    created_before = datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+    with Session(engine) as session:
+        count = crud.fail_stale_files(
+            session=session,
+            created_before=created_before,
+            error="처리 시간이 초과되었습니다. 다시 업로드해주세요.",
+        )
+    if count:
+        print(f"🧹 [Job] 오래 처리되지 않은 파일 {count}개를 실패 처리했습니다.")
+
+
+def _monitor_loop() -> None:
+    """이 프로세스의 heartbeat 갱신 + 죽은 워커 작업 되돌리기 + 오래된 파일 정리"""
+    last_sweep = 0.0
+    while not _monitor_stop_event.is_set():
+        redis_client = get_redis_client()
+        if redis_client:
+            try:
+                redis_client.set(
+                    _heartbeat_key(_process_worker_id()),
+                    "1",
+                    px=int(settings.JOB_HEARTBEAT_SECONDS * 3 * 1000),
+                )
+                _requeue_orphaned_jobs(redis_client)
+            except Exception as e:
+                print(f"⚠️ Job Queue Error: {e}")
+
+        if time.monotonic() - last_sweep >= STALE_SWEEP_INTERVAL_SECONDS:
+            last_sweep = time.monotonic()
+            try:
+                _fail_stale_files()
+            except Exception as e:
+                print(f"⚠️ [Job] 오래된 파일 정리 실패: {e}")
+
+        _monitor_stop_event.wait(settings.JOB_HEARTBEAT_SECONDS)
+
+
+def start_job_workers() -> None:
+    # Redis 연결은 각 워커가 처음 큐를 볼 때 (부팅 시 연결을 기다리지 않음)
+    global _monitor_thread
+    if settings.JOB_WORKER_CONCURRENCY <= 0:
+        return
+    _stop_event.clear()
+    _monitor_stop_event.clear()
+    _monitor_thread = threading.Thread(
+        target=_monitor_loop, name="file-job-monitor", daemon=True
+    )
+    _monitor_thread.start()
+    worker_id = _process_worker_id()
+    for i in range(settings.JOB_WORKER_CONCURRENCY):
+        thread = threading.Thread(
+            target=_worker_loop,
+            args=(f"{JOB_PROCESSING_PREFIX}{worker_id}:{i}",),
+            name=f"file-job-worker-{i}",
+            daemon=True,
+        )
+        thread.start()
+        _worker_threads.append(thread)
+    print(f"👷 파일 처리 워커 {settings.JOB_WORKER_CONCURRENCY}개 시작")
+
+
+def stop_job_workers() -> bool:
+    """
+    새 작업은 더 꺼내지 않고, 처리 중인 작업은 JOB_SHUTDOWN_GRACE_SECONDS까지 기다림.
+    모두 끝났으면 True. 끝나지 않은 작업은 processing list에 남아 있다가
+    heartbeat가 끊긴 뒤 다른 프로세스가 다시 처리함.
+    """
+    global _monitor_thread
+    _stop_event.set()
+    deadline = time.monotonic() + settings.JOB_SHUTDOWN_GRACE_SECONDS
+    for thread in _worker_threads:
+        thread.join(timeout=max(deadline - time.monotonic(), 0))
+    stopped = not any(thread.is_alive() for thread in _worker_threads)
+    _worker_threads.clear()
+
+    _monitor_stop_event.set()
+    if _monitor_thread:
+        _monitor_thread.join(timeout=5)
+        _monitor_thread = None
+    if not stopped:
+        print("⚠️ 끝나지 않은 파일 처리 작업은 다른 워커가 다시 처리합니다.")
+    elif redis_client := get_redis_client():
+        try:
+            redis_client.delete(_heartbeat_key(_process_worker_id()))
+        except Exception as e:
+            print(f"⚠️ Job Queue Error: {e}")
+    return stopped
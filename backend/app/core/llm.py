@@ -1,34 +1,49 @@
-import os
+import asyncio
 import hashlib
-import redis
+import math
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI
+from openai.types.chat import (
+    ChatCompletionMessageParam,
+    ParsedChatCompletionMessage,
+)
 from pydantic import BaseModel, Field
-from openai import OpenAI
+
+from app.core.cache import (
+    acquire_lease,
+    acquire_lease_async,
+    get_async_redis_client,
+    get_redis_client,
+    record_cache_stat,
+    record_cache_stat_async,
+    release_lease,
+    release_lease_async,
+    renew_lease,
+    renew_lease_async,
+)
+from app.core.chat_chunking import split_chat_log
+from app.core.chat_preprocess import (
+    PreprocessedChat,
+    normalize_for_cache_key,
+    preprocess_chat_log,
+)
 from app.core.config import settings
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
 
 # ---------------------------------------------------------
 # [버전 관리]
 # ---------------------------------------------------------
-PROMPT_VERSION = "v1"  # 프롬프트 변경 시 이것만 올리면 됨
+PROMPT_VERSION = "v2"  # 프롬프트 변경 시 이것만 올리면 됨 (v2: 전처리된 transcript 입력)
 MODEL_VERSION = "gpt-5.1"
 
-# ---------------------------------------------------------
-# [Redis 클라이언트 설정]
-# ---------------------------------------------------------
-# Docker 환경에서는 'redis', 로컬/기타 환경 대비 환경변수 지원
-redis_host = os.getenv("REDIS_HOST", "redis")
-
-try:
-    # decode_responses=True: 데이터를 bytes가 아닌 str로 자동 변환
-    redis_client = redis.Redis(host=redis_host, port=6379, db=0, decode_responses=True)
-    # 연결 테스트 (핑) - 실패 시 예외 발생하여 redis_client를 None으로 처리
-    redis_client.ping()
-    print(f"✅ Redis connected at {redis_host}")
-except Exception as e:
-    print(f"⚠️ Redis connection failed: {e}")
-    redis_client = None
-
-
 # ---------------------------------------------------------
 # [데이터 모델 정의]
 # ---------------------------------------------------------
@@ -54,42 +69,8 @@ class AnalysisResult(BaseModel):
     courses: list[CourseStep]
 
 
-def analyze_text_with_llm(text: str) -> AnalysisResult:
-    """
-    카톡 대화를 분석하여 메타데이터, 상세 페르소나(선호/비선호), 3단계 추천 코스를 반환합니다.
-    (Redis 캐싱 적용: 동일한 텍스트 요청 시 OpenAI 호출 없이 반환)
-    """
-    
-    if not settings.OPENAI_API_KEY:
-        raise ValueError("❌ OpenAI API Key가 설정되지 않았습니다! .env 파일을 확인해주세요.")
-
-    # ---------------------------------------------------------
-    # [Cache Check] Redis 조회
-    # ---------------------------------------------------------
-    cache_key = ""
-    if redis_client:
-        try:
-            # 버전 정보를 포함한 캐시 키 생성
-            cache_input = f"{PROMPT_VERSION}:{MODEL_VERSION}:{text}"
-            text_hash = hashlib.md5(cache_input.encode('utf-8')).hexdigest()
-            cache_key = f"llm_analysis:{text_hash}"
-            
-            cached_data = redis_client.get(cache_key)
-            if cached_data:
-                print(f"⚡️ [Redis Hit] 캐시된 LLM 결과를 반환합니다. (Key: {cache_key})")
-                # JSON 문자열을 Pydantic 객체로 복원
-                return AnalysisResult.model_validate_json(cached_data)
-        except Exception as e:
-            print(f"⚠️ Redis Read Error: {e}")
-
-    # ---------------------------------------------------------
-    # [LLM Call] OpenAI 호출 (Cache Miss)
-    # ---------------------------------------------------------
-    print("🤖 [Redis Miss] OpenAI API 호출 중...")
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
-    # 프롬프트 원본 유지
-    system_prompt = """
+# 프롬프트 원본 유지
+SYSTEM_PROMPT = """
     Role: You are a "Search Query Architect" & "Persona Analyst".
     
     Task:
@@ -156,26 +137,515 @@ def analyze_text_with_llm(text: str) -> AnalysisResult:
     - Output language: Korean.
     """
 
-    completion = client.beta.chat.completions.parse(
-        model="gpt-5.1",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": f"Chat Log:\n\n{text}"},
-        ],
+
+# 동일한 캐시 키에 대한 동시 분석 요청을 하나로 합침 (프로세스 내부)
+_llm_flight = SingleFlight()
+_llm_flight_async = AsyncSingleFlight()
+
+# ---------------------------------------------------------
+# [OpenAI 클라이언트] 프로세스 단위로 재사용 (커넥션 풀 공유)
+# ---------------------------------------------------------
+# 앱 시작 시 init_llm_clients(), 종료 시 close_llm_clients() (app/main.py lifespan)
+_openai_client: OpenAI | None = None
+_async_openai_client: AsyncOpenAI | None = None
+
+
+def get_openai_client() -> OpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(
+            api_key=settings.OPENAI_API_KEY, timeout=settings.OPENAI_TIMEOUT_SECONDS
+        )
+    return _openai_client
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    global _async_openai_client
+    if _async_openai_client is None:
+        _async_openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.OPENAI_TIMEOUT_SECONDS,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+                )
+            ),
+        )
+    return _async_openai_client
+
+
+def init_llm_clients() -> None:
+    # API 키가 없으면 분석 시점에 에러를 내도록 클라이언트 생성을 미룸
+    if settings.OPENAI_API_KEY:
+        get_async_openai_client()
+
+
+async def close_llm_clients() -> None:
+    global _openai_client, _async_openai_client
+    if _openai_client is not None:
+        _openai_client.close()
+        _openai_client = None
+    if _async_openai_client is not None:
+        await _async_openai_client.close()
+        _async_openai_client = None
+
+
+CACHE_STAT_NAME = "llm_analysis"
+
+
+def _get_cache_key(text: str) -> str:
+    # 버전 정보 + 정규화된 대화 내용으로 캐시 키 생성
+    # (공백/타임스탬프만 다른 재업로드도 같은 키, blake2b는 md5보다 빠름)
+    cache_input = f"{PROMPT_VERSION}:{MODEL_VERSION}:{normalize_for_cache_key(text)}"
+    text_hash = hashlib.blake2b(cache_input.encode('utf-8'), digest_size=16).hexdigest()
+    return f"llm_analysis:{text_hash}"
+
+
+def _read_cache(cache_key: str) -> AnalysisResult | None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+    try:
+        cached_data = redis_client.get(cache_key)
+        if cached_data:
+            # JSON 문자열을 Pydantic 객체로 복원
+            return AnalysisResult.model_validate_json(cached_data)
+    except Exception as e:
+        print(f"⚠️ Redis Read Error: {e}")
+    return None
+
+
+def _write_cache(cache_key: str, result: AnalysisResult) -> None:
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        # Pydantic 객체를 JSON 문자열로 변환하여 저장 (TTL: 24시간)
+        redis_client.setex(cache_key, 86400, result.model_dump_json())
+        print("💾 [Redis Saved] 결과를 캐시에 저장했습니다. (TTL: 24h)")
+    except Exception as e:
+        print(f"⚠️ Redis Write Error: {e}")
+
+
+async def _read_cache_async(cache_key: str) -> AnalysisResult | None:
+    async_redis_client = await get_async_redis_client()
+    if not async_redis_client:
+        return None
+    try:
+        cached_data = await async_redis_client.get(cache_key)
+        if cached_data:
+            return AnalysisResult.model_validate_json(cached_data)
+    except Exception as e:
+        print(f"⚠️ Redis Read Error: {e}")
+    return None
+
+
+async def _write_cache_async(cache_key: str, result: AnalysisResult) -> None:
+    async_redis_client = await get_async_redis_client()
+    if not async_redis_client:
+        return
+    try:
+        await async_redis_client.setex(cache_key, 86400, result.model_dump_json())
+        print("💾 [Redis Saved] 결과를 캐시에 저장했습니다. (TTL: 24h)")
+    except Exception as e:
+        print(f"⚠️ Redis Write Error: {e}")
+
+
+def _build_messages(text: str) -> list[ChatCompletionMessageParam]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"Chat Log:\n\n{text}"},
+    ]
+
+
+def _parsed_result(
+    message: ParsedChatCompletionMessage[AnalysisResult],
+) -> AnalysisResult:
+    # 모델이 응답을 거부(refusal)하면 parsed가 비어 있음 -> 캐시/DB에 None이 들어가지 않도록 에러 처리
+    if message.parsed is None:
+        raise ValueError(f"❌ LLM 응답을 해석하지 못했습니다: {message.refusal}")
+    return message.parsed
+
+
+def _call_llm(text: str) -> AnalysisResult:
+    completion = get_openai_client().beta.chat.completions.parse(
+        model=MODEL_VERSION,
+        messages=_build_messages(text),
         response_format=AnalysisResult,
     )
 
-    result = completion.choices[0].message.parsed
+    return _parsed_result(completion.choices[0].message)
+
+
+async def _call_llm_async(text: str) -> AnalysisResult:
+    completion = await get_async_openai_client().beta.chat.completions.parse(
+        model=MODEL_VERSION,
+        messages=_build_messages(text),
+        response_format=AnalysisResult,
+    )
+
+    return _parsed_result(completion.choices[0].message)
+
+
+# ---------------------------------------------------------
+# [Map-Reduce] 긴 대화 분할 분석
+# ---------------------------------------------------------
+# 대화가 LLM_CHUNK_MAX_CHARS를 넘으면 청크별로 병렬 분석(map)한 뒤
+# 페르소나/메타데이터를 합치고(merge), 합친 요약으로 코스만 다시 생성(reduce)
+
+def _unique(items: list[str]) -> list[str]:
+    return list(dict.fromkeys(item.strip() for item in items if item.strip()))
+
+
+def _merge_results(results: list[AnalysisResult]) -> AnalysisResult:
+    """
+    청크별 분석 결과를 하나로 합칩니다.
+    - 페르소나: 이름 기준으로 합치고 likes/dislikes는 순서 유지 + 중복 제거
+    - 지역: 가장 많이 나온 값 / 인원: 합쳐진 참여자 수
+    - 코스: 마지막 청크 결과 (reduce 단계에서 다시 생성)
+    """
+    personas: dict[str, Persona] = {}
+    for result in results:
+        for persona in result.personas:
+            merged = personas.get(persona.name)
+            if merged is None:
+                personas[persona.name] = Persona(
+                    name=persona.name,
+                    likes=_unique(persona.likes),
+                    dislikes=_unique(persona.dislikes),
+                )
+            else:
+                merged.likes = _unique(merged.likes + persona.likes)
+                merged.dislikes = _unique(merged.dislikes + persona.dislikes)
+
+    locations = Counter(
+        result.metadata.location for result in results if result.metadata.location
+    )
+    location = locations.most_common(1)[0][0] if locations else ""
+    group_name = f"친구 {len(personas)}인" if personas else results[0].metadata.group_name
+
+    return AnalysisResult(
+        metadata=Metadata(
+            location=location, group_name=group_name, date=results[0].metadata.date
+        ),
+        personas=list(personas.values()),
+        courses=results[-1].courses,
+    )
+
+
+def _build_merged_summary(merged: AnalysisResult) -> str:
+    """reduce 단계에서 대화 로그 대신 넘기는 요약문"""
+    lines = [
+        "(긴 대화를 나눠서 분석한 결과 요약입니다)",
+        f"장소: {merged.metadata.location}",
+        f"인원: {merged.metadata.group_name}",
+    ]
+    for persona in merged.personas:
+        lines.append(
+            f"{persona.name} : 좋아함({', '.join(persona.likes)}) / "
+            f"싫어함({', '.join(persona.dislikes)})"
+        )
+    return "\n".join(lines)
+
+
+def _reduce(merged: AnalysisResult, reduced: AnalysisResult) -> AnalysisResult:
+    # 코스만 요약 기반 결과를 쓰고, 페르소나/메타데이터는 병합 결과 유지
+    return AnalysisResult(
+        metadata=merged.metadata, personas=merged.personas, courses=reduced.courses
+    )
+
+
+def _analyze_uncached(text: str) -> AnalysisResult:
+    chunks = split_chat_log(text, settings.LLM_CHUNK_MAX_CHARS)
+    if len(chunks) == 1:
+        return _call_llm(text)
+
+    print(f"✂️ 긴 대화 감지: {len(chunks)}개 청크로 나눠서 분석합니다.")
+    with ThreadPoolExecutor(max_workers=settings.LLM_CHUNK_CONCURRENCY) as executor:
+        results = list(executor.map(_call_llm, chunks))
+
+    merged = _merge_results(results)
+    return _reduce(merged, _call_llm(_build_merged_summary(merged)))
+
+
+async def _analyze_uncached_async(text: str) -> AnalysisResult:
+    chunks = split_chat_log(text, settings.LLM_CHUNK_MAX_CHARS)
+    if len(chunks) == 1:
+        return await _call_llm_async(text)
+
+    print(f"✂️ 긴 대화 감지: {len(chunks)}개 청크로 나눠서 분석합니다.")
+    semaphore = asyncio.Semaphore(settings.LLM_CHUNK_CONCURRENCY)
+
+    async def analyze_chunk(chunk: str) -> AnalysisResult:
+        async with semaphore:
+            return await _call_llm_async(chunk)
+
+    results = await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks))
+
+    merged = _merge_results(list(results))
+    return _reduce(merged, await _call_llm_async(_build_merged_summary(merged)))
+
+
+def _with_participants(result: AnalysisResult, participants: list[str]) -> AnalysisResult:
+    # 전처리에서 센 정확한 참여자 수로 인원 덮어쓰기 (LLM 추정보다 우선)
+    if participants:
+        result.metadata.group_name = f"친구 {len(participants)}인"
+    return result
+
+
+def _singleflight_wait_seconds(text: str) -> float:
+    """
+    대기자가 리더의 결과를 기다리는 최대 시간.
+    리더의 LLM 호출 라운드 수(청크 map을 LLM_CHUNK_CONCURRENCY개씩 + reduce 1회)에 비례.
+    """
+    chunks = len(split_chat_log(text, settings.LLM_CHUNK_MAX_CHARS))
+    rounds = 1 if chunks == 1 else math.ceil(chunks / settings.LLM_CHUNK_CONCURRENCY) + 1
+    return settings.LLM_SINGLEFLIGHT_WAIT_SECONDS * rounds
+
+
+@contextmanager
+def _lease_heartbeat(lock_key: str, token: str | None) -> Iterator[None]:
+    """리더가 분석하는 동안 lease를 연장 (청크가 많아 오래 걸려도 다른 워커가 중복 호출하지 않도록)"""
+    if not token:
+        yield
+        return
+
+    stop_event = threading.Event()
+    ttl = settings.LLM_SINGLEFLIGHT_LEASE_SECONDS
+
+    def renew() -> None:
+        while not stop_event.wait(ttl / 3):
+            try:
+                if not renew_lease(lock_key, token, ttl):
+                    print(f"⚠️ [Single-flight] lease를 잃었습니다. (Key: {lock_key})")
+                    return
+            except Exception as e:
+                print(f"⚠️ Redis Lease Renew Error: {e}")
+
+    thread = threading.Thread(target=renew, name="llm-lease-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop_event.set()
+        thread.join()
+
+
+@asynccontextmanager
+async def _lease_heartbeat_async(lock_key: str, token: str | None) -> AsyncIterator[None]:
+    if not token:
+        yield
+        return
+
+    ttl = settings.LLM_SINGLEFLIGHT_LEASE_SECONDS
+
+    async def renew() -> None:
+        while True:
+            await asyncio.sleep(ttl / 3)
+            try:
+                if not await renew_lease_async(lock_key, token, ttl):
+                    print(f"⚠️ [Single-flight] lease를 잃었습니다. (Key: {lock_key})")
+                    return
+            except Exception as e:
+                print(f"⚠️ Redis Lease Renew Error: {e}")
+
+    task = asyncio.create_task(renew())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+def _analyze_as_leader(
+    chat: PreprocessedChat,
+    cache_key: str,
+    store: Callable[[AnalysisResult], None] | None = None,
+) -> AnalysisResult:
+    """
+    워커 간 중복 호출 방지 (Redis lease).
+    lease를 잡은 워커만 OpenAI를 호출하고, 나머지는 캐시에 결과가 올라올 때까지 기다림.
+    리더는 분석하는 동안 lease를 연장하고, 리더가 죽어서 lease가 만료되면 대기자 중 하나가 이어받음.
+    """
+    lock_key = f"{cache_key}:lock"
+    deadline = time.monotonic() + _singleflight_wait_seconds(chat.transcript)
+    token = None
+
+    while get_redis_client() and time.monotonic() < deadline:
+        try:
+            token = acquire_lease(lock_key, settings.LLM_SINGLEFLIGHT_LEASE_SECONDS)
+        except Exception as e:
+            print(f"⚠️ Redis Lease Error: {e}")
+            break
+        if token:
+            break
+
+        # 다른 워커가 분석 중 -> 결과가 캐시에 올라올 때까지 대기
+        time.sleep(settings.LLM_SINGLEFLIGHT_POLL_SECONDS)
+        cached = _read_cache(cache_key)
+        if cached:
+            print(f"⏳ [Single-flight] 다른 워커의 분석 결과를 사용합니다. (Key: {cache_key})")
+            return cached
+
+    # lease 획득 성공, Redis 장애, 또는 대기 시간 초과 -> 직접 호출
+    try:
+        # lease를 잡는 사이 다른 워커가 끝냈을 수 있으므로 한 번 더 확인
+        cached = _read_cache(cache_key)
+        if cached:
+            return cached
+
+        # ---------------------------------------------------------
+        # [LLM Call] OpenAI 호출 (Cache Miss)
+        # ---------------------------------------------------------
+        print("🤖 [Redis Miss] OpenAI API 호출 중...")
+        with _lease_heartbeat(lock_key, token):
+            result = _with_participants(
+                _analyze_uncached(chat.transcript), chat.participants
+            )
+
+        # ---------------------------------------------------------
+        # [Cache Save] 결과 Redis 저장 (+ 새로 분석한 경우에만 영구 저장)
+        # ---------------------------------------------------------
+        _write_cache(cache_key, result)
+        if store:
+            _store_result(store, result)
+        return result
+    finally:
+        if token:
+            release_lease(lock_key, token)
+
+
+def _store_result(store: Callable[[AnalysisResult], None], result: AnalysisResult) -> None:
+    # 영구 저장 실패는 분석 결과 반환을 막지 않음 (Redis에는 이미 저장됨)
+    try:
+        store(result)
+    except Exception as e:
+        print(f"⚠️ 분석 결과 저장 실패: {e}")
+
+
+def analyze_text_with_llm(
+    text: str,
+    load_stored: Callable[[], AnalysisResult | None] | None = None,
+    store: Callable[[AnalysisResult], None] | None = None,
+) -> AnalysisResult:
+    """
+    카톡 대화를 분석하여 메타데이터, 상세 페르소나(선호/비선호), 3단계 추천 코스를 반환합니다.
+    (Redis 캐싱 적용: 동일한 텍스트 요청 시 OpenAI 호출 없이 반환)
+    (Single-flight 적용: 같은 텍스트가 동시에 들어오면 OpenAI는 한 번만 호출)
+    load_stored: Redis miss 시 OpenAI 호출 전에 DB 등에 저장된 결과를 찾는 함수 (선택)
+    store: OpenAI로 새로 분석했을 때만 결과를 DB 등에 저장하는 함수 (캐시/DB hit이면 호출 안 함)
+    """
+    
+    if not settings.OPENAI_API_KEY:
+        raise ValueError("❌ OpenAI API Key가 설정되지 않았습니다! .env 파일을 확인해주세요.")
 
     # ---------------------------------------------------------
-    # [Cache Save] 결과 Redis 저장
+    # [Cache Check] Redis 조회
     # ---------------------------------------------------------
-    if redis_client and cache_key:
+    # 타임스탬프/노이즈를 걷어낸 transcript 기준으로 캐시 & 분석
+    chat = preprocess_chat_log(text)
+    cache_key = _get_cache_key(chat.transcript)
+    cached = _read_cache(cache_key)
+    record_cache_stat(CACHE_STAT_NAME, cached is not None)
+    if cached:
+        print(f"⚡️ [Redis Hit] 캐시된 LLM 결과를 반환합니다. (Key: {cache_key})")
+        return cached
+
+    # Redis(hot tier) miss -> 영구 저장소 조회 후 Redis 재적재
+    stored = load_stored() if load_stored else None
+    if stored:
+        print(f"🗄️ [DB Hit] 저장된 분석 결과를 반환합니다. (Key: {cache_key})")
+        _write_cache(cache_key, stored)
+        return stored
+
+    return _llm_flight.do(
+        cache_key, lambda: _analyze_as_leader(chat, cache_key, store)
+    )
+
+
+async def _analyze_as_leader_async(
+    chat: PreprocessedChat,
+    cache_key: str,
+    store: Callable[[AnalysisResult], Awaitable[None]] | None = None,
+) -> AnalysisResult:
+    """_analyze_as_leader의 비동기 버전 (대기 중에도 이벤트 루프를 막지 않음)"""
+    lock_key = f"{cache_key}:lock"
+    deadline = time.monotonic() + _singleflight_wait_seconds(chat.transcript)
+    token = None
+
+    while await get_async_redis_client() and time.monotonic() < deadline:
         try:
-            # Pydantic 객체를 JSON 문자열로 변환하여 저장 (TTL: 24시간)
-            redis_client.setex(cache_key, 86400, result.model_dump_json())
-            print(f"💾 [Redis Saved] 결과를 캐시에 저장했습니다. (TTL: 24h)")
+            token = await acquire_lease_async(
+                lock_key, settings.LLM_SINGLEFLIGHT_LEASE_SECONDS
+            )
         except Exception as e:
-            print(f"⚠️ Redis Write Error: {e}")
+            print(f"⚠️ Redis Lease Error: {e}")
+            break
+        if token:
+            break
+
+        await asyncio.sleep(settings.LLM_SINGLEFLIGHT_POLL_SECONDS)
+        cached = await _read_cache_async(cache_key)
+        if cached:
+            print(f"⏳ [Single-flight] 다른 워커의 분석 결과를 사용합니다. (Key: {cache_key})")
+            return cached
+
+    try:
+        cached = await _read_cache_async(cache_key)
+        if cached:
+            return cached
+
+        print("🤖 [Redis Miss] OpenAI API 호출 중... (async)")
+        async with _lease_heartbeat_async(lock_key, token):
+            result = _with_participants(
+                await _analyze_uncached_async(chat.transcript), chat.participants
+            )
+
+        await _write_cache_async(cache_key, result)
+        if store:
+            await _store_result_async(store, result)
+        return result
+    finally:
+        if token:
+            await release_lease_async(lock_key, token)
+
+
+async def _store_result_async(
+    store: Callable[[AnalysisResult], Awaitable[None]], result: AnalysisResult
+) -> None:
+    try:
+        await store(result)
+    except Exception as e:
+        print(f"⚠️ 분석 결과 저장 실패: {e}")
 
-    return result
\ No newline at end of file
+
+async def analyze_text_with_llm_async(
+    text: str,
+    load_stored: Callable[[], Awaitable[AnalysisResult | None]] | None = None,
+    store: Callable[[AnalysisResult], Awaitable[None]] | None = None,
+) -> AnalysisResult:
+    """
+    analyze_text_with_llm의 비동기 버전.
+    앱 수명 동안 재사용하는 AsyncOpenAI 클라이언트로 호출하므로,
+    분석이 진행되는 동안 스레드풀 워커를 점유하지 않습니다.
+    """
+    if not settings.OPENAI_API_KEY:
+        raise ValueError("❌ OpenAI API Key가 설정되지 않았습니다! .env 파일을 확인해주세요.")
+
+    chat = preprocess_chat_log(text)
+    cache_key = _get_cache_key(chat.transcript)
+    cached = await _read_cache_async(cache_key)
+    await record_cache_stat_async(CACHE_STAT_NAME, cached is not None)
+    if cached:
+        print(f"⚡️ [Redis Hit] 캐시된 LLM 결과를 반환합니다. (Key: {cache_key})")
+        return cached
+
+    stored = await load_stored() if load_stored else None
+    if stored:
+        print(f"🗄️ [DB Hit] 저장된 분석 결과를 반환합니다. (Key: {cache_key})")
+        await _write_cache_async(cache_key, stored)
+        return stored
+
+    return await _llm_flight_async.do(
+        cache_key, lambda: _analyze_as_leader_async(chat, cache_key, store)
+    )
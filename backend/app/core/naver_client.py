@@ -1,19 +1,69 @@
-import requests
+import asyncio
+import hashlib
+import json
+from typing import Any
+
+import httpx
+
+from app.core.cache import get_async_redis_client, record_cache_stat_async
 from app.core.config import settings
 
-def search_naver_local(query: str, display: int = 1):
+NAVER_LOCAL_SEARCH_URL = "https://openapi.naver.com/v1/search/local.json"
+NAVER_SORT = "random" # 랜덤으로 가져와야 다양함
+
+# ---------------------------------------------------------
+# [HTTP 클라이언트 풀]
+# ---------------------------------------------------------
+# 호출마다 새 TCP+TLS 연결을 여는 대신, 프로세스 단위로 keep-alive 커넥션 풀을 공유.
+# 앱 시작 시 init_naver_clients(), 종료 시 close_naver_clients()로 관리 (app/main.py lifespan)
+_async_client: httpx.AsyncClient | None = None
+
+
+def _client_options() -> dict[str, Any]:
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.NAVER_HTTP_POOL_SIZE,
+            max_keepalive_connections=settings.NAVER_HTTP_POOL_SIZE,
+            keepalive_expiry=settings.NAVER_HTTP_KEEPALIVE_SECONDS,
+        ),
+        "timeout": httpx.Timeout(
+            settings.NAVER_SEARCH_TIMEOUT_SECONDS,
+            connect=settings.NAVER_HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+    }
+
+
+def get_naver_async_client() -> httpx.AsyncClient:
+    """비동기 호출용 공유 클라이언트 (없으면 생성)"""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(**_client_options())
+    return _async_client
+
+
+def init_naver_clients() -> None:
+    get_naver_async_client()
+
+
+async def close_naver_clients() -> None:
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+def _build_request(query: str, display: int) -> tuple[dict[str, str], dict[str, Any]] | None:
     """
-    네이버 지역 검색 API를 호출하여 장소 정보를 반환합니다.
-    (기본적으로 키워드당 1개만 가져오도록 설정, 늘릴 수 있음)
+    네이버 API 호출에 필요한 (headers, params)를 만듭니다.
+    API 키가 없으면 None 반환.
     """
     client_id = settings.NAVER_CLIENT_ID
     client_secret = settings.NAVER_CLIENT_SECRET
 
     if not client_id or not client_secret:
         print("❌ 네이버 API 키가 설정되지 않았습니다.")
-        return []
+        return None
 
-    url = "https://openapi.naver.com/v1/search/local.json"
     headers = {
         "X-Naver-Client-Id": client_id,
         "X-Naver-Client-Secret": client_secret
@@ -21,41 +71,137 @@ def search_naver_local(query: str, display: int = 1):
     params = {
         "query": query,
         "display": display,
-        "sort": "random" # 랜덤으로 가져와야 다양함
+        "sort": NAVER_SORT
     }
+    return headers, params
 
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-
-        if data.get("total", 0) == 0:
-            return []
-
-        results = []
-        for item in data["items"]:
-            # HTML 태그 제거
-            name = item["title"].replace("<b>", "").replace("</b>", "")
-            
-            # 좌표 변환 (KATECH -> WGS84 근사치)
-            try:
-                lat = int(item["mapy"]) / 10000000
-                lng = int(item["mapx"]) / 10000000
-            except Exception:
-                lat, lng = 0.0, 0.0
-
-            results.append({
-                "name": name,
-                "category": item.get("category", ""),
-                "address": item.get("roadAddress") or item.get("address", ""),
-                "lat": lat,
-                "lng": lng,
-                "link": item.get("link", ""),
-                "search_keyword": query # 어떤 검색어로 나왔는지 기록
-            })
-            
-        return results
 
+def _parse_places(data: dict[str, Any], query: str) -> list[dict[str, Any]]:
+    """네이버 응답 JSON을 장소 리스트로 변환합니다."""
+    if data.get("total", 0) == 0:
+        return []
+
+    results = []
+    for item in data["items"]:
+        # HTML 태그 제거
+        name = item["title"].replace("<b>", "").replace("</b>", "")
+
+        # 좌표 변환 (KATECH -> WGS84 근사치)
+        try:
+            lat = int(item["mapy"]) / 10000000
+            lng = int(item["mapx"]) / 10000000
+        except Exception:
+            lat, lng = 0.0, 0.0
+
+        results.append({
+            "name": name,
+            "category": item.get("category", ""),
+            "address": item.get("roadAddress") or item.get("address", ""),
+            "lat": lat,
+            "lng": lng,
+            "link": item.get("link", ""),
+            "search_keyword": query # 어떤 검색어로 나왔는지 기록
+        })
+
+    return results
+
+
+# ---------------------------------------------------------
+# [검색 결과 캐시] Redis
+# ---------------------------------------------------------
+# (query, display, sort) 단위로 결과 저장. 결과가 없는 검색도 짧은 TTL로 저장(네거티브 캐시)해서
+# 같은 검색어로 네이버 일일 쿼터를 반복 소모하지 않도록 함. API 에러는 캐시하지 않음.
+CACHE_STAT_NAME = "naver_local"
+
+
+def _cache_key(query: str, display: int) -> str:
+    cache_input = f"{query}:{display}:{NAVER_SORT}"
+    query_hash = hashlib.md5(cache_input.encode("utf-8")).hexdigest()
+    return f"naver_local:{query_hash}"
+
+
+def _cache_ttl(places: list[dict[str, Any]]) -> int:
+    if places:
+        return settings.NAVER_CACHE_TTL_SECONDS
+    return settings.NAVER_NEGATIVE_CACHE_TTL_SECONDS
+
+
+async def _fetch_places_async(query: str, display: int) -> list[dict[str, Any]] | None:
+    request_args = _build_request(query, display)
+    if not request_args:
+        return None
+    headers, params = request_args
+
+    response = await get_naver_async_client().get(
+        NAVER_LOCAL_SEARCH_URL, headers=headers, params=params
+    )
+    response.raise_for_status()
+    return _parse_places(response.json(), query)
+
+
+async def search_naver_local_async(
+    query: str, display: int = 1
+) -> list[dict[str, Any]]:
+    """
+    네이버 지역 검색 API를 호출하여 장소 정보를 반환합니다.
+    (기본적으로 키워드당 1개만 가져오도록 설정, 늘릴 수 있음)
+    (공유 AsyncClient 커넥션 풀 사용, Redis 캐싱 적용: 동일한 검색어는 TTL 동안 네이버 호출 없이 반환)
+    API 키가 없거나 호출에 실패하면 빈 리스트 반환.
+    """
+    cache_key = _cache_key(query, display)
+    async_redis_client = await get_async_redis_client()
+    if async_redis_client:
+        try:
+            cached_data = await async_redis_client.get(cache_key)
+            await record_cache_stat_async(CACHE_STAT_NAME, cached_data is not None)
+            if cached_data is not None:
+                cached_places: list[dict[str, Any]] = json.loads(cached_data)
+                return cached_places
+        except Exception as e:
+            print(f"⚠️ Redis Read Error: {e}")
+
+    try:
+        places = await _fetch_places_async(query, display)
     except Exception as e:
         print(f"⚠️ 네이버 API 호출 에러 ({query}): {e}")
-        return []
\ No newline at end of file
+        return []
+    if places is None:
+        return []
+
+    if async_redis_client:
+        try:
+            await async_redis_client.setex(
+                cache_key, _cache_ttl(places), json.dumps(places, ensure_ascii=False)
+            )
+        except Exception as e:
+            print(f"⚠️ Redis Write Error: {e}")
+
+    return places
+
+
+async def search_naver_local_many(
+    queries: list[str], display: int = 1
+) -> list[list[dict[str, Any]]]:
+    """
+    여러 검색어를 동시에 검색합니다. (코스 단계별 검색 병렬화)
+    결과는 queries 순서대로 반환되며, 전체 마감시간(NAVER_SEARCH_DEADLINE_SECONDS)을
+    넘긴 검색은 빈 리스트로 처리합니다.
+    """
+    if not queries:
+        return []
+
+    tasks = [
+        asyncio.create_task(search_naver_local_async(query, display))
+        for query in queries
+    ]
+    done, pending = await asyncio.wait(
+        tasks, timeout=settings.NAVER_SEARCH_DEADLINE_SECONDS
+    )
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        print(f"⏱️ 네이버 검색 마감시간 초과: {len(pending)}건 취소")
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return [task.result() if task in done else [] for task in tasks]
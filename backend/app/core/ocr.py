@@ -0,0 +1,158 @@
+import os
+import re
+import threading
+import time
+from typing import Any
+
+import modal
+
+from app.core.config import settings
+from app.core.image_prep import prepare_image_for_ocr
+from app.core.video_frames import extract_distinct_frames
+
+# ---------------------------------------------------------
+# [Modal 연결]
+# ---------------------------------------------------------
+# 앱 조회는 처음 OCR 할 때 (워커 부팅 시 Modal 응답을 기다리지 않도록)
+# 실패하면 BACKEND_RETRY_SECONDS 뒤에 다시 조회
+_ocr_service_cls: Any = None
+_ocr_lock = threading.Lock()
+_ocr_retry_at = 0.0
+_ocr_error: str | None = None
+
+
+def get_ocr_service_cls() -> Any:
+    global _ocr_service_cls, _ocr_retry_at, _ocr_error
+    if _ocr_service_cls is not None:
+        return _ocr_service_cls
+    if time.monotonic() < _ocr_retry_at:
+        return None
+
+    with _ocr_lock:
+        if _ocr_service_cls is None and time.monotonic() >= _ocr_retry_at:
+            try:
+                service_cls = modal.Cls.from_name("kakao-ocr-unified", "OCRService")
+                service_cls.hydrate()
+                _ocr_service_cls = service_cls
+                _ocr_error = None
+            except Exception as e:
+                print(f"⚠️ Warning: Modal 앱을 찾을 수 없습니다. ({e})")
+                _ocr_error = str(e)
+                _ocr_retry_at = time.monotonic() + settings.BACKEND_RETRY_SECONDS
+    return _ocr_service_cls
+
+
+def get_modal_health() -> dict[str, Any]:
+    """Modal OCR 앱 상태 (ok / unavailable)"""
+    if get_ocr_service_cls() is None:
+        return {"status": "unavailable", "error": _ocr_error}
+    return {"status": "ok"}
+
+
+# OCR 파이프라인(이미지 전처리 / 동영상 프레임 추출 / Modal 모델)이 바뀌면 올림
+# -> 이전 버전으로 추출한 텍스트는 캐시/DB에서 재사용하지 않음
+OCR_VERSION = "1"
+
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.heic')
+MEDIA_EXTENSIONS = IMAGE_EXTENSIONS + VIDEO_EXTENSIONS
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# 스크린샷 이어 붙일 때 겹침으로 인정하는 최소 길이 (줄 수 또는 공백 제외 글자 수)
+# "ㅋㅋ", "네" 같은 짧은 한 줄이 우연히 같아서 다른 메시지가 지워지지 않도록
+STITCH_MIN_OVERLAP_LINES = 2
+STITCH_MIN_OVERLAP_CHARS = 20
+
+
+def run_ocr(content: bytes, filename: str) -> str:
+    """
+    Modal OCR 서비스로 이미지/동영상의 텍스트를 추출합니다.
+    실패하면 예외를 그대로 올림 (OCR은 필수 단계)
+    """
+    service_cls = get_ocr_service_cls()
+    if not service_cls:
+        raise Exception("OCR 서비스 연결 실패")
+
+    service = service_cls()
+    print(f"🚀 [Modal Start] {filename} 분석 시작...")
+
+    if filename.endswith(VIDEO_EXTENSIONS):
+        # 동영상
+        result = service.process_video.remote(content)
+        extracted_text = result.get("text", "") if isinstance(result, dict) else str(result)
+    else:
+        # 이미지 (해상도 줄이고 재압축해서 전송)
+        result = service.process_image.remote(prepare_image_for_ocr(content))
+        extracted_text = str(result)
+
+    print("✅ [Modal Success] 분석 완료")
+    return extracted_text
+
+
+def run_ocr_images(contents: list[bytes]) -> list[str]:
+    """
+    여러 이미지를 Modal에서 동시에 OCR 합니다. (.map -> 컨테이너 여러 개로 병렬 처리)
+    결과는 입력 순서대로 반환. 하나라도 실패하면 예외를 올림.
+    """
+    service_cls = get_ocr_service_cls()
+    if not service_cls:
+        raise Exception("OCR 서비스 연결 실패")
+
+    service = service_cls()
+    print(f"🚀 [Modal Start] 이미지 {len(contents)}장 동시 분석 시작...")
+    prepared = [prepare_image_for_ocr(content) for content in contents]
+    results = [str(result) for result in service.process_image.map(prepared)]
+    print("✅ [Modal Success] 분석 완료")
+    return results
+
+
+def _line_key(line: str) -> str:
+    # OCR마다 띄어쓰기가 조금씩 달라서 공백은 무시하고 비교
+    return WHITESPACE_PATTERN.sub("", line)
+
+
+def stitch_screenshot_texts(texts: list[str]) -> str:
+    """
+    연속된 스크린샷들의 OCR 결과를 순서대로 이어 붙입니다.
+    스크롤하면서 찍은 스크린샷은 앞 장의 끝부분이 다음 장 앞부분에 다시 나오므로
+    겹치는 줄(앞 장의 마지막 k줄 == 다음 장의 처음 k줄, 가장 긴 k)은 한 번만 남깁니다.
+    겹침은 STITCH_MIN_OVERLAP_LINES줄 이상이거나 STITCH_MIN_OVERLAP_CHARS글자 이상일 때만 인정.
+    """
+    stitched: list[str] = []
+    stitched_keys: list[str] = []
+    for text in texts:
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        keys = [_line_key(line) for line in lines]
+
+        overlap = 0
+        for k in range(min(len(stitched_keys), len(keys)), 0, -1):
+            if stitched_keys[-k:] == keys[:k]:
+                if (
+                    k >= STITCH_MIN_OVERLAP_LINES
+                    or sum(len(key) for key in keys[:k]) >= STITCH_MIN_OVERLAP_CHARS
+                ):
+                    overlap = k
+                break
+
+        stitched.extend(lines[overlap:])
+        stitched_keys.extend(keys[overlap:])
+    return "\n".join(stitched)
+
+
+def run_video_ocr(path: str, filename: str) -> str:
+    """
+    동영상 OCR: 서로 다른 화면의 프레임만 뽑아서 이미지로 동시에 OCR 하고 이어 붙입니다.
+    프레임을 못 뽑으면 기존처럼 동영상 전체를 process_video로 보냄.
+    (Modal에 bytes로 보내야 해서 파일 전체를 읽으므로 VIDEO_FALLBACK_MAX_MB 이하만)
+    """
+    frames = extract_distinct_frames(path)
+    if not frames:
+        if os.path.getsize(path) > settings.VIDEO_FALLBACK_MAX_MB * 1024 * 1024:
+            raise Exception(
+                f"동영상 프레임을 추출할 수 없고 {settings.VIDEO_FALLBACK_MAX_MB}MB를 넘어 분석할 수 없습니다."
+            )
+        with open(path, "rb") as f:
+            return run_ocr(f.read(), filename)
+
+    print(f"🎞️ [Video] {filename}: 서로 다른 프레임 {len(frames)}장만 OCR")
+    return stitch_screenshot_texts(run_ocr_images(frames))
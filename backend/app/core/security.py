@@ -1,5 +1,11 @@
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, TypeVar
 
 import jwt
 from passlib.context import CryptContext
@@ -19,9 +25,116 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# ---------------------------------------------------------
+# [비밀번호 해시] bcrypt는 호출당 CPU 100~300ms
+# ---------------------------------------------------------
+# 요청 스레드풀에서 바로 돌리면 로그인이 몰릴 때 다른 API까지 멈추므로
+# 전용 프로세스 풀에서 계산하고, 대기열이 가득 차면 기다리지 않고 바로 거절(503)
+# CPU만 풀로 옮겨지고 호출한 스레드는 결과를 기다리며 막힘
+# (sync 라우트의 스레드풀 워커는 계속 점유되지만 GIL / CPU는 다른 요청에 양보)
+class PasswordHasherBusyError(Exception):
+    """비밀번호 해시 대기열이 가득 참"""
+
+
+T = TypeVar("T")
+
+_password_pool: ProcessPoolExecutor | None = None
+_password_pool_lock = threading.Lock()
+_password_pending = threading.BoundedSemaphore(max(settings.PASSWORD_HASH_MAX_PENDING, 1))
+
+_stats_lock = threading.Lock()
+_password_stats: dict[str, Any] = {
+    "hash": {"count": 0, "total_ms": 0.0, "max_ms": 0.0},
+    "verify": {"count": 0, "total_ms": 0.0, "max_ms": 0.0},
+    "rejected": 0,
+}
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+def _hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def _get_password_pool() -> ProcessPoolExecutor:
+    global _password_pool
+    with _password_pool_lock:
+        if _password_pool is None:
+            # 스레드가 도는 API 프로세스를 fork하지 않도록 spawn 사용
+            _password_pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _password_pool
+
+
+def _reset_password_pool() -> None:
+    global _password_pool
+    with _password_pool_lock:
+        if _password_pool is not None:
+            _password_pool.shutdown(wait=False, cancel_futures=True)
+        _password_pool = None
+
+
+def shutdown_password_hasher() -> None:
+    _reset_password_pool()
+
+
+def _record_password_stat(kind: str, elapsed_ms: float) -> None:
+    with _stats_lock:
+        stat = _password_stats[kind]
+        stat["count"] += 1
+        stat["total_ms"] += elapsed_ms
+        stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+
+def get_password_hash_stats() -> dict[str, Any]:
+    """이 워커 프로세스의 해시/검증 횟수, 평균/최대 지연(ms, 대기 포함), 거절 수"""
+    with _stats_lock:
+        stats: dict[str, Any] = {"rejected": _password_stats["rejected"]}
+        for kind in ("hash", "verify"):
+            stat = _password_stats[kind]
+            count = stat["count"]
+            stats[kind] = {
+                "count": count,
+                "avg_ms": round(stat["total_ms"] / count, 1) if count else 0.0,
+                "max_ms": round(stat["max_ms"], 1),
+            }
+    return stats
+
+
+def _acquire_password_slot() -> None:
+    if not _password_pending.acquire(blocking=False):
+        with _stats_lock:
+            _password_stats["rejected"] += 1
+        raise PasswordHasherBusyError()
+
+
+def _run_password_task(kind: str, fn: Callable[..., T], *args: Any) -> T:
+    start = time.perf_counter()
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        result = fn(*args)
+    else:
+        _acquire_password_slot()
+        try:
+            result = _get_password_pool().submit(fn, *args).result()
+        except BrokenProcessPool as e:
+            # 풀 프로세스가 죽었으면 새로 만들고 이번 요청은 여기서 계산
+            print(f"⚠️ Password Hash Pool Error: {e}")
+            _reset_password_pool()
+            result = fn(*args)
+        finally:
+            _password_pending.release()
+
+    _record_password_stat(kind, (time.perf_counter() - start) * 1000)
+    return result
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _run_password_task("verify", _verify, plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    return _run_password_task("hash", _hash, password)
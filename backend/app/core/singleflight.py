@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 호출을 하나로 합칩니다. (프로세스 내부, 스레드 기준)
+    첫 호출(리더)만 fn을 실행하고, 나머지(팔로워)는 리더의 결과/예외를 그대로 받습니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            result: T = call.result
+            return result
+
+        try:
+            result = fn()
+            call.result = result
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight의 asyncio 버전. (이벤트 루프 하나 안에서만 사용)
+    fn은 어떤 호출자에게도 속하지 않는 별도 Task로 실행하고, 호출자는 모두 그 Task를 await 합니다.
+    호출자(첫 호출자 포함)가 취소되면 자기 대기만 멈추고 작업과 다른 호출자에는 영향이 없습니다.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        result: T = await asyncio.shield(task)
+        return result
+
+    def _finish(self, key: str, task: asyncio.Future[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 호출자가 모두 취소됐을 때 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
@@ -1,57 +1,302 @@
-import boto3
+import json
+import os
+import threading
+import time
 import uuid  # <--- 이거 꼭 있어야 함!
-from app.core.config import settings
 from datetime import datetime
+from typing import Any, BinaryIO
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from app.core.cache import get_redis_client
+from app.core.config import settings
+
+# R2 클라이언트는 처음 사용할 때 생성 (워커 부팅 시간 단축)
+# R2 설정이 없거나 생성에 실패하면 None (에러 방지용)
+_s3_client: Any = None
+_s3_lock = threading.Lock()
+_s3_retry_at = 0.0
+_s3_error: str | None = None
+
+
+def r2_configured() -> bool:
+    return bool(
+        settings.R2_ACCOUNT_ID
+        and settings.R2_ACCESS_KEY_ID
+        and settings.R2_BUCKET_NAME
+    )
+
+
+def get_s3_client() -> Any:
+    global _s3_client, _s3_retry_at, _s3_error
+    if _s3_client is not None:
+        return _s3_client
+    if not r2_configured() or time.monotonic() < _s3_retry_at:
+        return None
+
+    with _s3_lock:
+        if _s3_client is None and time.monotonic() >= _s3_retry_at:
+            try:
+                _s3_client = boto3.client(
+                    service_name='s3',
+                    endpoint_url=f"https://{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com",
+                    aws_access_key_id=settings.R2_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
+                    region_name="auto",
+                )
+                _s3_error = None
+            except Exception as e:
+                print(f"⚠️ R2 Client init failed: {e}")
+                _s3_error = str(e)
+                _s3_retry_at = time.monotonic() + settings.BACKEND_RETRY_SECONDS
+    return _s3_client
+
+
+def get_r2_health() -> dict[str, Any]:
+    """R2 상태 (ok / unavailable / not_configured). 버킷에 HEAD 요청으로 확인"""
+    if not r2_configured():
+        return {"status": "not_configured"}
+    s3_client = get_s3_client()
+    if s3_client is None:
+        return {"status": "unavailable", "error": _s3_error}
+    try:
+        s3_client.head_bucket(Bucket=settings.R2_BUCKET_NAME)
+    except Exception as e:
+        return {"status": "unavailable", "error": str(e)}
+    return {"status": "ok"}
+
+
+def close_s3_client() -> None:
+    global _s3_client
+    if _s3_client is not None:
+        _s3_client.close()
+        _s3_client = None
+
+
+# multipart 업로드 설정 (파트 크기 / 동시에 올릴 파트 수)
+_transfer_config = TransferConfig(
+    multipart_threshold=settings.R2_MULTIPART_CHUNK_MB * 1024 * 1024,
+    multipart_chunksize=settings.R2_MULTIPART_CHUNK_MB * 1024 * 1024,
+    max_concurrency=settings.R2_MULTIPART_CONCURRENCY,
+)
 
-# R2 설정이 있을 때만 클라이언트 생성 (없으면 에러 방지용으로 None 처리)
-try:
-    if settings.R2_ACCOUNT_ID and settings.R2_ACCESS_KEY_ID:
-        s3_client = boto3.client(
-            service_name='s3',
-            endpoint_url=f"https://{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com",
-            aws_access_key_id=settings.R2_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-            region_name="auto", 
-        )
-    else:
-        s3_client = None
-except Exception as e:
-    print(f"⚠️ R2 Client init failed: {e}")
-    s3_client = None
 
+def _env_prefix() -> str:
+    # 환경에 따라 폴더 분리 (dev/ 또는 prod/)
+    return "dev" if settings.ENVIRONMENT == "local" else "prod"
 
-def upload_file_to_r2(file_content: bytes, filename: str, content_type: str) -> str | None:
+
+def _build_object_key(filename: str) -> str:
+    # 1. 환경에 따라 폴더 분리 (dev/ 또는 prod/)
+    env_prefix = _env_prefix()
+
+    # 2. 파일명 중복 방지 및 정리 (dev/20241201/uuid_test.jpg)
+    date_folder = datetime.now().strftime("%Y%m%d")
+    unique_filename = f"{uuid.uuid4()}_{filename}"
+    return f"{env_prefix}/{date_folder}/{unique_filename}"
+
+
+def content_addressed_key(owner_id: uuid.UUID, content_hash: str, filename: str) -> str:
+    # 소유자별 내용 해시 기반 키 (같은 사용자가 같은 파일을 다시 올리면 같은 객체 -> 중복 업로드 안 함)
+    # 다른 사용자와는 객체를 공유하지 않음 (URL 노출 / 삭제 시 영향 방지)
+    ext = os.path.splitext(filename)[1].lower()
+    return f"{_env_prefix()}/objects/{owner_id}/{content_hash}{ext}"
+
+
+def r2_public_url(object_key: str) -> str:
+    # R2_PUBLIC_DOMAIN 뒤에 슬래시가 있든 없든 깔끔하게 처리
+    domain = str(settings.R2_PUBLIC_DOMAIN).rstrip("/")
+    return f"{domain}/{object_key}"
+
+
+def upload_fileobj_to_r2(
+    fileobj: BinaryIO,
+    filename: str,
+    content_type: str | None,
+    object_key: str | None = None,
+) -> str | None:
     """
-    R2에 파일 업로드 후 퍼블릭 URL 반환.
+    파일 객체(스트림)를 S3 multipart upload로 R2에 올리고 퍼블릭 URL 반환.
+    파트 크기 x 동시 업로드 수만큼만 메모리를 쓰므로 대용량 동영상도 메모리 사용량이 일정함.
+    object_key를 주지 않으면 uuid 기반 키를 새로 만듦.
     설정이 없거나 실패하면 None 반환.
     """
+    s3_client = get_s3_client()
     if not s3_client or not settings.R2_BUCKET_NAME:
         print("❌ R2 설정이 없어 업로드를 건너뜁니다.")
         return None
 
     try:
-        # 1. 환경에 따라 폴더 분리 (dev/ 또는 prod/)
-        env_prefix = "dev" if settings.ENVIRONMENT == "local" else "prod"
-        
-        # 2. 파일명 중복 방지 및 정리 (dev/20241201/uuid_test.jpg)
-        date_folder = datetime.now().strftime("%Y%m%d")
-        unique_filename = f"{uuid.uuid4()}_{filename}"
-        object_key = f"{env_prefix}/{date_folder}/{unique_filename}"
-
-        # 3. 업로드
-        s3_client.put_object(
-            Bucket=settings.R2_BUCKET_NAME,
-            Key=object_key,
-            Body=file_content,
-            ContentType=content_type,
-            # ACL="public-read" # R2 설정에 따라 필요할 수도 있음
+        object_key = object_key or _build_object_key(filename)
+        extra_args = {"ContentType": content_type} if content_type else None
+        s3_client.upload_fileobj(
+            fileobj,
+            settings.R2_BUCKET_NAME,
+            object_key,
+            ExtraArgs=extra_args,
+            Config=_transfer_config,
         )
-
-        # 4. URL 생성해서 리턴
-        # R2_PUBLIC_DOMAIN 뒤에 슬래시가 있든 없든 깔끔하게 처리
-        domain = str(settings.R2_PUBLIC_DOMAIN).rstrip("/")
-        return f"{domain}/{object_key}"
+        return r2_public_url(object_key)
 
     except Exception as e:
         print(f"❌ R2 Upload Failed: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def delete_file_from_r2(file_url: str) -> bool:
+    """
+    upload_fileobj_to_r2 / r2_public_url이 반환한 URL의 객체를 삭제합니다.
+    설정이 없거나 실패하면 False 반환.
+    """
+    s3_client = get_s3_client()
+    if not s3_client or not settings.R2_BUCKET_NAME:
+        return False
+
+    domain = str(settings.R2_PUBLIC_DOMAIN).rstrip("/")
+    if not file_url.startswith(f"{domain}/"):
+        print(f"⚠️ R2 URL 형식이 달라 삭제를 건너뜁니다: {file_url}")
+        return False
+    object_key = file_url[len(domain) + 1:]
+
+    try:
+        s3_client.delete_object(Bucket=settings.R2_BUCKET_NAME, Key=object_key)
+        return True
+    except Exception as e:
+        print(f"❌ R2 Delete Failed: {e}")
+        return False
+
+
+# ---------------------------------------------------------
+# [직접 업로드] 브라우저 -> R2 (API 서버를 거치지 않음)
+# ---------------------------------------------------------
+# 발급했지만 아직 완료되지 않은 직접 업로드 (direct_upload:{object_key})
+PENDING_UPLOAD_PREFIX = "direct_upload:"
+
+
+def direct_upload_prefix(owner_id: uuid.UUID) -> str:
+    """직접 업로드 객체 키 prefix (완료 요청 시 본인 업로드인지 확인용)"""
+    return f"{_env_prefix()}/uploads/{owner_id}/"
+
+
+def _pending_upload_key(object_key: str) -> str:
+    return f"{PENDING_UPLOAD_PREFIX}{object_key}"
+
+
+def create_presigned_upload(
+    owner_id: uuid.UUID, filename: str, content_type: str, size: int
+) -> dict[str, Any] | None:
+    """
+    R2에 직접 올릴 수 있는 presigned PUT URL 생성. (R2는 presigned POST 미지원)
+    Content-Type / Content-Length를 서명에 넣어서 다른 타입/크기로는 올릴 수 없음.
+    발급 내역(소유자, 파일명, 타입, 크기)은 Redis에 남겨두고 완료 요청 때 확인.
+    설정이 없거나 (Redis 포함) 실패하면 None 반환.
+    """
+    s3_client = get_s3_client()
+    if not s3_client or not settings.R2_BUCKET_NAME:
+        print("❌ R2 설정이 없어 업로드 URL을 만들 수 없습니다.")
+        return None
+    redis_client = get_redis_client()
+    if not redis_client:
+        print("❌ Redis 연결이 없어 업로드 URL을 만들 수 없습니다.")
+        return None
+
+    # 키에는 클라이언트가 보낸 파일명을 넣지 않음 (확장자만 사용)
+    ext = os.path.splitext(filename)[1].lower()
+    object_key = f"{direct_upload_prefix(owner_id)}{uuid.uuid4()}{ext}"
+    try:
+        url = s3_client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": settings.R2_BUCKET_NAME,
+                "Key": object_key,
+                "ContentType": content_type,
+                "ContentLength": size,
+            },
+            ExpiresIn=settings.R2_PRESIGNED_EXPIRES_SECONDS,
+        )
+        # URL 만료 직전에 시작한 업로드도 완료 요청을 받을 수 있도록 2배로 보관
+        redis_client.set(
+            _pending_upload_key(object_key),
+            json.dumps(
+                {
+                    "owner_id": str(owner_id),
+                    "filename": filename,
+                    "content_type": content_type,
+                    "size": size,
+                },
+                ensure_ascii=False,
+            ),
+            ex=settings.R2_PRESIGNED_EXPIRES_SECONDS * 2,
+        )
+    except Exception as e:
+        print(f"❌ R2 Presign Failed: {e}")
+        return None
+
+    return {
+        "url": url,
+        "headers": {"Content-Type": content_type},
+        "object_key": object_key,
+    }
+
+
+def get_pending_upload(object_key: str) -> dict[str, Any] | None:
+    """create_presigned_upload로 발급했고 아직 완료되지 않은 업로드 정보"""
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+    try:
+        cached = redis_client.get(_pending_upload_key(object_key))
+    except Exception as e:
+        print(f"⚠️ Redis Read Error: {e}")
+        return None
+    return json.loads(cached) if cached else None
+
+
+def claim_pending_upload(object_key: str) -> bool:
+    """
+    발급 내역을 지우면서 완료 처리. 동시에 두 번 완료 요청이 와도 한 번만 True.
+    """
+    redis_client = get_redis_client()
+    if not redis_client:
+        return False
+    try:
+        return redis_client.delete(_pending_upload_key(object_key)) == 1
+    except Exception as e:
+        print(f"⚠️ Redis Delete Error: {e}")
+        return False
+
+
+def get_r2_object_head(object_key: str) -> dict[str, Any] | None:
+    """객체 크기(bytes) / Content-Type. 객체가 없거나 실패하면 None 반환."""
+    s3_client = get_s3_client()
+    if not s3_client or not settings.R2_BUCKET_NAME:
+        return None
+    try:
+        head = s3_client.head_object(Bucket=settings.R2_BUCKET_NAME, Key=object_key)
+        return {"size": head["ContentLength"], "content_type": head.get("ContentType")}
+    except ClientError as e:
+        # 객체가 없는 경우(404)는 정상 흐름이라 로그 생략
+        if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey", "NotFound"):
+            print(f"⚠️ R2 Head Failed: {e}")
+        return None
+    except Exception as e:
+        print(f"⚠️ R2 Head Failed: {e}")
+        return None
+
+
+def get_r2_object_size(object_key: str) -> int | None:
+    """객체 크기(bytes). 객체가 없거나 실패하면 None 반환."""
+    head = get_r2_object_head(object_key)
+    return head["size"] if head else None
+
+
+def download_fileobj_from_r2(object_key: str, fileobj: BinaryIO) -> None:
+    """R2 객체를 파일 객체로 스트리밍 다운로드 (실패하면 예외를 그대로 올림)"""
+    s3_client = get_s3_client()
+    if not s3_client or not settings.R2_BUCKET_NAME:
+        raise Exception("R2 설정이 없습니다.")
+    s3_client.download_fileobj(
+        settings.R2_BUCKET_NAME, object_key, fileobj, Config=_transfer_config
+    )
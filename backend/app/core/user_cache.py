@@ -0,0 +1,159 @@
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, cast
+
+from app.core.cache import add_cache_stats, get_redis_client
+from app.core.config import settings
+from app.models import User, UserPublic
+
+# ---------------------------------------------------------
+# [로그인 사용자 캐시] 인증된 요청마다 user 테이블 조회하지 않도록
+# ---------------------------------------------------------
+# 1차: 워커 프로세스 내부 LRU (TTL 짧게) / 2차: Redis (수정/삭제 시 무효화)
+# UserPublic 필드만 저장 (hashed_password는 필요할 때만 DB에서 지연 로딩)
+# 무효화할 때마다 Redis의 사용자별 버전을 올리고, 캐시 항목은 저장할 때의 버전과 같을 때만 사용
+# -> 다른 워커의 프로세스 내부 캐시도 요청마다 버전만 확인해서 바로 무효화됨
+#    (Redis가 없으면 프로세스 내부 무효화 + USER_CACHE_LOCAL_TTL_SECONDS로만 관리)
+USER_CACHE_PREFIX = "user:"
+USER_VERSION_PREFIX = "user_version:"
+CACHE_STAT_NAME = "current_user"
+# Redis 없이 프로세스 내부 캐시만 쓸 때의 버전
+_LOCAL_ONLY_VERSION = "local"
+
+_local_lock = threading.Lock()
+_local_cache: OrderedDict[str, tuple[float, str, dict[str, Any]]] = OrderedDict()
+
+# hit/miss는 인증된 요청마다 생기므로 프로세스 안에서 세고 USER_CACHE_STAT_FLUSH_SECONDS마다 Redis에 반영
+_stat_lock = threading.Lock()
+_stat_hits = 0
+_stat_misses = 0
+_stat_flush_at = 0.0
+
+
+def _record_stat(hit: bool) -> None:
+    global _stat_hits, _stat_misses, _stat_flush_at
+    with _stat_lock:
+        if hit:
+            _stat_hits += 1
+        else:
+            _stat_misses += 1
+        now = time.monotonic()
+        if now < _stat_flush_at:
+            return
+        hits, misses = _stat_hits, _stat_misses
+        _stat_hits = _stat_misses = 0
+        _stat_flush_at = now + settings.USER_CACHE_STAT_FLUSH_SECONDS
+    add_cache_stats(CACHE_STAT_NAME, hits, misses)
+
+
+def _local_get(user_id: str, version: str) -> dict[str, Any] | None:
+    with _local_lock:
+        entry = _local_cache.get(user_id)
+        if entry is None:
+            return None
+        expires_at, cached_version, data = entry
+        if expires_at < time.monotonic() or cached_version != version:
+            del _local_cache[user_id]
+            return None
+        _local_cache.move_to_end(user_id)
+        return data
+
+
+def _local_set(user_id: str, version: str, data: dict[str, Any]) -> None:
+    with _local_lock:
+        _local_cache[user_id] = (
+            time.monotonic() + settings.USER_CACHE_LOCAL_TTL_SECONDS,
+            version,
+            data,
+        )
+        _local_cache.move_to_end(user_id)
+        while len(_local_cache) > settings.USER_CACHE_LOCAL_MAX_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def get_cached_user(user_id: str) -> tuple[UserPublic | None, str | None]:
+    """
+    캐시된 사용자 (hashed_password 제외)와 지금 버전. 캐시에 없으면 (None, 버전)
+    DB에서 읽은 사용자는 이 버전으로 cache_user에 넘김
+    (그 사이에 무효화됐으면 버전이 달라서 저장돼도 쓰이지 않음, 버전이 None이면 저장 안 함)
+    """
+    redis_client = get_redis_client()
+    if not redis_client:
+        version = _LOCAL_ONLY_VERSION
+    else:
+        try:
+            stored_version = redis_client.get(f"{USER_VERSION_PREFIX}{user_id}")
+            version = cast(str | None, stored_version) or "0"
+        except Exception as e:
+            # 버전을 모르면 다른 워커의 무효화를 확인할 수 없으므로 캐시를 쓰지 않음
+            print(f"⚠️ Redis Read Error: {e}")
+            _record_stat(False)
+            return None, None
+
+    data = _local_get(user_id, version)
+    if data is not None:
+        _record_stat(True)
+        return UserPublic.model_validate(data), version
+
+    if redis_client:
+        try:
+            cached = redis_client.get(f"{USER_CACHE_PREFIX}{user_id}")
+        except Exception as e:
+            print(f"⚠️ Redis Read Error: {e}")
+            cached = None
+        if cached:
+            entry = json.loads(cached)
+            if entry.get("version") == version:
+                _local_set(user_id, version, entry["user"])
+                _record_stat(True)
+                return UserPublic.model_validate(entry["user"]), version
+
+    _record_stat(False)
+    return None, version
+
+
+def cache_user(user: User, version: str | None) -> None:
+    """version: DB에서 읽기 전에 get_cached_user가 돌려준 버전"""
+    if version is None:
+        return
+    user_id = str(user.id)
+    data = UserPublic.model_validate(user).model_dump(mode="json")
+    _local_set(user_id, version, data)
+    if version == _LOCAL_ONLY_VERSION:
+        return
+    redis_client = get_redis_client()
+    if redis_client:
+        try:
+            redis_client.set(
+                f"{USER_CACHE_PREFIX}{user_id}",
+                json.dumps({"version": version, "user": data}, ensure_ascii=False),
+                ex=settings.USER_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            print(f"⚠️ Redis Write Error: {e}")
+
+
+def invalidate_user(user_id: Any) -> None:
+    """사용자 수정/비밀번호 변경/삭제 후 호출 (모든 워커의 캐시가 무효화됨)"""
+    user_id = str(user_id)
+    with _local_lock:
+        _local_cache.pop(user_id, None)
+    redis_client = get_redis_client()
+    if redis_client:
+        version_key = f"{USER_VERSION_PREFIX}{user_id}"
+        try:
+            pipe = redis_client.pipeline()
+            pipe.delete(f"{USER_CACHE_PREFIX}{user_id}")
+            pipe.incr(version_key)
+            # 이전 버전으로 저장된 캐시 항목보다 오래 남아야 함 (만료되면 버전이 "0"으로 돌아감)
+            pipe.expire(
+                version_key,
+                settings.USER_CACHE_TTL_SECONDS
+                + math.ceil(settings.USER_CACHE_LOCAL_TTL_SECONDS),
+            )
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Redis Delete Error: {e}")
@@ -0,0 +1,74 @@
+import cv2
+from cv2.typing import MatLike
+
+from app.core.config import settings
+
+
+# ---------------------------------------------------------
+# [동영상 프레임 추출] 스크롤 녹화 영상은 대부분 같은 화면
+# ---------------------------------------------------------
+# 일정 간격으로 프레임을 뽑고, 직전에 남긴 프레임과 dHash가 거의 같으면 버림
+# -> OCR 할 프레임 수가 영상 길이가 아니라 화면 내용에 비례
+def _dhash(frame: MatLike) -> int:
+    """64bit difference hash (9x8 흑백 축소 후 가로로 이웃한 픽셀 밝기 비교)"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    value = 0
+    for bit in bits.flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def extract_distinct_frames(path: str) -> list[bytes] | None:
+    """
+    동영상에서 서로 다른 화면의 프레임만 JPEG로 뽑아 순서대로 반환합니다.
+    디코딩에 실패하면 None.
+    서로 다른 화면이 VIDEO_MAX_FRAMES장을 넘으면 일부만 OCR 하지 않고 예외를 올림
+    (뒷부분 대화가 조용히 빠진 결과 대신 실패 사유를 사용자에게 보여주도록)
+    """
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        print("⚠️ 동영상을 열 수 없어 프레임 추출을 건너뜁니다.")
+        return None
+
+    try:
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        step = max(1, round(fps * settings.VIDEO_FRAME_SAMPLE_SECONDS))
+
+        frames: list[bytes] = []
+        last_hash: int | None = None
+        index = 0
+        too_many_frames = False
+        # grab()도 프레임 디코딩은 함 (압축 코덱은 앞 프레임이 있어야 다음 프레임을 풀 수 있음)
+        # -> 건너뛰는 프레임은 retrieve(BGR 변환/복사) + dHash + JPEG 인코딩만 생략
+        while capture.grab():
+            if index % step == 0:
+                ok, frame = capture.retrieve()
+                if ok:
+                    frame_hash = _dhash(frame)
+                    if (
+                        last_hash is None
+                        or bin(frame_hash ^ last_hash).count("1")
+                        > settings.VIDEO_FRAME_DHASH_THRESHOLD
+                    ):
+                        if len(frames) >= settings.VIDEO_MAX_FRAMES:
+                            too_many_frames = True
+                            break
+                        ok, encoded = cv2.imencode(".jpg", frame)
+                        if ok:
+                            frames.append(encoded.tobytes())
+                            last_hash = frame_hash
+            index += 1
+    except Exception as e:
+        print(f"⚠️ 프레임 추출 실패: {e}")
+        return None
+    finally:
+        capture.release()
+
+    if too_many_frames:
+        raise Exception(
+            f"동영상에 서로 다른 화면이 {settings.VIDEO_MAX_FRAMES}장을 넘어 "
+            "전체를 분석할 수 없습니다. 동영상을 나눠서 올려주세요."
+        )
+    return frames or None
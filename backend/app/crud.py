@@ -1,10 +1,21 @@
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, select, update
 
 from app.core.security import get_password_hash, verify_password
-from app.models import File, FileCreate, User, UserCreate, UserUpdate
+from app.core.user_cache import invalidate_user
+from app.models import (
+    File,
+    FileAnalysis,
+    FileCreate,
+    FileStatus,
+    User,
+    UserCreate,
+    UserUpdate,
+)
 
 
 def create_user(*, session: Session, user_create: UserCreate) -> User:
@@ -27,6 +38,7 @@ def update_user(*, session: Session, db_user: User, user_in: UserUpdate) -> Any:
     db_user.sqlmodel_update(user_data, update=extra_data)
     session.add(db_user)
     session.commit()
+    invalidate_user(db_user.id)
     session.refresh(db_user)
     return db_user
 
@@ -47,10 +59,122 @@ def authenticate(*, session: Session, email: str, password: str) -> User | None:
 
 
 # [수정] create_item -> create_file 로 변경
-def create_file(*, session: Session, file_in: FileCreate, owner_id: uuid.UUID) -> File:
+def create_file(
+    *,
+    session: Session,
+    file_in: FileCreate,
+    owner_id: uuid.UUID,
+    status: FileStatus = FileStatus.DONE,
+    content_hash: str | None = None,
+    ocr_version: str | None = None,
+) -> File:
     # owner_id는 API에서 토큰으로 알아낸 유저 ID를 강제로 주입
-    db_file = File.model_validate(file_in, update={"owner_id": owner_id})
+    db_file = File.model_validate(
+        file_in,
+        update={
+            "owner_id": owner_id,
+            "status": status,
+            "content_hash": content_hash,
+            "ocr_version": ocr_version,
+        },
+    )
+    session.add(db_file)
+    session.commit()
+    session.refresh(db_file)
+    return db_file
+
+
+def update_file(*, session: Session, db_file: File, file_data: dict[str, Any]) -> File:
+    db_file.sqlmodel_update(file_data)
     session.add(db_file)
     session.commit()
     session.refresh(db_file)
-    return db_file
\ No newline at end of file
+    return db_file
+
+
+def fail_stale_files(*, session: Session, created_before: datetime, error: str) -> int:
+    # 오래 전에 올라왔는데 아직 pending/processing인 파일 -> failed (처리한 개수 반환)
+    statement = (
+        update(File)
+        .where(
+            col(File.status).in_([FileStatus.PENDING, FileStatus.PROCESSING]),
+            col(File.created_at) < created_before,
+        )
+        .values(status=FileStatus.FAILED, error=error)
+        .returning(col(File.id))
+    )
+    failed_ids = session.execute(statement).all()
+    session.commit()
+    return len(failed_ids)
+
+
+def get_processed_file_by_hash(
+    *,
+    session: Session,
+    content_hash: str,
+    ocr_version: str,
+    owner_id: uuid.UUID | None = None,
+) -> File | None:
+    # 같은 내용으로 OCR까지 끝난 파일 (owner_id가 없으면 소유자 무관, 텍스트 재사용용)
+    statement = select(File).where(
+        File.content_hash == content_hash,
+        File.ocr_version == ocr_version,
+        File.status == FileStatus.DONE,
+        col(File.extracted_text).is_not(None),
+    )
+    if owner_id:
+        statement = statement.where(File.owner_id == owner_id)
+    return session.exec(statement).first()
+
+
+def is_file_url_referenced(*, session: Session, file_url: str) -> bool:
+    statement = select(File.id).where(File.file_url == file_url).limit(1)
+    return session.exec(statement).first() is not None
+
+
+def get_file_analysis(
+    *, session: Session, file_id: uuid.UUID, prompt_version: str, model_version: str
+) -> FileAnalysis | None:
+    statement = select(FileAnalysis).where(
+        FileAnalysis.file_id == file_id,
+        FileAnalysis.prompt_version == prompt_version,
+        FileAnalysis.model_version == model_version,
+    )
+    return session.exec(statement).first()
+
+
+def save_file_analysis(
+    *,
+    session: Session,
+    file_id: uuid.UUID,
+    prompt_version: str,
+    model_version: str,
+    result: dict[str, Any],
+) -> FileAnalysis:
+    # 같은 (파일, 버전) 결과가 이미 있으면 그대로 둠
+    # (동시에 두 요청이 저장해도 unique 제약 위반 없이 먼저 저장된 쪽을 반환)
+    statement = (
+        insert(FileAnalysis)
+        .values(
+            id=uuid.uuid4(),
+            file_id=file_id,
+            prompt_version=prompt_version,
+            model_version=model_version,
+            result=result,
+            created_at=datetime.utcnow(),
+        )
+        .on_conflict_do_nothing(
+            index_elements=["file_id", "prompt_version", "model_version"]
+        )
+    )
+    session.execute(statement)
+    session.commit()
+    analysis = get_file_analysis(
+        session=session,
+        file_id=file_id,
+        prompt_version=prompt_version,
+        model_version=model_version,
+    )
+    # 방금 넣었거나 먼저 저장된 행이 있으므로 항상 존재
+    assert analysis is not None
+    return analysis
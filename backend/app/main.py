@@ -1,10 +1,21 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
+from sqlalchemy.orm.exc import ObjectDeletedError, StaleDataError
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core.cache import close_redis_clients
 from app.core.config import settings
+from app.core.jobs import start_job_workers, stop_job_workers
+from app.core.llm import close_llm_clients, init_llm_clients
+from app.core.naver_client import close_naver_clients, init_naver_clients
+from app.core.security import PasswordHasherBusyError, shutdown_password_hasher
+from app.core.storage import close_s3_client
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -14,8 +25,28 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # 외부 API 클라이언트(커넥션 풀)는 워커 프로세스 수명 동안 재사용
+    # Redis / R2 / Modal은 처음 사용할 때 연결 (부팅을 막지 않음), 종료 시 정리
+    init_naver_clients()
+    init_llm_clients()
+    start_job_workers()
+    yield
+    workers_stopped = stop_job_workers()
+    await close_naver_clients()
+    # 작업 스레드가 아직 처리 중이면 쓰고 있는 클라이언트는 닫지 않음 (프로세스 종료 시 정리)
+    if workers_stopped:
+        await close_llm_clients()
+        await close_redis_clients()
+        close_s3_client()
+    shutdown_password_hasher()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
 )
@@ -30,4 +61,25 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+
+# 비밀번호 해시 대기열이 가득 차면 기다리지 않고 바로 503 (클라이언트는 잠시 후 재시도)
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(
+    _request: Request, _exc: PasswordHasherBusyError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "요청이 많습니다. 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": "1"},
+    )
+
+
+# 캐시된 객체(예: get_current_user의 사용자)가 그 사이 다른 워커에서 삭제됐으면
+# 지연 로딩 / UPDATE에서 행이 없다는 예외가 나므로 500 대신 404
+@app.exception_handler(ObjectDeletedError)
+@app.exception_handler(StaleDataError)
+async def deleted_row_handler(_request: Request, _exc: Exception) -> JSONResponse:
+    return JSONResponse(status_code=404, content={"detail": "이미 삭제된 데이터입니다."})
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
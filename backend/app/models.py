@@ -1,8 +1,12 @@
 import uuid
 from datetime import datetime
+from enum import Enum
+from typing import Any
 
 from pydantic import EmailStr
-from sqlmodel import Field, Relationship, SQLModel
+from sqlalchemy import JSON, Column, Index, UniqueConstraint, text
+from sqlalchemy.orm import deferred
+from sqlmodel import AutoString, Field, Relationship, SQLModel
 
 
 # Shared properties
@@ -77,16 +81,57 @@ class FileUpdate(FileBase):
     extracted_text: str | None = Field(default=None)
 
 
+# 업로드 후 OCR/분석 처리 상태 (백그라운드 작업 큐)
+class FileStatus(str, Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+# extracted_text는 길이 제한이 없어서 기본은 지연 로딩 (실제로 접근할 때만 SELECT)
+# -> session.get / 목록 조회 / 상태 조회에서는 본문을 읽지 않음
+# (DB에서는 lz4 컬럼 압축으로 저장 -> migration 0a6d3e8b7c41)
+_file_extracted_text_column = Column("extracted_text", AutoString, nullable=True)
+
+
 # Database model, database table inferred from class name
 class File(FileBase, table=True):
+    # 내 파일 목록 (owner_id 필터 + created_at 최신순) / user 삭제 시 CASCADE 조회용
+    __table_args__ = (
+        Index("ix_file_owner_id_created_at", "owner_id", text("created_at DESC")),
+        # 내용 검색 (pg_trgm 글자 3-gram, 한국어도 형태소 분석 없이 부분 일치 검색 가능)
+        Index(
+            "ix_file_extracted_text_trgm",
+            "extracted_text",
+            postgresql_using="gin",
+            postgresql_ops={"extracted_text": "gin_trgm_ops"},
+        ),
+    )
+    __mapper_args__ = {
+        "properties": {"extracted_text": deferred(_file_extracted_text_column)}
+    }
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    extracted_text: str | None = Field(
+        default=None, sa_column=_file_extracted_text_column
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    status: str = Field(default=FileStatus.DONE, max_length=20)
+    error: str | None = Field(default=None)
+    # 업로드 원본의 BLAKE2b 해시 (같은 파일 재업로드 시 OCR/R2 업로드 생략)
+    content_hash: str | None = Field(default=None, max_length=64, index=True)
+    # extracted_text를 만든 OCR 파이프라인 버전 (다른 버전 결과는 재사용하지 않음)
+    ocr_version: str | None = Field(default=None, max_length=16)
     
     # User와 연결 (Foreign Key)
     owner_id: uuid.UUID = Field(
         foreign_key="user.id", nullable=False, ondelete="CASCADE"
     )
     owner: User | None = Relationship(back_populates="files")
+    analyses: list["FileAnalysis"] = Relationship(
+        back_populates="file", cascade_delete=True
+    )
 
 
 # Properties to return via API
@@ -94,12 +139,92 @@ class FilePublic(FileBase):
     id: uuid.UUID
     owner_id: uuid.UUID
     created_at: datetime
+    status: FileStatus
+    error: str | None = None
+
+
+class FileStatusPublic(SQLModel):
+    id: uuid.UUID
+    status: FileStatus
+    error: str | None = None
+
+
+# 내용 검색 결과 (본문 전체 대신 검색어 주변 snippet만)
+class FileSearchResult(SQLModel):
+    id: uuid.UUID
+    filename: str
+    created_at: datetime
+    snippet: str
+    score: float
+
+
+class FileSearchResults(SQLModel):
+    data: list[FileSearchResult]
+
+
+# 브라우저 -> R2 직접 업로드 (presigned PUT)
+class FileUploadRequest(SQLModel):
+    filename: str = Field(max_length=255)
+    content_type: str = Field(max_length=100)
+    size: int = Field(gt=0)
+
+
+class FileUploadPublic(SQLModel):
+    # url로 headers를 붙여서 파일 본문을 그대로 PUT
+    url: str
+    headers: dict[str, str]
+    object_key: str
+    expires_in: int
+
+
+class FileUploadComplete(SQLModel):
+    # 파일명/타입/크기는 발급 요청 때 받은 값을 사용 (완료 요청에서는 키만)
+    object_key: str = Field(max_length=1024)
+
+
+# 목록 조회용 (extracted_text 전체 대신 앞부분만)
+class FileSummary(SQLModel):
+    id: uuid.UUID
+    filename: str
+    file_url: str | None = None
+    owner_id: uuid.UUID
+    created_at: datetime
+    status: FileStatus
+    error: str | None = None
+    text_preview: str | None = None
+    text_length: int = 0
 
 
 class FilesPublic(SQLModel):
     # [수정] List -> list
-    data: list[FilePublic]
+    data: list[FileSummary]
     count: int
+    # 다음 페이지 커서 (마지막 페이지면 None)
+    next_cursor: str | None = None
+
+
+# ==========================================
+# LLM 분석 결과 영구 저장 (Redis는 앞단 캐시)
+# ==========================================
+
+class FileAnalysis(SQLModel, table=True):
+    __tablename__ = "file_analysis"
+    __table_args__ = (
+        UniqueConstraint("file_id", "prompt_version", "model_version"),
+    )
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    file_id: uuid.UUID = Field(
+        foreign_key="file.id", nullable=False, ondelete="CASCADE", index=True
+    )
+    # 프롬프트/모델이 바뀌면 새 결과로 다시 분석되도록 버전별로 저장
+    prompt_version: str = Field(max_length=32)
+    model_version: str = Field(max_length=64)
+    # AnalysisResult.model_dump() 결과
+    result: dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    file: File | None = Relationship(back_populates="analyses")
 
 
 # ==========================================
@@ -0,0 +1,466 @@
+import json
+import uuid
+from collections.abc import Generator
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import httpx
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.api.routes import files as files_route
+from app.core import jobs, storage
+from app.core.config import settings
+from app.models import File, FileStatus
+from tests.utils.file import create_random_file
+from tests.utils.user import authentication_token_from_email
+from tests.utils.utils import random_email
+
+R2_DOMAIN = "https://cdn.example.com"
+
+
+@pytest.fixture
+def s3_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    client = MagicMock()
+    client.generate_presigned_url.return_value = "https://r2.example.com/presigned"
+    client.head_object.return_value = {"ContentLength": 1024, "ContentType": "video/mp4"}
+    monkeypatch.setattr(storage, "get_s3_client", lambda: client)
+    monkeypatch.setattr(settings, "R2_BUCKET_NAME", "bucket")
+    monkeypatch.setattr(settings, "R2_PUBLIC_DOMAIN", R2_DOMAIN)
+    return client
+
+
+@pytest.fixture
+def enqueue_file_job() -> Generator[MagicMock, None, None]:
+    with patch("app.api.routes.files.enqueue_file_job", return_value=True) as enqueue:
+        yield enqueue
+
+
+def _presign(
+    client: TestClient,
+    headers: dict[str, str],
+    *,
+    filename: str = "clip.mp4",
+    content_type: str = "video/mp4",
+    size: int = 1024,
+) -> httpx.Response:
+    return client.post(
+        f"{settings.API_V1_STR}/files/uploads",
+        headers=headers,
+        json={"filename": filename, "content_type": content_type, "size": size},
+    )
+
+
+def _presigned_key(client: TestClient, headers: dict[str, str]) -> str:
+    r = _presign(client, headers)
+    assert r.status_code == 200, r.text
+    object_key: str = r.json()["object_key"]
+    return object_key
+
+
+def _complete(
+    client: TestClient, headers: dict[str, str], object_key: str
+) -> httpx.Response:
+    return client.post(
+        f"{settings.API_V1_STR}/files/uploads/complete",
+        headers=headers,
+        json={"object_key": object_key},
+    )
+
+
+def _pending(redis_client: fakeredis.FakeRedis, object_key: str) -> Any:
+    cached = redis_client.get(f"{storage.PENDING_UPLOAD_PREFIX}{object_key}")
+    return json.loads(cached) if cached else None
+
+
+def test_create_file_upload_returns_presigned_put(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    redis_client: fakeredis.FakeRedis,
+    s3_client: MagicMock,
+) -> None:
+    r = _presign(client, normal_user_token_headers, filename="Clip.MP4")
+
+    assert r.status_code == 200
+    data = r.json()
+    assert data["url"] == "https://r2.example.com/presigned"
+    assert data["headers"] == {"Content-Type": "video/mp4"}
+    assert data["object_key"].endswith(".mp4")
+    assert "clip" not in data["object_key"].lower()
+    params = s3_client.generate_presigned_url.call_args.kwargs["Params"]
+    assert params["Key"] == data["object_key"]
+    assert params["ContentLength"] == 1024
+    pending = _pending(redis_client, data["object_key"])
+    assert pending["size"] == 1024
+    assert pending["content_type"] == "video/mp4"
+
+
+@pytest.mark.usefixtures("redis_client")
+@pytest.mark.parametrize(
+    ("filename", "content_type", "size", "status_code"),
+    [
+        ("notes.pdf", "application/pdf", 1024, 400),
+        ("clip.mp4", "application/octet-stream", 1024, 400),
+        ("clip.mp4", "video/mp4", 10**12, 413),
+    ],
+)
+def test_create_file_upload_rejects_invalid_request(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    s3_client: MagicMock,
+    filename: str,
+    content_type: str,
+    size: int,
+    status_code: int,
+) -> None:
+    r = _presign(
+        client,
+        normal_user_token_headers,
+        filename=filename,
+        content_type=content_type,
+        size=size,
+    )
+
+    assert r.status_code == status_code
+    s3_client.generate_presigned_url.assert_not_called()
+
+
+@pytest.mark.usefixtures("s3_client")
+def test_create_file_upload_without_redis(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(storage, "get_redis_client", lambda: None)
+
+    r = _presign(client, normal_user_token_headers)
+
+    assert r.status_code == 503
+
+
+def test_complete_file_upload_registers_file_and_queues_job(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    db: Session,
+    redis_client: fakeredis.FakeRedis,
+    s3_client: MagicMock,
+    enqueue_file_job: MagicMock,
+) -> None:
+    object_key = _presigned_key(client, normal_user_token_headers)
+
+    r = _complete(client, normal_user_token_headers, object_key)
+
+    assert r.status_code == 200, r.text
+    data = r.json()
+    assert data["file_url"] == f"{R2_DOMAIN}/{object_key}"
+    db_file = db.get(File, uuid.UUID(data["id"]))
+    assert db_file
+    assert db_file.status == FileStatus.PENDING
+    assert enqueue_file_job.call_args.kwargs["object_key"] == object_key
+    assert _pending(redis_client, object_key) is None
+    s3_client.delete_object.assert_not_called()
+
+    # 이미 완료된 업로드는 다시 완료할 수 없음
+    r = _complete(client, normal_user_token_headers, object_key)
+    assert r.status_code == 404
+
+
+@pytest.mark.usefixtures("s3_client", "enqueue_file_job")
+def test_complete_file_upload_of_other_user(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    superuser_token_headers: dict[str, str],
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    object_key = _presigned_key(client, normal_user_token_headers)
+
+    r = _complete(client, superuser_token_headers, object_key)
+
+    assert r.status_code == 403
+    assert _pending(redis_client, object_key) is not None
+
+
+@pytest.mark.usefixtures("redis_client", "s3_client", "enqueue_file_job")
+def test_complete_file_upload_not_presigned(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = _complete(client, normal_user_token_headers, "prod/uploads/unknown.mp4")
+
+    assert r.status_code == 404
+
+
+@pytest.mark.usefixtures("redis_client", "enqueue_file_job")
+def test_complete_file_upload_missing_object(
+    client: TestClient, normal_user_token_headers: dict[str, str], s3_client: MagicMock
+) -> None:
+    object_key = _presigned_key(client, normal_user_token_headers)
+    s3_client.head_object.side_effect = RuntimeError("NoSuchKey")
+
+    r = _complete(client, normal_user_token_headers, object_key)
+
+    assert r.status_code == 404
+
+
+@pytest.mark.usefixtures("enqueue_file_job")
+@pytest.mark.parametrize(
+    "head",
+    [
+        {"ContentLength": 2048, "ContentType": "video/mp4"},
+        {"ContentLength": 1024, "ContentType": "text/html"},
+    ],
+)
+def test_complete_file_upload_rejects_mismatched_object(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    redis_client: fakeredis.FakeRedis,
+    s3_client: MagicMock,
+    head: dict[str, Any],
+) -> None:
+    object_key = _presigned_key(client, normal_user_token_headers)
+    s3_client.head_object.return_value = head
+
+    r = _complete(client, normal_user_token_headers, object_key)
+
+    assert r.status_code == 400
+    s3_client.delete_object.assert_called_once_with(Bucket="bucket", Key=object_key)
+    assert _pending(redis_client, object_key) is None
+
+
+@pytest.mark.usefixtures("redis_client", "s3_client", "enqueue_file_job")
+def test_complete_file_upload_concurrent_completion(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    object_key = _presigned_key(client, normal_user_token_headers)
+
+    # 다른 요청이 먼저 발급 내역을 가져간 경우
+    with patch("app.api.routes.files.claim_pending_upload", return_value=False):
+        r = _complete(client, normal_user_token_headers, object_key)
+
+    assert r.status_code == 409
+
+
+@pytest.fixture
+def media_pipeline(monkeypatch: pytest.MonkeyPatch) -> dict[str, MagicMock]:
+    # 작업 큐 대신 요청 안에서 처리하는 경로로 OCR / R2 업로드 호출을 확인
+    monkeypatch.setattr(files_route, "enqueue_file_job", MagicMock(return_value=False))
+    mocks = {
+        "ocr": MagicMock(return_value="민수: 강남역 가자"),
+        "upload": MagicMock(
+            side_effect=lambda _f, _name, _type, key: f"{R2_DOMAIN}/{key}"
+        ),
+    }
+    monkeypatch.setattr(jobs, "_run_ocr_from_path", mocks["ocr"])
+    monkeypatch.setattr(jobs, "upload_fileobj_to_r2", mocks["upload"])
+    monkeypatch.setattr(jobs, "get_r2_object_size", lambda _key: None)
+    return mocks
+
+
+def _upload(
+    client: TestClient, headers: dict[str, str], content: bytes
+) -> httpx.Response:
+    return client.post(
+        f"{settings.API_V1_STR}/files/",
+        headers=headers,
+        files={"file": ("chat.png", content, "image/png")},
+    )
+
+
+@pytest.mark.usefixtures("redis_client")
+def test_create_file_reuses_own_processed_upload(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    media_pipeline: dict[str, MagicMock],
+) -> None:
+    content = uuid.uuid4().bytes
+
+    first = _upload(client, normal_user_token_headers, content)
+    second = _upload(client, normal_user_token_headers, content)
+
+    assert first.status_code == 200, first.text
+    assert second.status_code == 200, second.text
+    assert second.json()["id"] != first.json()["id"]
+    assert second.json()["file_url"] == first.json()["file_url"]
+    assert second.json()["extracted_text"] == "민수: 강남역 가자"
+    assert media_pipeline["ocr"].call_count == 1
+    assert media_pipeline["upload"].call_count == 1
+
+
+def test_create_file_reuses_other_users_ocr_text_only(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    superuser_token_headers: dict[str, str],
+    media_pipeline: dict[str, MagicMock],
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    content = uuid.uuid4().bytes
+
+    first = _upload(client, normal_user_token_headers, content)
+    # Redis 캐시가 비어도 DB에 저장된 OCR 결과를 찾음
+    redis_client.flushall()
+    second = _upload(client, superuser_token_headers, content)
+
+    assert first.status_code == 200, first.text
+    assert second.status_code == 200, second.text
+    assert second.json()["extracted_text"] == "민수: 강남역 가자"
+    # 다른 사용자의 객체 URL은 재사용하지 않고 자기 키로 다시 업로드
+    assert second.json()["file_url"] != first.json()["file_url"]
+    assert second.json()["owner_id"] in second.json()["file_url"]
+    assert media_pipeline["ocr"].call_count == 1
+    assert media_pipeline["upload"].call_count == 2
+
+
+def _new_user(client: TestClient, db: Session) -> tuple[dict[str, str], uuid.UUID]:
+    # 다른 테스트의 파일이 섞이지 않도록 빈 사용자로 시작
+    headers = authentication_token_from_email(
+        client=client, email=random_email(), db=db
+    )
+    owner_id = uuid.UUID(
+        client.get(f"{settings.API_V1_STR}/users/me", headers=headers).json()["id"]
+    )
+    return headers, owner_id
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2025, 12, 1, 14, 30, 5, 123456, tzinfo=timezone.utc)
+    file_id = uuid.uuid4()
+
+    cursor = files_route._encode_cursor(created_at, file_id)
+
+    assert files_route._decode_cursor(cursor) == (created_at, file_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!!", "bm8tc2VwYXJhdG9y", ""])
+def test_decode_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        files_route._decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_read_files_paginates_with_cursor(client: TestClient, db: Session) -> None:
+    headers, owner_id = _new_user(client, db)
+    created = [
+        create_random_file(db, owner_id=owner_id, extracted_text=f"{i}" * 300)
+        for i in range(5)
+    ]
+    # 최신순 (created_at, id 내림차순)
+    expected = [
+        str(f.id) for f in sorted(created, key=lambda f: (f.created_at, f.id), reverse=True)
+    ]
+
+    pages = []
+    cursor = None
+    while True:
+        params: dict[str, Any] = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get(f"{settings.API_V1_STR}/files/", headers=headers, params=params)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["count"] == 5
+        pages.append([item["id"] for item in body["data"]])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [file_id for page in pages for file_id in page] == expected
+
+
+def test_read_files_returns_preview_instead_of_full_text(
+    client: TestClient, db: Session
+) -> None:
+    headers, owner_id = _new_user(client, db)
+    create_random_file(db, owner_id=owner_id, extracted_text="가" * 500)
+
+    r = client.get(f"{settings.API_V1_STR}/files/", headers=headers)
+
+    assert r.status_code == 200, r.text
+    [item] = r.json()["data"]
+    assert "extracted_text" not in item
+    assert item["text_preview"] == "가" * files_route.TEXT_PREVIEW_CHARS
+    assert item["text_length"] == 500
+    assert r.json()["next_cursor"] is None
+
+
+def test_read_files_rejects_invalid_cursor(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/files/",
+        headers=normal_user_token_headers,
+        params={"cursor": "not-base64!!"},
+    )
+
+    assert r.status_code == 400
+
+
+def _search(client: TestClient, headers: dict[str, str], q: str) -> httpx.Response:
+    return client.get(
+        f"{settings.API_V1_STR}/files/search", headers=headers, params={"q": q}
+    )
+
+
+def test_search_files_returns_snippet_around_match(
+    client: TestClient, db: Session
+) -> None:
+    headers, owner_id = _new_user(client, db)
+    text = "가" * 300 + "민수: 성수동 카페 가자" + "나" * 300
+    file = create_random_file(db, owner_id=owner_id, extracted_text=text)
+    create_random_file(db, owner_id=owner_id, extracted_text="지수: 홍대 가자")
+
+    r = _search(client, headers, "성수동 카페")
+
+    assert r.status_code == 200, r.text
+    [result] = r.json()["data"]
+    assert result["id"] == str(file.id)
+    assert "성수동 카페" in result["snippet"]
+    assert result["snippet"].index("성수동 카페") == files_route.SNIPPET_CONTEXT_CHARS
+    assert len(result["snippet"]) == files_route.SNIPPET_CHARS
+
+
+def test_search_files_two_char_query_uses_bigram_path(
+    client: TestClient, db: Session
+) -> None:
+    headers, owner_id = _new_user(client, db)
+    file = create_random_file(db, owner_id=owner_id, extracted_text="내일 강남 어때")
+    create_random_file(db, owner_id=owner_id, extracted_text="내일 남강 어때")
+
+    r = _search(client, headers, "강남")
+
+    assert r.status_code == 200, r.text
+    assert [result["id"] for result in r.json()["data"]] == [str(file.id)]
+
+
+def test_search_files_only_searches_own_files(client: TestClient, db: Session) -> None:
+    headers, owner_id = _new_user(client, db)
+    create_random_file(db, extracted_text="다른 사람의 비밀 약속 장소")
+
+    r = _search(client, headers, "비밀 약속")
+
+    assert r.status_code == 200, r.text
+    assert r.json()["data"] == []
+
+
+def test_search_files_treats_wildcards_literally(client: TestClient, db: Session) -> None:
+    headers, owner_id = _new_user(client, db)
+    file = create_random_file(db, owner_id=owner_id, extracted_text="할인 50% 쿠폰")
+    create_random_file(db, owner_id=owner_id, extracted_text="할인 500원 쿠폰")
+
+    r = _search(client, headers, "50%")
+
+    assert r.status_code == 200, r.text
+    assert [result["id"] for result in r.json()["data"]] == [str(file.id)]
+
+
+@pytest.mark.parametrize("q", ["가", " 가 "])
+def test_search_files_rejects_short_query(
+    client: TestClient, normal_user_token_headers: dict[str, str], q: str
+) -> None:
+    r = _search(client, normal_user_token_headers, q)
+
+    assert r.status_code in (400, 422)
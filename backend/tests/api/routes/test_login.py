@@ -1,8 +1,11 @@
+import threading
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+from app.core import security
 from app.core.config import settings
 from app.core.security import verify_password
 from app.crud import create_user
@@ -116,3 +119,24 @@ def test_reset_password_invalid_token(
     assert "detail" in response
     assert r.status_code == 400
     assert response["detail"] == "Invalid token"
+
+
+def test_get_access_token_sheds_load_when_hasher_busy(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # 대기열(1칸)이 이미 다른 요청으로 차 있는 상태
+    pending = threading.BoundedSemaphore(1)
+    pending.acquire()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(security, "_password_pending", pending)
+    rejected = security.get_password_hash_stats()["rejected"]
+
+    login_data = {
+        "username": settings.FIRST_SUPERUSER,
+        "password": settings.FIRST_SUPERUSER_PASSWORD,
+    }
+    r = client.post(f"{settings.API_V1_STR}/login/access-token", data=login_data)
+
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+    assert security.get_password_hash_stats()["rejected"] == rejected + 1
@@ -0,0 +1,108 @@
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.llm import MODEL_VERSION, PROMPT_VERSION, AnalysisResult
+from tests.utils.file import create_random_file
+from tests.utils.utils import random_lower_string
+
+
+def _analysis(location: str) -> AnalysisResult:
+    return AnalysisResult.model_validate(
+        {
+            "metadata": {"location": location, "group_name": "친구 2인", "date": ""},
+            "personas": [{"name": "민수", "likes": ["한식"], "dislikes": []}],
+            "courses": [{"step": 1, "category": "식당", "final_query": f"{location} 한식"}],
+        }
+    )
+
+
+@pytest.fixture
+def owner_id(db: Session, normal_user_token_headers: dict[str, str]) -> uuid.UUID:
+    assert normal_user_token_headers
+    user = crud.get_user_by_email(session=db, email=settings.EMAIL_TEST_USER)
+    assert user
+    return user.id
+
+
+def test_recommendation_stores_new_analysis(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    db: Session,
+    owner_id: uuid.UUID,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    text = f"오후 2:00, 민수 : 강남역 가자 {random_lower_string()}"
+    file = create_random_file(db, owner_id=owner_id, extracted_text=text)
+    analysis = _analysis("강남역")
+
+    with patch(
+        "app.core.llm._call_llm_async", AsyncMock(return_value=analysis)
+    ) as call_llm:
+        r = client.post(
+            f"{settings.API_V1_STR}/recommendations/",
+            headers=normal_user_token_headers,
+            json={"file_id": str(file.id)},
+        )
+
+    assert r.status_code == 200
+    assert r.json()["analysis"]["metadata"]["location"] == "강남역"
+    call_llm.assert_awaited_once()
+    stored = crud.get_file_analysis(
+        session=db,
+        file_id=file.id,
+        prompt_version=PROMPT_VERSION,
+        model_version=MODEL_VERSION,
+    )
+    assert stored
+    assert stored.result["metadata"]["location"] == "강남역"
+
+
+def test_recommendation_reuses_stored_analysis(
+    client: TestClient,
+    normal_user_token_headers: dict[str, str],
+    db: Session,
+    owner_id: uuid.UUID,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    text = f"오후 2:00, 지영 : 홍대 가자 {random_lower_string()}"
+    file = create_random_file(db, owner_id=owner_id, extracted_text=text)
+    crud.save_file_analysis(
+        session=db,
+        file_id=file.id,
+        prompt_version=PROMPT_VERSION,
+        model_version=MODEL_VERSION,
+        result=_analysis("홍대").model_dump(),
+    )
+
+    with patch("app.core.llm._call_llm_async", AsyncMock()) as call_llm:
+        r = client.post(
+            f"{settings.API_V1_STR}/recommendations/",
+            headers=normal_user_token_headers,
+            json={"file_id": str(file.id)},
+        )
+
+    assert r.status_code == 200
+    assert r.json()["analysis"]["metadata"]["location"] == "홍대"
+    call_llm.assert_not_awaited()
+
+
+def test_recommendation_for_other_users_file(
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+) -> None:
+    file = create_random_file(db, extracted_text="오후 2:00, 민수 : 안녕")
+
+    r = client.post(
+        f"{settings.API_V1_STR}/recommendations/",
+        headers=normal_user_token_headers,
+        json={"file_id": str(file.id)},
+    )
+
+    assert r.status_code == 403
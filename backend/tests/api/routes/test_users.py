@@ -7,7 +7,9 @@ from sqlmodel import Session, select
 from app import crud
 from app.core.config import settings
 from app.core.security import verify_password
+from app.core.user_cache import invalidate_user
 from app.models import User, UserCreate
+from tests.utils.user import user_authentication_headers
 from tests.utils.utils import random_email, random_lower_string
 
 
@@ -484,3 +486,39 @@ def test_delete_user_without_privileges(
     )
     assert r.status_code == 403
     assert r.json()["detail"] == "The user doesn't have enough privileges"
+
+
+def test_cached_user_deleted_by_another_worker(client: TestClient, db: Session) -> None:
+    username = random_email()
+    password = random_lower_string()
+    user_in = UserCreate(email=username, password=password)
+    user = crud.create_user(session=db, user_create=user_in)
+    headers = user_authentication_headers(
+        client=client, email=username, password=password
+    )
+    # 캐시에 올려둠
+    r = client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.status_code == 200
+
+    # 다른 워커에서 삭제 (이 프로세스의 캐시는 무효화되지 않음)
+    db.delete(user)
+    db.commit()
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/me/password",
+        headers=headers,
+        json={"current_password": password, "new_password": random_lower_string()},
+    )
+    assert r.status_code == 404
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/me",
+        headers=headers,
+        json={"full_name": "Updated Name"},
+    )
+    assert r.status_code == 404
+
+    # 캐시가 무효화되면 DB에서 다시 확인
+    invalidate_user(user.id)
+    r = client.get(f"{settings.API_V1_STR}/users/me", headers=headers)
+    assert r.status_code == 404
+    assert r.json()["detail"] == "User not found"
@@ -0,0 +1,42 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import utils as utils_route
+from app.core.config import settings
+
+
+def test_backend_health_reports_each_backend(
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(utils_route, "get_redis_health", lambda: {"status": "ok"})
+    monkeypatch.setattr(
+        utils_route,
+        "get_r2_health",
+        lambda: {"status": "unavailable", "error": "timeout"},
+    )
+    monkeypatch.setattr(
+        utils_route, "get_modal_health", lambda: {"status": "not_configured"}
+    )
+
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/backend-health/", headers=superuser_token_headers
+    )
+
+    assert r.status_code == 200
+    assert r.json() == {
+        "redis": {"status": "ok"},
+        "r2": {"status": "unavailable", "error": "timeout"},
+        "modal": {"status": "not_configured"},
+    }
+
+
+def test_backend_health_requires_superuser(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/utils/backend-health/", headers=normal_user_token_headers
+    )
+
+    assert r.status_code == 403
@@ -1,13 +1,15 @@
 from collections.abc import Generator
 
+import fakeredis
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, delete
 
+from app.core import cache
 from app.core.config import settings
 from app.core.db import engine, init_db
 from app.main import app
-from app.models import Item, User
+from app.models import File, User
 from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
 
@@ -17,7 +19,7 @@ def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
         init_db(session)
         yield session
-        statement = delete(Item)
+        statement = delete(File)
         session.execute(statement)
         statement = delete(User)
         session.execute(statement)
@@ -40,3 +42,14 @@ def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db
     )
+
+
+@pytest.fixture
+def redis_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[fakeredis.FakeRedis, None, None]:
+    # get_redis_client()를 쓰는 모든 코드가 같은 (가짜) Redis를 보도록
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(cache, "_redis_client", client)
+    yield client
+    client.flushall()
@@ -0,0 +1,78 @@
+import subprocess
+import sys
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import cache
+from app.core.config import settings
+
+
+@pytest.fixture
+def redis_factory(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    # 연결 상태를 비운 채로 시작하고, redis.Redis 생성은 가짜로
+    monkeypatch.setattr(cache, "_redis_client", None)
+    monkeypatch.setattr(cache, "_redis_retry_at", 0.0)
+    monkeypatch.setattr(cache, "_redis_error", None)
+    factory = MagicMock()
+    monkeypatch.setattr(cache.redis, "Redis", factory)
+    return factory
+
+
+def test_get_redis_client_connects_once(redis_factory: MagicMock) -> None:
+    first = cache.get_redis_client()
+    second = cache.get_redis_client()
+
+    assert first is redis_factory.return_value
+    assert second is first
+    redis_factory.assert_called_once()
+    redis_factory.return_value.ping.assert_called_once()
+    assert cache.get_redis_health() == {"status": "ok"}
+
+
+def test_get_redis_client_backs_off_after_failure(
+    redis_factory: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    redis_factory.return_value.ping.side_effect = ConnectionError("refused")
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+
+    assert cache.get_redis_client() is None
+    # 대기 시간 동안은 다시 연결하지 않고 바로 None
+    assert cache.get_redis_client() is None
+    assert redis_factory.call_count == 1
+    redis_factory.return_value.close.assert_called_once()
+    assert cache.get_redis_health() == {"status": "unavailable", "error": "refused"}
+
+    now += settings.BACKEND_RETRY_SECONDS
+    redis_factory.return_value.ping.side_effect = None
+
+    assert cache.get_redis_client() is redis_factory.return_value
+    assert redis_factory.call_count == 2
+    assert cache.get_redis_health() == {"status": "ok"}
+
+
+def test_importing_app_does_not_connect_to_backends() -> None:
+    # 워커 부팅(import) 중에는 Redis / R2 / Modal에 연결하지 않음
+    script = textwrap.dedent(
+        """
+        from unittest.mock import patch
+
+        def fail(*args, **kwargs):
+            raise AssertionError("backend connection at import time")
+
+        with (
+            patch("redis.Redis.ping", fail),
+            patch("boto3.client", fail),
+            patch("modal.Cls.from_name", fail),
+        ):
+            import app.main  # noqa: F401
+        """
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
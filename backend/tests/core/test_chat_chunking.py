@@ -0,0 +1,36 @@
+from app.core.chat_chunking import split_chat_log
+
+
+def test_split_chat_log_short_text_is_single_chunk() -> None:
+    text = "오후 2:00, 민수 : 안녕"
+    assert split_chat_log(text, 100) == [text]
+
+
+def test_split_chat_log_respects_max_chars_and_line_boundaries() -> None:
+    lines = [f"오후 2:{i:02d}, 민수 : 메시지 {i}" for i in range(30)]
+    text = "\n".join(lines)
+
+    chunks = split_chat_log(text, 80)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 80 for chunk in chunks)
+    assert "\n".join(chunks).splitlines() == lines
+
+
+def test_split_chat_log_splits_early_at_date_separator() -> None:
+    first_day = [f"오후 2:0{i}, 민수 : 첫째 날 {i}" for i in range(3)]
+    separator = "--------------- 2025년 12월 2일 화요일 ---------------"
+    second_day = ["오후 3:00, 지영 : 둘째 날"]
+    text = "\n".join(first_day + [separator] + second_day)
+
+    chunks = split_chat_log(text, 120)
+
+    assert chunks == ["\n".join(first_day), "\n".join([separator] + second_day)]
+
+
+def test_split_chat_log_cuts_overlong_line() -> None:
+    text = "가" * 25
+
+    chunks = split_chat_log(text, 10)
+
+    assert chunks == ["가" * 10, "가" * 10, "가" * 5]
@@ -0,0 +1,86 @@
+import unicodedata
+
+from app.core.chat_preprocess import normalize_for_cache_key, preprocess_chat_log
+
+
+def test_preprocess_chat_log_mobile_format() -> None:
+    text = "\n".join(
+        [
+            "--------------- 2025년 12월 1일 월요일 ---------------",
+            "오후 2:00, 라이언님이 들어왔습니다.",
+            "오후 2:01, 민수 : 강남역에서 만나자ㅋㅋㅋㅋㅋ",
+            "오후 2:02, 지영 : ㅋㅋㅋ",
+            "오후 2:03, 지영 : 좋아",
+            "오후 2:03, 지영 : 좋아",
+            "오후 2:04, 민수 : 사진",
+        ]
+    )
+
+    result = preprocess_chat_log(text)
+
+    assert result.transcript == "\n".join(
+        [
+            "--- 2025년 12월 1일 월요일 ---",
+            "민수: 강남역에서 만나자ㅋㅋ",
+            "지영: 좋아",
+        ]
+    )
+    assert result.participants == ["민수", "지영"]
+
+
+def test_preprocess_chat_log_pc_format_and_continuation_lines() -> None:
+    text = "[민수] [오후 2:00] 파스타 먹자\n크림으로\n[지영] [오후 2:01] 해산물은 싫어"
+
+    result = preprocess_chat_log(text)
+
+    assert result.transcript == "민수: 파스타 먹자 크림으로\n지영: 해산물은 싫어"
+    assert result.participants == ["민수", "지영"]
+
+
+def test_preprocess_chat_log_keeps_last_of_consecutive_date_lines() -> None:
+    text = "\n".join(
+        [
+            "2025년 12월 1일 월요일",
+            "2025년 12월 2일 화요일",
+            "오후 2:00, 민수 : 안녕",
+        ]
+    )
+
+    assert preprocess_chat_log(text).transcript == "--- 2025년 12월 2일 화요일 ---\n민수: 안녕"
+
+
+def test_preprocess_chat_log_returns_original_without_headers() -> None:
+    text = "  그냥 메모\n두 번째 줄  "
+
+    result = preprocess_chat_log(text)
+
+    assert result.transcript == text.strip()
+    assert result.participants == []
+
+
+def test_preprocess_chat_log_normalizes_nfd() -> None:
+    text = unicodedata.normalize("NFD", "오후 2:00, 민수 : 안녕")
+
+    result = preprocess_chat_log(text)
+
+    assert result.transcript == "민수: 안녕"
+    assert result.participants == ["민수"]
+
+
+def test_normalize_for_cache_key_ignores_whitespace_punctuation_and_timestamps() -> None:
+    a = "오후 2:00, 민수 : 강남역 갈래?\n[지영] [오후 2:01] 좋아!"
+    b = "오후 3:15,민수: 강남역  갈래\n\n[지영] [오전 9:00]  좋아"
+
+    assert normalize_for_cache_key(a) == normalize_for_cache_key(b)
+
+
+def test_normalize_for_cache_key_strips_time_only_lines() -> None:
+    assert normalize_for_cache_key("민수 안녕\n오후 2:00\n14:05") == normalize_for_cache_key(
+        "민수 안녕"
+    )
+
+
+def test_normalize_for_cache_key_keeps_times_inside_messages() -> None:
+    assert normalize_for_cache_key("민수: 7:30에 만나") != normalize_for_cache_key(
+        "민수: 8:30에 만나"
+    )
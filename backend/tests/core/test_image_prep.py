@@ -0,0 +1,70 @@
+import io
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.core.image_prep import prepare_image_for_ocr
+
+
+def _png(width: int, height: int) -> bytes:
+    # 압축이 잘 안 되는 무늬를 넣어서 실제 스크린샷처럼 큰 PNG를 만듦
+    image = Image.new("RGB", (width, height))
+    image.putdata(
+        [
+            ((x * 7) % 256, (y * 13) % 256, (x * y) % 256)
+            for y in range(height)
+            for x in range(width)
+        ]
+    )
+    out = io.BytesIO()
+    image.save(out, format="PNG")
+    return out.getvalue()
+
+
+def test_prepare_image_downscales_to_max_width_grayscale_jpeg(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "OCR_IMAGE_MAX_WIDTH", 200)
+    content = _png(800, 400)
+
+    prepared = prepare_image_for_ocr(content)
+
+    assert len(prepared) < len(content)
+    with Image.open(io.BytesIO(prepared)) as image:
+        assert image.format == "JPEG"
+        assert image.mode == "L"
+        assert image.size == (200, 100)
+
+
+def test_prepare_image_applies_exif_rotation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "OCR_IMAGE_MAX_WIDTH", 1000)
+    image = Image.open(io.BytesIO(_png(300, 100)))
+    exif = image.getexif()
+    exif[0x0112] = 6  # Orientation: 90도 회전
+    out = io.BytesIO()
+    image.save(out, format="PNG", exif=exif)
+
+    prepared = prepare_image_for_ocr(out.getvalue())
+
+    with Image.open(io.BytesIO(prepared)) as rotated:
+        assert rotated.size == (100, 300)
+
+
+def test_prepare_image_keeps_original_when_not_smaller() -> None:
+    out = io.BytesIO()
+    Image.new("L", (10, 10), color=255).save(out, format="PNG")
+    content = out.getvalue()
+
+    assert prepare_image_for_ocr(content) == content
+
+
+def test_prepare_image_keeps_original_when_decoding_fails() -> None:
+    assert prepare_image_for_ocr(b"not an image") == b"not an image"
+
+
+def test_prepare_image_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "OCR_IMAGE_PREPROCESS", False)
+    content = _png(800, 400)
+
+    assert prepare_image_for_ocr(content) == content
@@ -0,0 +1,166 @@
+import hashlib
+import io
+import json
+import threading
+from pathlib import Path
+
+import fakeredis
+import pytest
+
+from app.core import jobs
+from app.core.config import settings
+
+DEAD_WORKER_SLOT = "dead-host:101:0"
+LIVE_WORKER_SLOT = "live-host:202:0"
+
+
+def _enqueue(redis_client: fakeredis.FakeRedis, filename: str) -> None:
+    job = {"queue": jobs.JOB_QUEUE_KEY, "file_id": filename, "filename": filename}
+    redis_client.rpush(jobs.JOB_QUEUE_KEY, json.dumps(job))
+
+
+def _queued_filenames(redis_client: fakeredis.FakeRedis, key: str) -> list[str]:
+    return [json.loads(item)["filename"] for item in redis_client.lrange(key, 0, -1)]
+
+
+def test_claimed_job_is_requeued_after_worker_dies(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    processing_key = f"{jobs.JOB_PROCESSING_PREFIX}{DEAD_WORKER_SLOT}"
+    _enqueue(redis_client, "a.png")
+
+    item = jobs._claim_job(redis_client, processing_key)
+
+    assert item is not None
+    assert json.loads(item)["filename"] == "a.png"
+    assert redis_client.llen(jobs.JOB_QUEUE_KEY) == 0
+    assert _queued_filenames(redis_client, processing_key) == ["a.png"]
+
+    # 워커가 작업 도중 죽음 -> heartbeat 없음
+    jobs._requeue_orphaned_jobs(redis_client)
+
+    assert redis_client.exists(processing_key) == 0
+    assert _queued_filenames(redis_client, jobs.JOB_QUEUE_KEY) == ["a.png"]
+
+    # 다른 워커가 다시 가져감
+    next_key = f"{jobs.JOB_PROCESSING_PREFIX}{LIVE_WORKER_SLOT}"
+    assert jobs._claim_job(redis_client, next_key) == item
+
+
+def test_live_worker_jobs_are_not_requeued(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    processing_key = f"{jobs.JOB_PROCESSING_PREFIX}{LIVE_WORKER_SLOT}"
+    _enqueue(redis_client, "b.png")
+    jobs._claim_job(redis_client, processing_key)
+    redis_client.set(jobs._heartbeat_key("live-host:202"), "1")
+
+    jobs._requeue_orphaned_jobs(redis_client)
+
+    assert _queued_filenames(redis_client, processing_key) == ["b.png"]
+    assert redis_client.llen(jobs.JOB_QUEUE_KEY) == 0
+
+
+def test_requeue_skips_non_list_keys_under_processing_prefix(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    processing_key = f"{jobs.JOB_PROCESSING_PREFIX}{DEAD_WORKER_SLOT}"
+    _enqueue(redis_client, "c.png")
+    jobs._claim_job(redis_client, processing_key)
+    # 예전 버전이 processing prefix 아래에 남긴 lease (string)
+    redis_client.set(f"{processing_key}:requeue", "token", px=60_000)
+
+    jobs._requeue_orphaned_jobs(redis_client)
+
+    assert _queued_filenames(redis_client, jobs.JOB_QUEUE_KEY) == ["c.png"]
+    assert redis_client.get(f"{processing_key}:requeue") == "token"
+
+
+def test_requeue_is_skipped_while_another_process_holds_the_lease(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    processing_key = f"{jobs.JOB_PROCESSING_PREFIX}{DEAD_WORKER_SLOT}"
+    _enqueue(redis_client, "d.png")
+    jobs._claim_job(redis_client, processing_key)
+    redis_client.set(f"{jobs.JOB_REQUEUE_LOCK_PREFIX}{DEAD_WORKER_SLOT}", "other")
+
+    jobs._requeue_orphaned_jobs(redis_client)
+
+    assert _queued_filenames(redis_client, processing_key) == ["d.png"]
+
+
+def test_process_media_runs_ocr_and_upload_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    upload_started = threading.Event()
+
+    def fake_upload(*_args: object) -> str:
+        upload_started.set()
+        return "https://r2.example.com/a.png"
+
+    def fake_ocr(_path: str, _filename: str) -> str:
+        # 업로드가 OCR 뒤에 직렬로 실행되면 여기서 시간 초과
+        assert upload_started.wait(5)
+        return "민수: 안녕"
+
+    monkeypatch.setattr(jobs, "_upload_to_r2", fake_upload)
+    monkeypatch.setattr(jobs, "_run_ocr_from_path", fake_ocr)
+
+    assert jobs.process_media("/tmp/a.png", "a.png", "image/png") == (
+        "민수: 안녕",
+        "https://r2.example.com/a.png",
+    )
+
+
+def test_process_media_deletes_upload_when_ocr_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    deleted: list[str] = []
+
+    def fake_ocr(_path: str, _filename: str) -> str:
+        raise RuntimeError("modal down")
+
+    monkeypatch.setattr(
+        jobs, "_upload_to_r2", lambda *_args: "https://r2.example.com/a.png"
+    )
+    monkeypatch.setattr(jobs, "_run_ocr_from_path", fake_ocr)
+    monkeypatch.setattr(jobs, "_delete_unreferenced_object", deleted.append)
+
+    with pytest.raises(RuntimeError):
+        jobs.process_media("/tmp/a.png", "a.png", "image/png")
+
+    assert deleted == ["https://r2.example.com/a.png"]
+
+
+def test_process_media_keeps_text_when_upload_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(jobs, "_upload_to_r2", lambda *_args: None)
+    monkeypatch.setattr(jobs, "_run_ocr_from_path", lambda *_args: "민수: 안녕")
+
+    assert jobs.process_media("/tmp/a.png", "a.png", "image/png") == ("민수: 안녕", None)
+
+
+def test_spool_upload_copies_in_chunks_and_hashes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(settings, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    content = b"x" * (jobs.SPOOL_CHUNK_SIZE * 2 + 10)
+
+    path, content_hash = jobs.spool_upload(io.BytesIO(content))
+
+    assert Path(path).parent == tmp_path
+    assert Path(path).read_bytes() == content
+    assert content_hash == hashlib.blake2b(content, digest_size=32).hexdigest()
+    assert jobs._hash_file(path) == content_hash
+
+
+def test_read_image_rejects_images_over_limit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(settings, "OCR_IMAGE_MAX_MB", 1)
+    path = tmp_path / "big.png"
+    path.write_bytes(b"x" * (1024 * 1024 + 1))
+
+    with pytest.raises(Exception, match="1MB"):
+        jobs._read_image(str(path))
@@ -0,0 +1,78 @@
+import pytest
+from openai.types.chat import ParsedChatCompletionMessage
+
+from app.core.llm import (
+    AnalysisResult,
+    CourseStep,
+    Metadata,
+    Persona,
+    _merge_results,
+    _parsed_result,
+)
+
+
+def _result(
+    location: str, personas: list[Persona], courses: list[CourseStep]
+) -> AnalysisResult:
+    return AnalysisResult(
+        metadata=Metadata(location=location, group_name="친구 1인", date="2025년 12월 7일"),
+        personas=personas,
+        courses=courses,
+    )
+
+
+def test_merge_results_combines_personas_by_name() -> None:
+    first = _result(
+        "강남역",
+        [
+            Persona(name="민수", likes=["한식", " 한식 "], dislikes=["웨이팅"]),
+            Persona(name="지영", likes=["카페"], dislikes=[]),
+        ],
+        [CourseStep(step=1, category="식당", final_query="강남역 한식")],
+    )
+    second = _result(
+        "홍대",
+        [
+            Persona(name="민수", likes=["한식", "사진"], dislikes=["웨이팅", "해산물"]),
+            Persona(name="현우", likes=[], dislikes=["시끄러운 곳"]),
+        ],
+        [CourseStep(step=1, category="카페", final_query="홍대 카페")],
+    )
+    third = _result("강남역", [], [CourseStep(step=1, category="술집", final_query="강남역 술집")])
+
+    merged = _merge_results([first, second, third])
+
+    assert [persona.name for persona in merged.personas] == ["민수", "지영", "현우"]
+    minsu = merged.personas[0]
+    assert minsu.likes == ["한식", "사진"]
+    assert minsu.dislikes == ["웨이팅", "해산물"]
+    assert merged.metadata.location == "강남역"
+    assert merged.metadata.group_name == "친구 3인"
+    assert merged.metadata.date == "2025년 12월 7일"
+    assert merged.courses == third.courses
+
+
+def test_merge_results_without_personas_keeps_first_group_name() -> None:
+    merged = _merge_results([_result("", [], []), _result("", [], [])])
+
+    assert merged.metadata.location == ""
+    assert merged.metadata.group_name == "친구 1인"
+    assert merged.personas == []
+
+
+def test_parsed_result_returns_structured_output() -> None:
+    result = _result("강남역", [], [])
+    message = ParsedChatCompletionMessage[AnalysisResult](
+        role="assistant", content=result.model_dump_json(), parsed=result
+    )
+
+    assert _parsed_result(message) == result
+
+
+def test_parsed_result_raises_on_refusal() -> None:
+    message = ParsedChatCompletionMessage[AnalysisResult](
+        role="assistant", content=None, parsed=None, refusal="I can't help with that."
+    )
+
+    with pytest.raises(ValueError):
+        _parsed_result(message)
@@ -0,0 +1,166 @@
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core import naver_client
+from app.core.config import settings
+
+
+def _place(query: str) -> dict[str, object]:
+    return {"name": f"{query} 장소", "search_keyword": query}
+
+
+def test_search_naver_local_many_keeps_query_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    delays = {"강남역 한식": 0.03, "강남역 카페": 0.0, "강남역 술집": 0.01}
+
+    async def fake_search(query: str, _display: int = 1) -> list[dict[str, object]]:
+        await asyncio.sleep(delays[query])
+        return [_place(query)]
+
+    monkeypatch.setattr(naver_client, "search_naver_local_async", fake_search)
+
+    results = asyncio.run(naver_client.search_naver_local_many(list(delays)))
+
+    assert results == [[_place(query)] for query in delays]
+
+
+def test_search_naver_local_many_drops_searches_past_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cancelled: list[str] = []
+
+    async def fake_search(query: str, _display: int = 1) -> list[dict[str, object]]:
+        if query == "느린 검색":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(query)
+                raise
+        return [_place(query)]
+
+    monkeypatch.setattr(naver_client, "search_naver_local_async", fake_search)
+    monkeypatch.setattr(settings, "NAVER_SEARCH_DEADLINE_SECONDS", 0.05)
+
+    results = asyncio.run(
+        naver_client.search_naver_local_many(["빠른 검색", "느린 검색", "또 빠른 검색"])
+    )
+
+    assert results == [[_place("빠른 검색")], [], [_place("또 빠른 검색")]]
+    assert cancelled == ["느린 검색"]
+
+
+def test_search_naver_local_many_without_queries() -> None:
+    assert asyncio.run(naver_client.search_naver_local_many([])) == []
+
+
+def test_naver_async_client_is_shared_until_closed() -> None:
+    async def run() -> None:
+        naver_client.init_naver_clients()
+        client = naver_client.get_naver_async_client()
+        assert naver_client.get_naver_async_client() is client
+
+        await naver_client.close_naver_clients()
+        assert client.is_closed
+
+        reopened = naver_client.get_naver_async_client()
+        assert reopened is not client
+        await naver_client.close_naver_clients()
+
+    asyncio.run(run())
+
+
+def test_naver_client_options_follow_pool_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "NAVER_HTTP_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "NAVER_HTTP_KEEPALIVE_SECONDS", 30.0)
+    monkeypatch.setattr(settings, "NAVER_HTTP_CONNECT_TIMEOUT_SECONDS", 1.5)
+
+    options = naver_client._client_options()
+
+    assert options["limits"].max_connections == 7
+    assert options["limits"].max_keepalive_connections == 7
+    assert options["limits"].keepalive_expiry == 30.0
+    assert options["timeout"].connect == 1.5
+    assert options["timeout"].read == settings.NAVER_SEARCH_TIMEOUT_SECONDS
+
+
+@pytest.fixture
+def redis_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    redis_client = AsyncMock()
+    redis_client.get.return_value = None
+
+    async def get_client() -> AsyncMock:
+        return redis_client
+
+    monkeypatch.setattr(naver_client, "get_async_redis_client", get_client)
+    monkeypatch.setattr(naver_client, "record_cache_stat_async", AsyncMock())
+    return redis_client
+
+
+def _patch_fetch(
+    monkeypatch: pytest.MonkeyPatch, result: list[dict[str, Any]] | Exception
+) -> AsyncMock:
+    if isinstance(result, Exception):
+        fetch = AsyncMock(side_effect=result)
+    else:
+        fetch = AsyncMock(return_value=result)
+    monkeypatch.setattr(naver_client, "_fetch_places_async", fetch)
+    return fetch
+
+
+def test_search_naver_local_caches_places_with_positive_ttl(
+    monkeypatch: pytest.MonkeyPatch, redis_mock: AsyncMock
+) -> None:
+    places = [_place("강남역 한식")]
+    _patch_fetch(monkeypatch, places)
+
+    assert asyncio.run(naver_client.search_naver_local_async("강남역 한식")) == places
+
+    redis_mock.setex.assert_awaited_once_with(
+        naver_client._cache_key("강남역 한식", 1),
+        settings.NAVER_CACHE_TTL_SECONDS,
+        json.dumps(places, ensure_ascii=False),
+    )
+
+
+def test_search_naver_local_caches_empty_result_with_negative_ttl(
+    monkeypatch: pytest.MonkeyPatch, redis_mock: AsyncMock
+) -> None:
+    _patch_fetch(monkeypatch, [])
+
+    assert asyncio.run(naver_client.search_naver_local_async("없는 가게")) == []
+
+    redis_mock.setex.assert_awaited_once_with(
+        naver_client._cache_key("없는 가게", 1),
+        settings.NAVER_NEGATIVE_CACHE_TTL_SECONDS,
+        "[]",
+    )
+
+
+def test_search_naver_local_cache_hit_skips_api(
+    monkeypatch: pytest.MonkeyPatch, redis_mock: AsyncMock
+) -> None:
+    places = [_place("홍대 카페")]
+    redis_mock.get.return_value = json.dumps(places, ensure_ascii=False)
+    fetch = _patch_fetch(monkeypatch, [])
+
+    assert asyncio.run(naver_client.search_naver_local_async("홍대 카페")) == places
+
+    fetch.assert_not_awaited()
+    redis_mock.setex.assert_not_awaited()
+
+
+def test_search_naver_local_does_not_cache_api_errors(
+    monkeypatch: pytest.MonkeyPatch, redis_mock: AsyncMock
+) -> None:
+    _patch_fetch(monkeypatch, RuntimeError("quota exceeded"))
+
+    assert asyncio.run(naver_client.search_naver_local_async("강남역 술집")) == []
+
+    redis_mock.setex.assert_not_awaited()
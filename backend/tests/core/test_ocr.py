@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import ocr
+from app.core.config import settings
+from app.core.ocr import stitch_screenshot_texts
+
+
+def test_stitch_screenshot_texts_removes_overlapping_lines() -> None:
+    texts = [
+        "민수: 강남역 어때\n지영: 좋아\n민수: 몇 시?",
+        "지영: 좋아\n민수:  몇 시?\n지영: 7시",
+    ]
+
+    assert stitch_screenshot_texts(texts) == "민수: 강남역 어때\n지영: 좋아\n민수: 몇 시?\n지영: 7시"
+
+
+def test_stitch_screenshot_texts_keeps_short_single_line_match() -> None:
+    # "ㅋㅋ" 한 줄만 우연히 같은 경우는 겹침으로 보지 않음
+    texts = ["민수: 오늘 어디 갈까\nㅋㅋ", "ㅋㅋ\n지영: 홍대"]
+
+    assert stitch_screenshot_texts(texts) == "민수: 오늘 어디 갈까\nㅋㅋ\nㅋㅋ\n지영: 홍대"
+
+
+def test_stitch_screenshot_texts_accepts_long_single_line_overlap() -> None:
+    long_line = "민수: 이번 주 토요일 저녁에 강남역 11번 출구에서 만나자"
+    texts = [f"지영: 언제 볼까\n{long_line}", f"{long_line}\n지영: 좋아"]
+
+    assert stitch_screenshot_texts(texts) == f"지영: 언제 볼까\n{long_line}\n지영: 좋아"
+
+
+def test_stitch_screenshot_texts_without_overlap_concatenates() -> None:
+    assert stitch_screenshot_texts(["a\nb", "", "c\nd"]) == "a\nb\nc\nd"
+
+
+@pytest.fixture
+def modal_from_name(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    monkeypatch.setattr(ocr, "_ocr_service_cls", None)
+    monkeypatch.setattr(ocr, "_ocr_retry_at", 0.0)
+    monkeypatch.setattr(ocr, "_ocr_error", None)
+    from_name = MagicMock()
+    monkeypatch.setattr(ocr.modal.Cls, "from_name", from_name)
+    return from_name
+
+
+def test_get_ocr_service_cls_looks_up_once(modal_from_name: MagicMock) -> None:
+    assert ocr.get_ocr_service_cls() is modal_from_name.return_value
+    assert ocr.get_ocr_service_cls() is modal_from_name.return_value
+
+    modal_from_name.assert_called_once_with("kakao-ocr-unified", "OCRService")
+    modal_from_name.return_value.hydrate.assert_called_once()
+    assert ocr.get_modal_health() == {"status": "ok"}
+
+
+def test_get_ocr_service_cls_backs_off_after_failure(
+    modal_from_name: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    modal_from_name.return_value.hydrate.side_effect = RuntimeError("app not found")
+    now = 1000.0
+    monkeypatch.setattr(ocr.time, "monotonic", lambda: now)
+
+    assert ocr.get_ocr_service_cls() is None
+    assert ocr.get_modal_health() == {"status": "unavailable", "error": "app not found"}
+    assert modal_from_name.call_count == 1
+
+    now += settings.BACKEND_RETRY_SECONDS
+    modal_from_name.return_value.hydrate.side_effect = None
+
+    assert ocr.get_ocr_service_cls() is modal_from_name.return_value
@@ -0,0 +1,65 @@
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import security
+from app.core.config import settings
+
+
+def test_password_hash_round_trip_in_process_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+
+    hashed = security.get_password_hash("correct horse")
+
+    assert security.verify_password("correct horse", hashed)
+    assert not security.verify_password("wrong horse", hashed)
+
+
+def test_password_hash_without_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0)
+    get_pool = MagicMock()
+    monkeypatch.setattr(security, "_get_password_pool", get_pool)
+
+    hashed = security.get_password_hash("correct horse")
+
+    assert security.verify_password("correct horse", hashed)
+    get_pool.assert_not_called()
+
+
+def test_password_task_rejects_when_queue_is_full(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    pending = threading.BoundedSemaphore(1)
+    pending.acquire()
+    monkeypatch.setattr(security, "_password_pending", pending)
+    fn = MagicMock()
+
+    with pytest.raises(security.PasswordHasherBusyError):
+        security._run_password_task("hash", fn, "password")
+
+    fn.assert_not_called()
+
+
+def test_password_task_recovers_from_broken_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    broken_pool = MagicMock()
+    broken_pool.submit.side_effect = BrokenProcessPool("worker died")
+    monkeypatch.setattr(security, "_get_password_pool", lambda: broken_pool)
+    reset_pool = MagicMock()
+    monkeypatch.setattr(security, "_reset_password_pool", reset_pool)
+
+    result = security._run_password_task("hash", lambda value: value * 2, "ab")
+
+    # 이번 요청은 호출한 스레드에서 계산하고, 다음 요청을 위해 풀을 새로 만듦
+    assert result == "abab"
+    reset_pool.assert_called_once()
+    # 대기열 자리는 돌려받음
+    assert security._password_pending.acquire(blocking=False)
+    security._password_pending.release()
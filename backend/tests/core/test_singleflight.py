@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_singleflight_runs_fn_once_for_concurrent_calls() -> None:
+    flight = SingleFlight()
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results: list[str] = []
+
+    def worker() -> None:
+        results.append(flight.do("key", fn))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=worker) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == 1
+    assert results == ["result"] * 4
+
+
+def test_singleflight_propagates_leader_error_to_followers() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn() -> None:
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        try:
+            flight.do("key", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=worker)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert [str(e) for e in errors] == ["boom", "boom"]
+    # 끝난 key는 다시 실행됨
+    assert flight.do("key", lambda: "again") == "again"
+
+
+def test_async_singleflight_runs_fn_once() -> None:
+    async def main() -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fn() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+        assert calls == 1
+        assert results == ["result"] * 5
+        assert await flight.do("key", fn) == "result"
+        assert calls == 2
+
+    asyncio.run(main())
+
+
+def test_async_singleflight_follower_survives_leader_cancellation() -> None:
+    async def main() -> None:
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fn() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        release.set()
+        assert await follower == "result"
+        assert calls == 1
+
+    asyncio.run(main())
+
+
+def test_async_singleflight_propagates_error_to_all_callers() -> None:
+    async def main() -> None:
+        flight = AsyncSingleFlight()
+
+        async def fn() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", fn), flight.do("key", fn), return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["boom", "boom"]
+        assert all(isinstance(result, ValueError) for result in results)
+
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+import io
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import storage
+from app.core.config import settings
+
+
+@pytest.fixture
+def s3_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    client = MagicMock()
+    monkeypatch.setattr(storage, "get_s3_client", lambda: client)
+    monkeypatch.setattr(settings, "R2_BUCKET_NAME", "bucket")
+    monkeypatch.setattr(settings, "R2_PUBLIC_DOMAIN", "https://cdn.example.com/")
+    return client
+
+
+def test_upload_fileobj_streams_with_multipart_config(s3_client: MagicMock) -> None:
+    fileobj = io.BytesIO(b"video")
+    owner_id = uuid.uuid4()
+    object_key = storage.content_addressed_key(owner_id, "abc123", "clip.MP4")
+
+    url = storage.upload_fileobj_to_r2(fileobj, "clip.MP4", "video/mp4", object_key)
+
+    assert object_key.endswith(f"/objects/{owner_id}/abc123.mp4")
+    assert url == f"https://cdn.example.com/{object_key}"
+    s3_client.upload_fileobj.assert_called_once_with(
+        fileobj,
+        "bucket",
+        object_key,
+        ExtraArgs={"ContentType": "video/mp4"},
+        Config=storage._transfer_config,
+    )
+    s3_client.put_object.assert_not_called()
+
+
+def test_upload_fileobj_returns_none_on_failure(s3_client: MagicMock) -> None:
+    s3_client.upload_fileobj.side_effect = RuntimeError("network")
+
+    assert storage.upload_fileobj_to_r2(io.BytesIO(b"x"), "a.png", None) is None
+
+
+def test_delete_file_from_r2_uses_object_key_from_url(s3_client: MagicMock) -> None:
+    url = storage.r2_public_url("prod/objects/owner/abc.png")
+
+    assert storage.delete_file_from_r2(url)
+    s3_client.delete_object.assert_called_once_with(
+        Bucket="bucket", Key="prod/objects/owner/abc.png"
+    )
+
+
+def test_delete_file_from_r2_skips_foreign_url(s3_client: MagicMock) -> None:
+    assert not storage.delete_file_from_r2("https://other.example.com/a.png")
+    s3_client.delete_object.assert_not_called()
+
+
+@pytest.fixture
+def boto3_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    monkeypatch.setattr(storage, "_s3_client", None)
+    monkeypatch.setattr(storage, "_s3_retry_at", 0.0)
+    monkeypatch.setattr(storage, "_s3_error", None)
+    monkeypatch.setattr(settings, "R2_ACCOUNT_ID", "account")
+    monkeypatch.setattr(settings, "R2_ACCESS_KEY_ID", "key")
+    monkeypatch.setattr(settings, "R2_BUCKET_NAME", "bucket")
+    factory = MagicMock()
+    monkeypatch.setattr(storage.boto3, "client", factory)
+    return factory
+
+
+def test_get_s3_client_not_configured(
+    boto3_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "R2_ACCOUNT_ID", None)
+
+    assert storage.get_s3_client() is None
+    assert storage.get_r2_health() == {"status": "not_configured"}
+    boto3_client.assert_not_called()
+
+
+def test_get_s3_client_created_once(boto3_client: MagicMock) -> None:
+    assert storage.get_s3_client() is boto3_client.return_value
+    assert storage.get_s3_client() is boto3_client.return_value
+
+    boto3_client.assert_called_once()
+    assert storage.get_r2_health() == {"status": "ok"}
+    boto3_client.return_value.head_bucket.assert_called_once_with(Bucket="bucket")
+
+
+def test_get_s3_client_backs_off_after_failure(
+    boto3_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    boto3_client.side_effect = ValueError("bad endpoint")
+    now = 1000.0
+    monkeypatch.setattr(storage.time, "monotonic", lambda: now)
+
+    assert storage.get_s3_client() is None
+    assert storage.get_s3_client() is None
+    assert boto3_client.call_count == 1
+    assert storage.get_r2_health() == {"status": "unavailable", "error": "bad endpoint"}
+
+    now += settings.BACKEND_RETRY_SECONDS
+    boto3_client.side_effect = None
+
+    assert storage.get_s3_client() is boto3_client.return_value
+
+
+def test_r2_health_reports_unreachable_bucket(boto3_client: MagicMock) -> None:
+    boto3_client.return_value.head_bucket.side_effect = ConnectionError("timeout")
+
+    assert storage.get_r2_health() == {"status": "unavailable", "error": "timeout"}
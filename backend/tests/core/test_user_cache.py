@@ -0,0 +1,142 @@
+import json
+import uuid
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+
+from app.core import cache, user_cache
+from app.models import User
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # 기본은 Redis 없음 (redis_client fixture를 쓰는 테스트만 fakeredis)
+    monkeypatch.setattr(cache, "_redis_client", None)
+    monkeypatch.setattr(cache, "_redis_backing_off", lambda: True)
+    monkeypatch.setattr(user_cache, "add_cache_stats", MagicMock())
+    user_cache._local_cache.clear()
+    yield
+    user_cache._local_cache.clear()
+
+
+def _user() -> User:
+    return User(
+        id=uuid.uuid4(), email=f"{uuid.uuid4().hex}@example.com", hashed_password="x"
+    )
+
+
+def _cache(user: User) -> None:
+    _, version = user_cache.get_cached_user(str(user.id))
+    user_cache.cache_user(user, version)
+
+
+def test_cache_user_then_get_cached_user() -> None:
+    user = _user()
+
+    _cache(user)
+    cached, _ = user_cache.get_cached_user(str(user.id))
+
+    assert cached is not None
+    assert cached.id == user.id
+    assert cached.email == user.email
+    assert user_cache.get_cached_user(str(uuid.uuid4()))[0] is None
+
+
+def test_local_cache_evicts_least_recently_used() -> None:
+    first, second, third = _user(), _user(), _user()
+
+    with patch.object(user_cache.settings, "USER_CACHE_LOCAL_MAX_SIZE", 2):
+        _cache(first)
+        _cache(second)
+        # first를 최근에 사용 -> second가 밀려남
+        assert user_cache.get_cached_user(str(first.id))[0] is not None
+        _cache(third)
+
+    assert list(user_cache._local_cache) == [str(first.id), str(third.id)]
+    assert user_cache.get_cached_user(str(second.id))[0] is None
+
+
+def test_local_cache_expires() -> None:
+    user = _user()
+
+    with patch.object(user_cache.settings, "USER_CACHE_LOCAL_TTL_SECONDS", -1.0):
+        _cache(user)
+
+    assert user_cache.get_cached_user(str(user.id))[0] is None
+    assert str(user.id) not in user_cache._local_cache
+
+
+def test_invalidate_user_without_redis() -> None:
+    user = _user()
+    _cache(user)
+
+    user_cache.invalidate_user(user.id)
+
+    assert user_cache.get_cached_user(str(user.id))[0] is None
+
+
+@pytest.mark.usefixtures("redis_client")
+def test_get_cached_user_falls_back_to_redis() -> None:
+    user = _user()
+    _cache(user)
+    user_cache._local_cache.clear()
+
+    cached, _ = user_cache.get_cached_user(str(user.id))
+
+    assert cached is not None
+    assert cached.id == user.id
+    assert str(user.id) in user_cache._local_cache
+
+
+def test_invalidate_user_on_another_worker(redis_client: fakeredis.FakeRedis) -> None:
+    user = _user()
+    _cache(user)
+    local_entry = user_cache._local_cache[str(user.id)]
+
+    # 다른 워커에서 무효화 -> 이 프로세스의 항목은 그대로 남아 있음
+    user_cache.invalidate_user(user.id)
+    user_cache._local_cache[str(user.id)] = local_entry
+
+    cached, version = user_cache.get_cached_user(str(user.id))
+
+    assert cached is None
+    assert version == "1"
+    assert str(user.id) not in user_cache._local_cache
+    assert redis_client.get(f"{user_cache.USER_CACHE_PREFIX}{user.id}") is None
+    assert redis_client.ttl(f"{user_cache.USER_VERSION_PREFIX}{user.id}") > 0
+
+
+def test_cache_user_ignores_result_read_before_invalidation(
+    redis_client: fakeredis.FakeRedis,
+) -> None:
+    user = _user()
+    # 버전을 읽고 DB를 조회하는 사이에 다른 요청이 사용자를 수정
+    _, version = user_cache.get_cached_user(str(user.id))
+    user_cache.invalidate_user(user.id)
+    user_cache.cache_user(user, version)
+
+    assert user_cache.get_cached_user(str(user.id))[0] is None
+    user_cache._local_cache.clear()
+    assert user_cache.get_cached_user(str(user.id))[0] is None
+    stored = json.loads(redis_client.get(f"{user_cache.USER_CACHE_PREFIX}{user.id}"))
+    assert stored["version"] == "0"
+
+
+def test_get_cached_user_skips_cache_when_redis_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user = _user()
+    _cache(user)
+    broken_redis = MagicMock()
+    broken_redis.get.side_effect = ConnectionError("redis down")
+    monkeypatch.setattr(cache, "_redis_client", broken_redis)
+
+    cached, version = user_cache.get_cached_user(str(user.id))
+    user_cache.cache_user(user, version)
+
+    # 다른 워커의 무효화를 확인할 수 없으므로 DB에서 읽고, 캐시에도 저장하지 않음
+    assert cached is None
+    assert version is None
+    broken_redis.set.assert_not_called()
@@ -0,0 +1,80 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from app.core import ocr
+from app.core.config import settings
+from app.core.video_frames import extract_distinct_frames
+
+
+def _write_video(path: Path, scenes: list[int], frames_per_scene: int = 10) -> str:
+    # 장면마다 좌우 밝기가 다른 화면을 frames_per_scene 프레임씩 이어 붙인 10fps 영상
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48))
+    for scene in scenes:
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        for x in range(64):
+            frame[:, x] = ((x * (scene + 1) * 37) % 256,) * 3
+        for _ in range(frames_per_scene):
+            writer.write(frame)
+    writer.release()
+    return str(path)
+
+
+def test_extract_distinct_frames_drops_repeated_frames(tmp_path: Path) -> None:
+    path = _write_video(tmp_path / "chat.avi", scenes=[0, 1, 2])
+
+    frames = extract_distinct_frames(path)
+
+    assert frames is not None
+    assert len(frames) == 3
+    assert all(frame.startswith(b"\xff\xd8") for frame in frames)
+
+
+def test_extract_distinct_frames_returns_none_for_undecodable_file(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "broken.mp4"
+    path.write_bytes(b"not a video")
+
+    assert extract_distinct_frames(str(path)) is None
+
+
+def test_extract_distinct_frames_raises_instead_of_truncating(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "VIDEO_MAX_FRAMES", 2)
+    path = _write_video(tmp_path / "chat.avi", scenes=[0, 1, 2])
+
+    with pytest.raises(Exception, match="나눠서 올려주세요"):
+        extract_distinct_frames(path)
+
+
+def test_extract_distinct_frames_allows_exactly_max_frames(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "VIDEO_MAX_FRAMES", 3)
+    path = _write_video(tmp_path / "chat.avi", scenes=[0, 1, 2])
+
+    frames = extract_distinct_frames(path)
+
+    assert frames is not None
+    assert len(frames) == 3
+
+
+def test_run_video_ocr_surfaces_frame_budget_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "VIDEO_MAX_FRAMES", 1)
+    run_ocr = MagicMock()
+    monkeypatch.setattr(ocr, "run_ocr", run_ocr)
+    monkeypatch.setattr(ocr, "run_ocr_images", run_ocr)
+    path = _write_video(tmp_path / "chat.avi", scenes=[0, 1])
+
+    with pytest.raises(Exception, match="1장을 넘어"):
+        ocr.run_video_ocr(path, "chat.avi")
+
+    # 일부 프레임만 OCR 하거나 동영상 전체 전송으로 넘어가지 않음
+    run_ocr.assert_not_called()
@@ -0,0 +1,134 @@
+from typing import Any, cast
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import undefer
+from sqlmodel import Session
+
+from app import crud
+from app.core.db import engine
+from app.models import File
+from tests.utils.file import create_random_file
+
+
+def test_save_file_analysis_keeps_first_result(db: Session) -> None:
+    file = create_random_file(db)
+
+    first = crud.save_file_analysis(
+        session=db,
+        file_id=file.id,
+        prompt_version="v2",
+        model_version="gpt-test",
+        result={"courses": ["first"]},
+    )
+    second = crud.save_file_analysis(
+        session=db,
+        file_id=file.id,
+        prompt_version="v2",
+        model_version="gpt-test",
+        result={"courses": ["second"]},
+    )
+
+    assert second.id == first.id
+    assert second.result == {"courses": ["first"]}
+
+
+def test_get_file_analysis_is_per_version(db: Session) -> None:
+    file = create_random_file(db)
+    crud.save_file_analysis(
+        session=db,
+        file_id=file.id,
+        prompt_version="v1",
+        model_version="gpt-test",
+        result={"courses": []},
+    )
+
+    assert crud.get_file_analysis(
+        session=db, file_id=file.id, prompt_version="v1", model_version="gpt-test"
+    )
+    assert not crud.get_file_analysis(
+        session=db, file_id=file.id, prompt_version="v2", model_version="gpt-test"
+    )
+    assert not crud.get_file_analysis(
+        session=db, file_id=file.id, prompt_version="v1", model_version="gpt-other"
+    )
+
+
+def test_file_owner_created_at_index(db: Session) -> None:
+    indexdef = db.execute(
+        text("SELECT indexdef FROM pg_indexes WHERE indexname = :name"),
+        {"name": "ix_file_owner_id_created_at"},
+    ).scalar_one()
+
+    assert "(owner_id, created_at DESC)" in indexdef
+
+
+def test_file_list_query_uses_owner_created_at_index(db: Session) -> None:
+    file = create_random_file(db)
+
+    # 테스트 DB는 행이 적어서 seq scan을 끄고 인덱스로 최신순 목록을 읽을 수 있는지만 확인
+    with engine.connect() as connection:
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = connection.execute(
+            text(
+                "EXPLAIN SELECT id FROM file WHERE owner_id = :owner_id "
+                "ORDER BY created_at DESC, id DESC LIMIT 20"
+            ),
+            {"owner_id": file.owner_id},
+        ).scalars().all()
+
+    assert "ix_file_owner_id_created_at" in "\n".join(plan)
+
+
+def test_file_extracted_text_is_deferred(db: Session) -> None:
+    file = create_random_file(db, extracted_text="민수: 강남역 가자")
+
+    with Session(engine) as session:
+        loaded = session.get(File, file.id)
+        assert loaded is not None
+        assert "extracted_text" in inspect(loaded).unloaded
+        # 접근할 때 따로 SELECT
+        assert loaded.extracted_text == "민수: 강남역 가자"
+
+    with Session(engine) as session:
+        loaded = session.get(
+            File, file.id, options=[undefer(cast(Any, File.extracted_text))]
+        )
+        assert loaded is not None
+        assert "extracted_text" not in inspect(loaded).unloaded
+
+
+def test_file_extracted_text_is_compressed_with_lz4(db: Session) -> None:
+    compression = db.execute(
+        text(
+            "SELECT attcompression FROM pg_attribute "
+            "WHERE attrelid = 'file'::regclass AND attname = 'extracted_text'"
+        )
+    ).scalar_one()
+    assert compression == "l"
+
+    # 압축은 행이 TOAST 기준(약 2KB)을 넘을 때만 일어나므로 긴 대화로 확인
+    file = create_random_file(db, extracted_text="민수: 강남역 가자\n" * 500)
+    stored = db.execute(
+        text("SELECT pg_column_compression(extracted_text) FROM file WHERE id = :id"),
+        {"id": file.id},
+    ).scalar_one()
+    assert stored == "lz4"
+
+
+def test_file_text_bigrams(db: Session) -> None:
+    bigrams = db.execute(
+        text("SELECT file_text_bigrams(:t)"), {"t": "민수: 강남역\n가자 AB"}
+    ).scalar_one()
+
+    # 소문자로, 공백이 들어간 조각은 빼고, 중복 없이
+    assert sorted(bigrams) == ["ab", "가자", "강남", "남역", "민수", "수:"]
+    assert db.execute(text("SELECT file_text_bigrams('가')")).scalar_one() == []
+
+
+def test_file_text_bigrams_long_text(db: Session) -> None:
+    # 긴 대화도 글자 수에 비례하는 시간으로 처리 (예전 substr 방식은 이 길이에서 수 분)
+    bigrams = db.execute(
+        text("SELECT file_text_bigrams(:t)"), {"t": "민수: 강남역 가자\n" * 20000}
+    ).scalar_one()
+
+    assert sorted(bigrams) == ["가자", "강남", "남역", "민수", "수:"]
@@ -0,0 +1,27 @@
+import uuid
+
+from sqlmodel import Session
+
+from app import crud
+from app.models import File, FileCreate, FileStatus
+from tests.utils.user import create_random_user
+from tests.utils.utils import random_lower_string
+
+
+def create_random_file(
+    db: Session,
+    *,
+    owner_id: uuid.UUID | None = None,
+    extracted_text: str | None = None,
+    status: FileStatus = FileStatus.DONE,
+) -> File:
+    if owner_id is None:
+        owner_id = create_random_user(db).id
+    file_in = FileCreate(
+        filename=f"{random_lower_string()}.txt",
+        file_url=f"https://example.com/{random_lower_string()}.txt",
+        extracted_text=extracted_text,
+    )
+    return crud.create_file(
+        session=db, file_in=file_in, owner_id=owner_id, status=status
+    )
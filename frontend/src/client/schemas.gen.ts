@@ -13,6 +13,22 @@ export const Body_files_create_fileSchema = {
     title: 'Body_files-create_file'
 } as const;
 
+export const Body_files_create_file_batchSchema = {
+    properties: {
+        files: {
+            items: {
+                type: 'string',
+                contentMediaType: 'application/octet-stream'
+            },
+            type: 'array',
+            title: 'Files'
+        }
+    },
+    type: 'object',
+    required: ['files'],
+    title: 'Body_files-create_file_batch'
+} as const;
+
 export const Body_login_login_access_tokenSchema = {
     properties: {
         grant_type: {
@@ -134,18 +150,241 @@ export const FilePublicSchema = {
             type: 'string',
             format: 'date-time',
             title: 'Created At'
+        },
+        status: {
+            '$ref': '#/components/schemas/FileStatus'
+        },
+        error: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Error'
         }
     },
     type: 'object',
-    required: ['filename', 'id', 'owner_id', 'created_at'],
+    required: ['filename', 'id', 'owner_id', 'created_at', 'status'],
     title: 'FilePublic'
 } as const;
 
+export const FileSearchResultSchema = {
+    properties: {
+        id: {
+            type: 'string',
+            format: 'uuid',
+            title: 'Id'
+        },
+        filename: {
+            type: 'string',
+            title: 'Filename'
+        },
+        created_at: {
+            type: 'string',
+            format: 'date-time',
+            title: 'Created At'
+        },
+        snippet: {
+            type: 'string',
+            title: 'Snippet'
+        },
+        score: {
+            type: 'number',
+            title: 'Score'
+        }
+    },
+    type: 'object',
+    required: ['id', 'filename', 'created_at', 'snippet', 'score'],
+    title: 'FileSearchResult'
+} as const;
+
+export const FileSearchResultsSchema = {
+    properties: {
+        data: {
+            items: {
+                '$ref': '#/components/schemas/FileSearchResult'
+            },
+            type: 'array',
+            title: 'Data'
+        }
+    },
+    type: 'object',
+    required: ['data'],
+    title: 'FileSearchResults'
+} as const;
+
+export const FileStatusSchema = {
+    type: 'string',
+    enum: ['pending', 'processing', 'done', 'failed'],
+    title: 'FileStatus'
+} as const;
+
+export const FileStatusPublicSchema = {
+    properties: {
+        id: {
+            type: 'string',
+            format: 'uuid',
+            title: 'Id'
+        },
+        status: {
+            '$ref': '#/components/schemas/FileStatus'
+        },
+        error: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Error'
+        }
+    },
+    type: 'object',
+    required: ['id', 'status'],
+    title: 'FileStatusPublic'
+} as const;
+
+export const FileSummarySchema = {
+    properties: {
+        id: {
+            type: 'string',
+            format: 'uuid',
+            title: 'Id'
+        },
+        filename: {
+            type: 'string',
+            title: 'Filename'
+        },
+        file_url: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'File Url'
+        },
+        owner_id: {
+            type: 'string',
+            format: 'uuid',
+            title: 'Owner Id'
+        },
+        created_at: {
+            type: 'string',
+            format: 'date-time',
+            title: 'Created At'
+        },
+        status: {
+            '$ref': '#/components/schemas/FileStatus'
+        },
+        error: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Error'
+        },
+        text_preview: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Text Preview'
+        },
+        text_length: {
+            type: 'integer',
+            title: 'Text Length',
+            default: 0
+        }
+    },
+    type: 'object',
+    required: ['id', 'filename', 'owner_id', 'created_at', 'status'],
+    title: 'FileSummary'
+} as const;
+
+export const FileUploadCompleteSchema = {
+    properties: {
+        object_key: {
+            type: 'string',
+            maxLength: 1024,
+            title: 'Object Key'
+        }
+    },
+    type: 'object',
+    required: ['object_key'],
+    title: 'FileUploadComplete'
+} as const;
+
+export const FileUploadPublicSchema = {
+    properties: {
+        url: {
+            type: 'string',
+            title: 'Url'
+        },
+        headers: {
+            additionalProperties: {
+                type: 'string'
+            },
+            type: 'object',
+            title: 'Headers'
+        },
+        object_key: {
+            type: 'string',
+            title: 'Object Key'
+        },
+        expires_in: {
+            type: 'integer',
+            title: 'Expires In'
+        }
+    },
+    type: 'object',
+    required: ['url', 'headers', 'object_key', 'expires_in'],
+    title: 'FileUploadPublic'
+} as const;
+
+export const FileUploadRequestSchema = {
+    properties: {
+        filename: {
+            type: 'string',
+            maxLength: 255,
+            title: 'Filename'
+        },
+        content_type: {
+            type: 'string',
+            maxLength: 100,
+            title: 'Content Type'
+        },
+        size: {
+            type: 'integer',
+            exclusiveMinimum: 0.0,
+            title: 'Size'
+        }
+    },
+    type: 'object',
+    required: ['filename', 'content_type', 'size'],
+    title: 'FileUploadRequest'
+} as const;
+
 export const FilesPublicSchema = {
     properties: {
         data: {
             items: {
-                '$ref': '#/components/schemas/FilePublic'
+                '$ref': '#/components/schemas/FileSummary'
             },
             type: 'array',
             title: 'Data'
@@ -153,6 +392,17 @@ export const FilesPublicSchema = {
         count: {
             type: 'integer',
             title: 'Count'
+        },
+        next_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Next Cursor'
         }
     },
     type: 'object',
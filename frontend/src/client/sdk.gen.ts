@@ -3,7 +3,7 @@
 import type { CancelablePromise } from './core/CancelablePromise';
 import { OpenAPI } from './core/OpenAPI';
 import { request as __request } from './core/request';
-import type { FilesCreateFileData, FilesCreateFileResponse, FilesReadFilesData, FilesReadFilesResponse, FilesDeleteFileData, FilesDeleteFileResponse, LoginLoginAccessTokenData, LoginLoginAccessTokenResponse, LoginTestTokenResponse, LoginRecoverPasswordData, LoginRecoverPasswordResponse, LoginResetPasswordData, LoginResetPasswordResponse, LoginRecoverPasswordHtmlContentData, LoginRecoverPasswordHtmlContentResponse, PrivateCreateUserData, PrivateCreateUserResponse, RecommendationsCreateRecommendationData, RecommendationsCreateRecommendationResponse, UsersReadUsersData, UsersReadUsersResponse, UsersCreateUserData, UsersCreateUserResponse, UsersReadUserMeResponse, UsersDeleteUserMeResponse, UsersUpdateUserMeData, UsersUpdateUserMeResponse, UsersUpdatePasswordMeData, UsersUpdatePasswordMeResponse, UsersRegisterUserData, UsersRegisterUserResponse, UsersReadUserByIdData, UsersReadUserByIdResponse, UsersUpdateUserData, UsersUpdateUserResponse, UsersDeleteUserData, UsersDeleteUserResponse, UtilsTestEmailData, UtilsTestEmailResponse, UtilsHealthCheckResponse } from './types.gen';
+import type { FilesCreateFileData, FilesCreateFileResponse, FilesReadFilesData, FilesReadFilesResponse, FilesCreateFileBatchData, FilesCreateFileBatchResponse, FilesCreateFileUploadData, FilesCreateFileUploadResponse, FilesCompleteFileUploadData, FilesCompleteFileUploadResponse, FilesReadFileStatusData, FilesReadFileStatusResponse, FilesSearchFilesData, FilesSearchFilesResponse, FilesReadFileData, FilesReadFileResponse, FilesDeleteFileData, FilesDeleteFileResponse, LoginLoginAccessTokenData, LoginLoginAccessTokenResponse, LoginTestTokenResponse, LoginRecoverPasswordData, LoginRecoverPasswordResponse, LoginResetPasswordData, LoginResetPasswordResponse, LoginRecoverPasswordHtmlContentData, LoginRecoverPasswordHtmlContentResponse, PrivateCreateUserData, PrivateCreateUserResponse, RecommendationsCreateRecommendationData, RecommendationsCreateRecommendationResponse, UsersReadUsersData, UsersReadUsersResponse, UsersCreateUserData, UsersCreateUserResponse, UsersReadUserMeResponse, UsersDeleteUserMeResponse, UsersUpdateUserMeData, UsersUpdateUserMeResponse, UsersUpdatePasswordMeData, UsersUpdatePasswordMeResponse, UsersRegisterUserData, UsersRegisterUserResponse, UsersReadUserByIdData, UsersReadUserByIdResponse, UsersUpdateUserData, UsersUpdateUserResponse, UsersDeleteUserData, UsersDeleteUserResponse, UtilsTestEmailData, UtilsTestEmailResponse, UtilsCacheStatsResponse, UtilsHealthCheckResponse, UtilsBackendHealthResponse, UtilsPasswordHashStatsResponse } from './types.gen';
 
 export class FilesService {
     /**
@@ -30,6 +30,7 @@ export class FilesService {
      * @param data The data for the request.
      * @param data.skip
      * @param data.limit
+     * @param data.cursor
      * @returns FilesPublic Successful Response
      * @throws ApiError
      */
@@ -39,6 +40,106 @@ export class FilesService {
             url: '/api/v1/files/',
             query: {
                 skip: data.skip,
+                limit: data.limit,
+                cursor: data.cursor
+            },
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
+    /**
+     * Create File Batch
+     * @param data The data for the request.
+     * @param data.formData
+     * @returns FilePublic Successful Response
+     * @throws ApiError
+     */
+    public static createFileBatch(data: FilesCreateFileBatchData): CancelablePromise<FilesCreateFileBatchResponse> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/api/v1/files/batch',
+            formData: data.formData,
+            mediaType: 'multipart/form-data',
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
+    /**
+     * Create File Upload
+     * @param data The data for the request.
+     * @param data.requestBody
+     * @returns FileUploadPublic Successful Response
+     * @throws ApiError
+     */
+    public static createFileUpload(data: FilesCreateFileUploadData): CancelablePromise<FilesCreateFileUploadResponse> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/api/v1/files/uploads',
+            body: data.requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
+    /**
+     * Complete File Upload
+     * @param data The data for the request.
+     * @param data.requestBody
+     * @returns FilePublic Successful Response
+     * @throws ApiError
+     */
+    public static completeFileUpload(data: FilesCompleteFileUploadData): CancelablePromise<FilesCompleteFileUploadResponse> {
+        return __request(OpenAPI, {
+            method: 'POST',
+            url: '/api/v1/files/uploads/complete',
+            body: data.requestBody,
+            mediaType: 'application/json',
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
+    /**
+     * Read File Status
+     * @param data The data for the request.
+     * @param data.id
+     * @returns FileStatusPublic Successful Response
+     * @throws ApiError
+     */
+    public static readFileStatus(data: FilesReadFileStatusData): CancelablePromise<FilesReadFileStatusResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/files/{id}/status',
+            path: {
+                id: data.id
+            },
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
+    /**
+     * Search Files
+     * @param data The data for the request.
+     * @param data.q
+     * @param data.limit
+     * @returns FileSearchResults Successful Response
+     * @throws ApiError
+     */
+    public static searchFiles(data: FilesSearchFilesData): CancelablePromise<FilesSearchFilesResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/files/search',
+            query: {
+                q: data.q,
                 limit: data.limit
             },
             errors: {
@@ -47,6 +148,26 @@ export class FilesService {
         });
     }
     
+    /**
+     * Read File
+     * @param data The data for the request.
+     * @param data.id
+     * @returns FilePublic Successful Response
+     * @throws ApiError
+     */
+    public static readFile(data: FilesReadFileData): CancelablePromise<FilesReadFileResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/files/{id}',
+            path: {
+                id: data.id
+            },
+            errors: {
+                422: 'Validation Error'
+            }
+        });
+    }
+    
     /**
      * Delete File
      * @param data The data for the request.
@@ -427,6 +548,19 @@ export class UtilsService {
         });
     }
     
+    /**
+     * Cache Stats
+     * Cache hit/miss counters.
+     * @returns unknown Successful Response
+     * @throws ApiError
+     */
+    public static cacheStats(): CancelablePromise<UtilsCacheStatsResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/utils/cache-stats/'
+        });
+    }
+    
     /**
      * Health Check
      * @returns boolean Successful Response
@@ -438,4 +572,30 @@ export class UtilsService {
             url: '/api/v1/utils/health-check/'
         });
     }
+    
+    /**
+     * Backend Health
+     * Redis / R2 / Modal connection status (ok, unavailable, not_configured).
+     * @returns unknown Successful Response
+     * @throws ApiError
+     */
+    public static backendHealth(): CancelablePromise<UtilsBackendHealthResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/utils/backend-health/'
+        });
+    }
+    
+    /**
+     * Password Hash Stats
+     * Password hashing latency and load-shedding counters (per worker process).
+     * @returns unknown Successful Response
+     * @throws ApiError
+     */
+    public static passwordHashStats(): CancelablePromise<UtilsPasswordHashStatsResponse> {
+        return __request(OpenAPI, {
+            method: 'GET',
+            url: '/api/v1/utils/password-hash-stats/'
+        });
+    }
 }
\ No newline at end of file
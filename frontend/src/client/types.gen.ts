@@ -4,6 +4,10 @@ export type Body_files_create_file = {
     file: (Blob | File);
 };
 
+export type Body_files_create_file_batch = {
+    files: Array<(Blob | File)>;
+};
+
 export type Body_login_login_access_token = {
     grant_type?: (string | null);
     username: string;
@@ -35,11 +39,65 @@ export type FilePublic = {
     id: string;
     owner_id: string;
     created_at: string;
+    status: FileStatus;
+    error?: (string | null);
+};
+
+export type FileSearchResult = {
+    id: string;
+    filename: string;
+    created_at: string;
+    snippet: string;
+    score: number;
+};
+
+export type FileSearchResults = {
+    data: Array<FileSearchResult>;
+};
+
+export type FileStatus = 'pending' | 'processing' | 'done' | 'failed';
+
+export type FileStatusPublic = {
+    id: string;
+    status: FileStatus;
+    error?: (string | null);
+};
+
+export type FileSummary = {
+    id: string;
+    filename: string;
+    file_url?: (string | null);
+    owner_id: string;
+    created_at: string;
+    status: FileStatus;
+    error?: (string | null);
+    text_preview?: (string | null);
+    text_length?: number;
+};
+
+export type FileUploadComplete = {
+    object_key: string;
+};
+
+export type FileUploadPublic = {
+    url: string;
+    headers: {
+        [key: string]: (string);
+    };
+    object_key: string;
+    expires_in: number;
+};
+
+export type FileUploadRequest = {
+    filename: string;
+    content_type: string;
+    size: number;
 };
 
 export type FilesPublic = {
-    data: Array<FilePublic>;
+    data: Array<FileSummary>;
     count: number;
+    next_cursor?: (string | null);
 };
 
 export type HTTPValidationError = {
@@ -158,12 +216,50 @@ export type FilesCreateFileData = {
 export type FilesCreateFileResponse = (FilePublic);
 
 export type FilesReadFilesData = {
+    cursor?: (string | null);
     limit?: number;
     skip?: number;
 };
 
 export type FilesReadFilesResponse = (FilesPublic);
 
+export type FilesCreateFileBatchData = {
+    formData: Body_files_create_file_batch;
+};
+
+export type FilesCreateFileBatchResponse = (FilePublic);
+
+export type FilesCreateFileUploadData = {
+    requestBody: FileUploadRequest;
+};
+
+export type FilesCreateFileUploadResponse = (FileUploadPublic);
+
+export type FilesCompleteFileUploadData = {
+    requestBody: FileUploadComplete;
+};
+
+export type FilesCompleteFileUploadResponse = (FilePublic);
+
+export type FilesReadFileStatusData = {
+    id: string;
+};
+
+export type FilesReadFileStatusResponse = (FileStatusPublic);
+
+export type FilesSearchFilesData = {
+    limit?: number;
+    q: string;
+};
+
+export type FilesSearchFilesResponse = (FileSearchResults);
+
+export type FilesReadFileData = {
+    id: string;
+};
+
+export type FilesReadFileResponse = (FilePublic);
+
 export type FilesDeleteFileData = {
     id: string;
 };
@@ -268,4 +364,20 @@ export type UtilsTestEmailData = {
 
 export type UtilsTestEmailResponse = (Message);
 
-export type UtilsHealthCheckResponse = (boolean);
\ No newline at end of file
+export type UtilsCacheStatsResponse = ({
+    [key: string]: ({
+        [key: string]: unknown;
+    });
+});
+
+export type UtilsHealthCheckResponse = (boolean);
+
+export type UtilsBackendHealthResponse = ({
+    [key: string]: ({
+        [key: string]: unknown;
+    });
+});
+
+export type UtilsPasswordHashStatsResponse = ({
+    [key: string]: unknown;
+});
\ No newline at end of file
@@ -5,7 +5,7 @@ import { useState } from "react"
 import { FiFile, FiImage, FiVideo } from "react-icons/fi"
 
 import useAuth from "@/hooks/useAuth"
-import { FilesService, type FilePublic } from "@/client"
+import { FilesService, type FileSummary } from "@/client"
 import {
   DialogBackdrop,
   DialogBody,
@@ -24,7 +24,7 @@ type FileType = "text" | "image" | "video"
 
 function Dashboard() {
   const { user: currentUser } = useAuth()
-  const [selectedFile, setSelectedFile] = useState<FilePublic | null>(null)
+  const [selectedFile, setSelectedFile] = useState<FileSummary | null>(null)
   const [isModalOpen, setIsModalOpen] = useState(false)
 
   const { data: filesData, isLoading, error } = useQuery({
@@ -32,6 +32,13 @@ function Dashboard() {
     queryFn: () => FilesService.readFiles({ limit: 3 }),
   })
 
+  // 목록에는 미리보기만 오므로 모달을 열 때 전체 텍스트를 따로 불러옴
+  const { data: selectedFileDetail, isLoading: isDetailLoading } = useQuery({
+    queryKey: ["files", selectedFile?.id],
+    queryFn: () => FilesService.readFile({ id: selectedFile!.id }),
+    enabled: !!selectedFile,
+  })
+
   const files = filesData?.data || []
 
   const getFileType = (filename: string): FileType => {
@@ -71,7 +78,7 @@ function Dashboard() {
     return text.length > maxLength ? text.slice(0, maxLength) + "..." : text
   }
 
-  const handleFileClick = (file: FilePublic) => {
+  const handleFileClick = (file: FileSummary) => {
     // 모든 파일을 모달로 표시
     setSelectedFile(file)
     setIsModalOpen(true)
@@ -116,7 +123,7 @@ function Dashboard() {
 
         {!isLoading && !error && files.length > 0 && (
           <SimpleGrid columns={{ base: 1, md: 2, lg: 3 }} gap={6}>
-            {files.map((file: FilePublic) => {
+            {files.map((file: FileSummary) => {
               const fileType = getFileType(file.filename)
               const FileIcon = getFileIcon(fileType)
 
@@ -149,7 +156,7 @@ function Dashboard() {
                       color="gray.600"
                       lineClamp={3}
                     >
-                      {truncateText(file.extracted_text, 150)}
+                      {truncateText(file.text_preview, 150)}
                     </Text>
                   </Card.Body>
                 </Card.Root>
@@ -169,9 +176,15 @@ function Dashboard() {
           <DialogCloseTrigger />
           <DialogBody maxH="70vh" overflowY="auto">
             <Box>
-              <Text whiteSpace="pre-wrap" fontSize="sm" mb={4}>
-                {selectedFile?.extracted_text || "텍스트를 불러올 수 없습니다."}
-              </Text>
+              {isDetailLoading ? (
+                <Center py={6}>
+                  <Spinner />
+                </Center>
+              ) : (
+                <Text whiteSpace="pre-wrap" fontSize="sm" mb={4}>
+                  {selectedFileDetail?.extracted_text || "텍스트를 불러올 수 없습니다."}
+                </Text>
+              )}
 
               {selectedFile?.file_url && (
                 <Button